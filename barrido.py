@@ -0,0 +1,168 @@
+# barrido.py
+"""Barrido de parámetros en paralelo: (carga, algoritmo, quantum) sobre un pool de procesos.
+
+Ejemplo:
+    python barrido.py cargas/*.csv --algoritmo todos --quantums 1 2 4 8 16 --salida tabla.csv
+"""
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from simulador import Simulador, MODOS_COLAS
+from cache import CacheSimulaciones
+from cargas import leer_columnas
+from politicas import obtener_politica, nombres_politicas
+from cli import resolver_algoritmos, agregar_argumentos_costos, costos_de_argumentos
+
+COLUMNAS_RESULTADOS = ("carga", "algoritmo", "quantum", "nucleos", "procesos", "retorno_promedio", "espera_promedio",
+                       "indice_servicio_promedio", "makespan", "rendimiento", "utilizacion", "espera_desviacion",
+                       "espera_p95", "espera_p99", "retorno_p99", "cambios", "tiempo_cambios")
+
+# Estado de cada proceso trabajador: las cargas se reciben una sola vez al crear el trabajador
+_cargas_trabajador = None
+_simuladores_trabajador = {}
+# Caché compartida por los simuladores del trabajador: las cargas repetidas se simulan una sola vez
+_cache_trabajador = None
+
+def _inicializar_trabajador(cargas, directorio_cache=None):
+    global _cargas_trabajador, _cache_trabajador
+    _cargas_trabajador = cargas
+    _simuladores_trabajador.clear()
+    _cache_trabajador = CacheSimulaciones(directorio=directorio_cache)
+
+def _simulador_de_carga(indice_carga):
+    simulador = _simuladores_trabajador.get(indice_carga)
+    if simulador is None:
+        simulador = Simulador(cache=_cache_trabajador)
+        simulador.agregar_procesos(_cargas_trabajador[indice_carga][1])
+        _simuladores_trabajador[indice_carga] = simulador
+    return simulador
+
+def _ejecutar_trabajo(trabajo):
+    indice_carga, algoritmo, quantum, nucleos, colas, costos = trabajo
+    simulador = _simulador_de_carga(indice_carga)
+    simulador.ejecutar(algoritmo, quantum, nucleos, colas, costos)
+    promedio_retorno, promedio_espera, promedio_indice_servicio = simulador.calcular_metricas()
+    sistema = simulador.metricas_sistema()
+    acumulador = simulador.acumulador
+    return {
+        "carga": _cargas_trabajador[indice_carga][0],
+        "algoritmo": algoritmo,
+        "quantum": quantum,
+        "nucleos": nucleos,
+        "procesos": len(acumulador),
+        "retorno_promedio": promedio_retorno,
+        "espera_promedio": promedio_espera,
+        "indice_servicio_promedio": promedio_indice_servicio,
+        "makespan": sistema.makespan,
+        "rendimiento": sistema.rendimiento,
+        "utilizacion": sistema.utilizacion,
+        "espera_desviacion": acumulador.espera.desviacion(),
+        "espera_p95": acumulador.espera.percentil(95),
+        "espera_p99": acumulador.espera.percentil(99),
+        "retorno_p99": acumulador.retorno.percentil(99),
+        "cambios": sistema.cambios,
+        "tiempo_cambios": sistema.tiempo_cambios,
+    }
+
+def generar_trabajos(num_cargas, algoritmos, quantums, nucleos=(1,), colas="global", costos=None):
+    """El quantum solo afecta a las políticas que lo usan; el resto se ejecuta una vez por carga y número de núcleos."""
+    trabajos = []
+    quantums = list(dict.fromkeys(quantums)) # Sin quantums repetidos
+    for indice_carga in range(num_cargas):
+        for num_nucleos in dict.fromkeys(nucleos):
+            for algoritmo in algoritmos:
+                if obtener_politica(algoritmo).usa_quantum:
+                    trabajos.extend((indice_carga, algoritmo, quantum, num_nucleos, colas, costos) for quantum in quantums)
+                else:
+                    trabajos.append((indice_carga, algoritmo, None, num_nucleos, colas, costos))
+    return trabajos
+
+def barrer(cargas, algoritmos=nombres_politicas(), quantums=(4,), max_trabajadores=None, directorio_cache=None,
+           nucleos=(1,), colas="global", costos=None):
+    """Ejecuta todas las combinaciones (carga, algoritmo, quantum) y devuelve la tabla de resultados.
+
+    `cargas` es una lista de pares (nombre_carga, [(nombre, tiempo_cpu, instante_llegada[, prioridad]), ...]).
+    Las filas se devuelven en el mismo orden en que se generan los trabajos. Con `directorio_cache`, los
+    resultados se guardan en disco y los barridos posteriores reutilizan las combinaciones ya simuladas.
+    `costos` (CostosCambio) se aplica a todas las combinaciones, p. ej. para elegir el quantum con sobrecarga.
+    """
+    cargas = [(nombre, list(procesos)) for nombre, procesos in cargas]
+    trabajos = generar_trabajos(len(cargas), list(algoritmos), list(quantums), list(nucleos), colas, costos)
+    if not trabajos:
+        return []
+
+    max_trabajadores = max_trabajadores or os.cpu_count() or 1
+    if max_trabajadores == 1:
+        _inicializar_trabajador(cargas, directorio_cache)
+        return [_ejecutar_trabajo(trabajo) for trabajo in trabajos]
+
+    # Lotes de trabajos por envío para amortizar la comunicación entre procesos
+    tamano_lote = max(1, len(trabajos) // (max_trabajadores * 4))
+    with ProcessPoolExecutor(max_workers=max_trabajadores, initializer=_inicializar_trabajador, initargs=(cargas, directorio_cache)) as pool:
+        return list(pool.map(_ejecutar_trabajo, trabajos, chunksize=tamano_lote))
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Barrido de algoritmos y quantums sobre varias cargas en paralelo.")
+    parser.add_argument("cargas", nargs="+",
+                        help="Archivos CSV o JSONL con los campos nombre, cpu, llegada y, opcionalmente, prioridad.")
+    parser.add_argument("-a", "--algoritmo", default="todos",
+                        help=f"{', '.join(nombres_politicas())}, RR, PRIO o 'todos' (por defecto: todos).")
+    parser.add_argument("-q", "--quantums", type=int, nargs="+", default=[4],
+                        help="Valores de quantum para Round Robin y MLFQ (por defecto: 4).")
+    parser.add_argument("-n", "--nucleos", type=int, nargs="+", default=[1],
+                        help="Números de núcleos simulados a comparar (por defecto: 1).")
+    parser.add_argument("--colas", choices=MODOS_COLAS, default="global",
+                        help="Con varios núcleos: cola global o una por núcleo, con o sin robo de trabajo.")
+    agregar_argumentos_costos(parser)
+    parser.add_argument("-j", "--trabajadores", type=int, default=None,
+                        help="Procesos del pool (por defecto: número de núcleos).")
+    parser.add_argument("-o", "--salida", help="Archivo de resultados (por defecto: salida estándar).")
+    parser.add_argument("--cache", help="Directorio de la caché de simulaciones, que se conserva entre ejecuciones.")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if any(q <= 0 for q in args.quantums):
+            raise ValueError("El quantum debe ser positivo.")
+        if any(n <= 0 for n in args.nucleos):
+            raise ValueError("El número de núcleos debe ser positivo.")
+        if args.trabajadores is not None and args.trabajadores <= 0:
+            raise ValueError("El número de trabajadores debe ser positivo.")
+        costos = costos_de_argumentos(args)
+        multinucleo = any(n > 1 for n in args.nucleos) or any(costos)
+        algoritmos = resolver_algoritmos(args.algoritmo, multinucleo)
+        if multinucleo and not all(obtener_politica(algoritmo).multinucleo for algoritmo in algoritmos):
+            raise ValueError(f"{args.algoritmo} solo se simula con un núcleo y sin costos de cambio.")
+        # Filas (nombre, cpu, llegada, prioridad): las columnas de la carga traspuestas
+        cargas = [(ruta, list(zip(*leer_columnas(ruta)))) for ruta in args.cargas]
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    resultados = barrer(cargas, algoritmos, args.quantums, args.trabajadores, args.cache, args.nucleos, args.colas,
+                        costos)
+
+    salida = open(args.salida, "w", newline="", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        escritor = csv.DictWriter(salida, fieldnames=COLUMNAS_RESULTADOS)
+        escritor.writeheader()
+        for fila in resultados:
+            escritor.writerow({**fila,
+                               "quantum": "" if fila["quantum"] is None else fila["quantum"],
+                               "retorno_promedio": f"{fila['retorno_promedio']:.4f}",
+                               "espera_promedio": f"{fila['espera_promedio']:.4f}",
+                               "indice_servicio_promedio": f"{fila['indice_servicio_promedio']:.4f}",
+                               "rendimiento": f"{fila['rendimiento']:.4f}",
+                               "utilizacion": f"{fila['utilizacion']:.4f}"})
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+# benchmark.py
+"""Banco de pruebas de escalabilidad de las políticas de planificación registradas.
+
+Ejemplo:
+    python benchmark.py --tamanos 100 1000 10000 --salida resultados.json
+    python benchmark.py --tamanos 100 1000 10000 --comparar resultados_anteriores.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from simulador import Simulador
+from politicas import obtener_politica, nombres_politicas
+from cargas import generar_carga, DISTRIBUCIONES
+from instrumentacion import Instrumentacion
+
+TAMANOS_POR_DEFECTO = (10**2, 10**3, 10**4, 10**5, 10**6)
+
+def medir(simulador, algoritmo, quantum, repeticiones=1, medir_memoria=True, contar=False):
+    """Mejor tiempo de pared entre las repeticiones y, aparte, el pico de memoria de una ejecución.
+
+    Con `contar`, una ejecución instrumentada más añade los contadores y los segundos por fase.
+    """
+    mejor_tiempo = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        simulador.ejecutar(algoritmo, quantum)
+        mejor_tiempo = min(mejor_tiempo, time.perf_counter() - inicio)
+
+    memoria_pico = None
+    if medir_memoria:
+        # Ejecución separada: tracemalloc ralentiza la asignación y falsearía el tiempo
+        tracemalloc.start()
+        simulador.ejecutar(algoritmo, quantum)
+        memoria_pico = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    fila = {
+        "segundos": mejor_tiempo,
+        "memoria_pico_bytes": memoria_pico,
+        "tramos_linea_tiempo": len(simulador.historial_ejecucion_visual),
+    }
+    if contar:
+        simulador.instrumentacion = instrumentacion = Instrumentacion()
+        try:
+            simulador.ejecutar(algoritmo, quantum)
+        finally:
+            simulador.instrumentacion = None
+        fila["contadores"] = dict(instrumentacion.contadores)
+        fila["segundos_fase"] = dict(instrumentacion.tiempos)
+    return fila
+
+def ejecutar_banco(tamanos, distribuciones, algoritmos, quantum=4, semilla=0, repeticiones=1, medir_memoria=True, progreso=None,
+                   contar=False):
+    resultados = []
+    for distribucion in distribuciones:
+        for num_procesos in tamanos:
+            simulador = Simulador()
+            simulador.agregar_procesos(generar_carga(num_procesos, distribucion, semilla))
+            for algoritmo in algoritmos:
+                fila = {
+                    "distribucion": distribucion,
+                    "procesos": num_procesos,
+                    "algoritmo": algoritmo,
+                    "quantum": quantum if obtener_politica(algoritmo).usa_quantum else None,
+                }
+                fila.update(medir(simulador, algoritmo, quantum, repeticiones, medir_memoria, contar))
+                resultados.append(fila)
+                if progreso:
+                    progreso(fila)
+    return resultados
+
+def _clave(fila):
+    return (fila["distribucion"], fila["procesos"], fila["algoritmo"], fila["quantum"])
+
+def comparar(resultados, referencia, tolerancia):
+    """Devuelve las filas cuyo tiempo supera al de la referencia en más de `tolerancia` (fracción)."""
+    anteriores = {_clave(fila): fila for fila in referencia}
+    regresiones = []
+    for fila in resultados:
+        anterior = anteriores.get(_clave(fila))
+        if anterior and anterior["segundos"] > 0:
+            razon = fila["segundos"] / anterior["segundos"]
+            if razon > 1 + tolerancia:
+                regresiones.append((fila, razon))
+    return regresiones
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Mide cómo escalan los algoritmos de planificación.")
+    parser.add_argument("-n", "--tamanos", type=int, nargs="+", default=list(TAMANOS_POR_DEFECTO),
+                        help="Número de procesos de cada carga (por defecto: 10^2 a 10^6).")
+    parser.add_argument("-d", "--distribuciones", nargs="+", choices=DISTRIBUCIONES, default=list(DISTRIBUCIONES))
+    parser.add_argument("-a", "--algoritmos", nargs="+", choices=nombres_politicas(), default=list(nombres_politicas()))
+    parser.add_argument("-q", "--quantum", type=int, default=4, help="Quantum para Round Robin y MLFQ (por defecto: 4).")
+    parser.add_argument("-s", "--semilla", type=int, default=0)
+    parser.add_argument("-r", "--repeticiones", type=int, default=1, help="Se informa el mejor tiempo.")
+    parser.add_argument("--sin-memoria", action="store_true", help="No mide el pico de memoria con tracemalloc.")
+    parser.add_argument("--contadores", action="store_true",
+                        help="Añade los contadores de planificación y los segundos por fase de una ejecución instrumentada.")
+    parser.add_argument("-o", "--salida", help="Archivo JSON de resultados (por defecto: salida estándar).")
+    parser.add_argument("--comparar", help="JSON de una ejecución anterior con el que comparar los tiempos.")
+    parser.add_argument("--tolerancia", type=float, default=0.2,
+                        help="Fracción de empeoramiento tolerada al comparar (por defecto: 0.2).")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.quantum <= 0 or args.repeticiones <= 0 or any(n <= 0 for n in args.tamanos):
+        parser.error("El quantum, las repeticiones y los tamaños deben ser positivos.")
+
+    def progreso(fila):
+        print(f"{fila['distribucion']:>13} {fila['procesos']:>8} {fila['algoritmo']:>12}: "
+              f"{fila['segundos']:.4f} s, {fila['tramos_linea_tiempo']} tramos", file=sys.stderr)
+
+    resultados = ejecutar_banco(args.tamanos, args.distribuciones, args.algoritmos, args.quantum,
+                                args.semilla, args.repeticiones, not args.sin_memoria, progreso, args.contadores)
+    informe = {
+        "metadatos": {
+            "fecha": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plataforma": platform.platform(),
+            "semilla": args.semilla,
+            "repeticiones": args.repeticiones,
+        },
+        "resultados": resultados,
+    }
+
+    texto = json.dumps(informe, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            referencia = json.load(archivo)["resultados"]
+        regresiones = comparar(resultados, referencia, args.tolerancia)
+        for fila, razon in regresiones:
+            print(f"REGRESIÓN {fila['distribucion']} {fila['procesos']} {fila['algoritmo']}: x{razon:.2f}", file=sys.stderr)
+        if regresiones:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# cache.py
+"""Memoización de simulaciones por huella de la carga, algoritmo y quantum.
+
+Los resultados se guardan en una caché LRU acotada en memoria y, opcionalmente, en un directorio
+que sobrevive a los reinicios (un archivo binario por simulación).
+"""
+import hashlib
+import os
+import struct
+from array import array
+from collections import OrderedDict, namedtuple
+
+from politicas import POLITICAS
+
+# Se incrementa cuando cambia el resultado de los algoritmos para invalidar las cachés en disco
+VERSION_CACHE = 6
+CABECERA = b"SIMC"
+_FORMATO_LONGITUDES = "<9q"
+
+# Columnas de una simulación terminada: historial de índices, tramos de las líneas de tiempo de todos los
+# núcleos concatenadas (`tramos_nucleo` indica cuántos son de cada núcleo), columnas mutables de la tabla
+# de procesos y el número de migraciones (un solo elemento)
+ResultadoCache = namedtuple("ResultadoCache", ["historial", "inicios", "fines", "pids", "tramos_nucleo",
+                                               "restante", "inicio", "finalizacion", "migraciones"])
+
+def clave_simulacion(tabla, algoritmo, quantum=None, nucleos=1, colas="global", costos=(0, 0, 0)):
+    """Clave de caché: huella de la carga más los parámetros que afectan al resultado, incluidos los de la
+    política (Politica.parametros).
+
+    `costos` son los costos de cambio de contexto, despacho y migración (ver simulador.CostosCambio).
+    """
+    politica = POLITICAS.get(algoritmo)
+    if politica is None or not politica.usa_quantum:
+        quantum = None # El quantum solo cambia el resultado de las políticas que lo usan (Round Robin, MLFQ)
+    if nucleos == 1:
+        colas = "global" # Con un núcleo todas las disposiciones de colas son equivalentes
+    # Parámetros propios de la política (niveles de MLFQ, intervalo de envejecimiento...)
+    parametros = ",".join(f"{nombre}={valor}" for nombre, valor in sorted(politica.parametros().items())
+                          ) if politica is not None else ""
+    texto = (f"{VERSION_CACHE}|{tabla.huella()}|{algoritmo}|{parametros}|{quantum}|{nucleos}|{colas}|"
+             f"{','.join(map(str, costos))}")
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+class CacheSimulaciones:
+    """Caché LRU de resultados con `capacidad` entradas en memoria y almacén en disco opcional."""
+
+    def __init__(self, capacidad=32, directorio=None):
+        if capacidad <= 0:
+            raise ValueError("La capacidad de la caché debe ser positiva.")
+        self.capacidad = capacidad
+        self.directorio = directorio
+        self.aciertos = 0
+        self.fallos = 0
+        self._entradas = OrderedDict()
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, clave):
+        return clave in self._entradas or (self.directorio is not None and os.path.exists(self._ruta(clave)))
+
+    def obtener(self, clave):
+        """Devuelve el ResultadoCache de la clave o None; un acierto en disco se sube a memoria."""
+        resultado = self._entradas.get(clave)
+        if resultado is not None:
+            self._entradas.move_to_end(clave)
+        elif self.directorio:
+            resultado = self._leer(clave)
+            if resultado is not None:
+                self._recordar(clave, resultado)
+        if resultado is None:
+            self.fallos += 1
+        else:
+            self.aciertos += 1
+        return resultado
+
+    def guardar(self, clave, resultado):
+        self._recordar(clave, resultado)
+        if self.directorio:
+            self._escribir(clave, resultado)
+
+    def limpiar(self):
+        """Vacía la memoria (el almacén en disco se conserva)."""
+        self._entradas.clear()
+
+    def _recordar(self, clave, resultado):
+        self._entradas[clave] = resultado
+        self._entradas.move_to_end(clave)
+        while len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+
+    # ------------------ ALMACÉN EN DISCO ------------------
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave + ".simc")
+
+    def _escribir(self, clave, resultado):
+        ruta = self._ruta(clave)
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "wb") as archivo:
+            archivo.write(CABECERA)
+            archivo.write(struct.pack(_FORMATO_LONGITUDES, *(len(columna) for columna in resultado)))
+            for columna in resultado:
+                columna.tofile(archivo)
+        # El reemplazo atómico evita que otro proceso lea un archivo a medio escribir
+        os.replace(temporal, ruta)
+
+    def _leer(self, clave):
+        try:
+            with open(self._ruta(clave), "rb") as archivo:
+                if archivo.read(len(CABECERA)) != CABECERA:
+                    return None
+                longitudes = struct.unpack(_FORMATO_LONGITUDES, archivo.read(struct.calcsize(_FORMATO_LONGITUDES)))
+                columnas = []
+                for longitud in longitudes:
+                    columna = array('q')
+                    columna.fromfile(archivo, longitud)
+                    columnas.append(columna)
+        except (OSError, EOFError, struct.error):
+            # Un archivo ausente, truncado o corrupto se trata como un fallo de caché
+            return None
+        return ResultadoCache(*columnas)
@@ -0,0 +1,206 @@
+# cargas.py
+import csv
+import io
+import json
+import os
+import random
+import sys
+from array import array
+
+from trazas_linux import leer_traza_sched, leer_columnas_sched
+
+# Nombres de columna aceptados para cada campo (CSV con cabecera o claves JSON)
+CAMPOS_NOMBRE = ("nombre", "name")
+CAMPOS_CPU = ("cpu", "tiempo_cpu", "burst")
+CAMPOS_LLEGADA = ("llegada", "instante_llegada", "arrival")
+# Campo opcional: sin él, los procesos tienen prioridad 0
+CAMPOS_PRIORIDAD = ("prioridad", "priority")
+
+def _campo(registro, alternativas, numero_linea):
+    for clave in alternativas:
+        if clave in registro and registro[clave] not in (None, ""):
+            return registro[clave]
+    raise ValueError(f"Línea {numero_linea}: falta el campo '{alternativas[0]}'.")
+
+def _validar(registro, numero_linea):
+    nombre = str(_campo(registro, CAMPOS_NOMBRE, numero_linea)).strip()
+    tiempo_cpu = _campo(registro, CAMPOS_CPU, numero_linea)
+    instante_llegada = _campo(registro, CAMPOS_LLEGADA, numero_linea)
+    try:
+        tiempo_cpu = int(tiempo_cpu)
+        instante_llegada = int(instante_llegada)
+    except (TypeError, ValueError):
+        raise ValueError(f"Línea {numero_linea}: tiempo de CPU y llegada deben ser enteros.") from None
+
+    if not nombre or tiempo_cpu <= 0 or instante_llegada < 0:
+        raise ValueError(f"Línea {numero_linea}: datos no válidos (nombre vacío, CPU <= 0 o llegada < 0).")
+    return nombre, tiempo_cpu, instante_llegada
+
+def _prioridad(registro, numero_linea):
+    for clave in CAMPOS_PRIORIDAD:
+        if clave in registro and registro[clave] not in (None, ""):
+            try:
+                return int(registro[clave])
+            except (TypeError, ValueError):
+                raise ValueError(f"Línea {numero_linea}: la prioridad debe ser un entero.") from None
+    return 0
+
+def detectar_formato(ruta):
+    extension = os.path.splitext(ruta)[1].lower()
+    return "jsonl" if extension in (".jsonl", ".ndjson") else "csv"
+
+def leer_carga(ruta, formato=None):
+    """Lee una carga de trabajo en streaming y produce tuplas (nombre, tiempo_cpu, instante_llegada).
+
+    Acepta CSV con cabecera, JSONL (un objeto por línea) o, con formato "sched", una traza de texto del
+    planificador de Linux (ver trazas_linux.py). El archivo nunca se carga entero en memoria.
+    Con ruta "-" se lee la entrada estándar (CSV salvo que se indique otro formato).
+    """
+    if formato == "sched":
+        for nombre, tiempo_cpu, instante_llegada, _ in leer_traza_sched(ruta):
+            yield nombre, tiempo_cpu, instante_llegada
+        return
+    for registro, numero_linea in _registros(ruta, formato):
+        yield _validar(registro, numero_linea)
+
+def _registros(ruta, formato=None):
+    """Registros sin validar (diccionarios) con su número de línea."""
+    formato = formato or detectar_formato(ruta)
+    if ruta == "-":
+        yield from _leer_registros(sys.stdin, formato)
+        return
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        yield from _leer_registros(archivo, formato)
+
+def _leer_registros(archivo, formato):
+    if formato == "jsonl":
+        for numero_linea, linea in enumerate(archivo, start=1):
+            if not linea.strip():
+                continue
+            try:
+                registro = json.loads(linea)
+            except json.JSONDecodeError:
+                raise ValueError(f"Línea {numero_linea}: JSON no válido.") from None
+            yield registro, numero_linea
+    elif formato == "csv":
+        lector = csv.DictReader(archivo)
+        for registro in lector:
+            yield registro, lector.line_num
+    else:
+        raise ValueError(f"Formato de carga desconocido: {formato}")
+
+def leer_columnas(ruta, formato=None):
+    """Lee una carga entera como columnas (nombres, tiempos_cpu, instantes_llegada, prioridades) para la ingesta en bloque.
+
+    Un CSV simple (sin comillas y con el mismo número de campos en cada línea) se trocea de una vez sobre el
+    texto completo; cualquier otro caso, o un valor no entero, se valida registro a registro para indicar la línea
+    del error. Los valores de CPU y llegada se validan después en bloque (ver TablaProcesos.extender).
+    Las trazas del planificador (formato "sched") se leen en una pasada con trazas_linux.leer_columnas_sched.
+    """
+    formato = formato or detectar_formato(ruta)
+    if formato == "sched":
+        return leer_columnas_sched(ruta)
+    if formato == "csv":
+        if ruta == "-":
+            texto = sys.stdin.read()
+        else:
+            with open(ruta, encoding="utf-8") as archivo:
+                texto = archivo.read()
+        columnas = _trocear_csv_simple(texto)
+        if columnas is not None:
+            return columnas
+        registros = _registros_csv(texto)
+    else:
+        registros = _registros(ruta, formato)
+
+    nombres, tiempos_cpu, instantes_llegada, prioridades = [], array('q'), array('q'), array('q')
+    for registro, numero_linea in registros:
+        nombre, tiempo_cpu, instante_llegada = _validar(registro, numero_linea)
+        nombres.append(nombre)
+        tiempos_cpu.append(tiempo_cpu)
+        instantes_llegada.append(instante_llegada)
+        prioridades.append(_prioridad(registro, numero_linea))
+    return nombres, tiempos_cpu, instantes_llegada, prioridades
+
+def _registros_csv(texto):
+    lector = csv.DictReader(io.StringIO(texto, newline=""))
+    for registro in lector:
+        yield registro, lector.line_num
+
+def _trocear_csv_simple(texto):
+    if "\r" in texto:
+        texto = texto.replace("\r\n", "\n")
+    cabecera, _, cuerpo = texto.partition("\n")
+    cuerpo = cuerpo.rstrip("\n")
+    campos_cabecera = [campo.strip() for campo in cabecera.split(",")]
+    posiciones = []
+    for alternativas in (CAMPOS_NOMBRE, CAMPOS_CPU, CAMPOS_LLEGADA):
+        posicion = next((campos_cabecera.index(clave) for clave in alternativas if clave in campos_cabecera), None)
+        if posicion is None:
+            return None
+        posiciones.append(posicion)
+    posicion_prioridad = next((campos_cabecera.index(clave) for clave in CAMPOS_PRIORIDAD if clave in campos_cabecera), None)
+    num_campos = len(campos_cabecera)
+    if not cuerpo or '"' in cuerpo or cuerpo.count(",") != (num_campos - 1) * (cuerpo.count("\n") + 1):
+        return None
+
+    # Todas las líneas a la vez: los campos de cada columna quedan a intervalos de num_campos
+    campos = cuerpo.replace("\n", ",").split(",")
+    posicion_nombre, posicion_cpu, posicion_llegada = posiciones
+    try:
+        tiempos_cpu = array('q', map(int, campos[posicion_cpu::num_campos]))
+        instantes_llegada = array('q', map(int, campos[posicion_llegada::num_campos]))
+        if posicion_prioridad is None:
+            prioridades = array('q', [0]) * len(tiempos_cpu)
+        else:
+            prioridades = array('q', map(int, campos[posicion_prioridad::num_campos]))
+    except ValueError:
+        return None
+    nombres = campos[posicion_nombre::num_campos]
+    if " " in cuerpo or "\t" in cuerpo:
+        nombres = [nombre.strip() for nombre in nombres]
+    return nombres, tiempos_cpu, instantes_llegada, prioridades
+
+# ------------------ GENERADOR DE CARGAS SINTÉTICAS ------------------
+
+DISTRIBUCIONES = ("poisson", "cola_pesada", "rafagas", "llegada_cero")
+PROCESOS_POR_RAFAGA = 20
+
+def generar_carga(num_procesos, distribucion="poisson", semilla=0, cpu_media=10, utilizacion=0.9):
+    """Genera una carga sintética reproducible como tuplas (nombre, tiempo_cpu, instante_llegada).
+
+    - poisson: llegadas de Poisson y ráfagas exponenciales.
+    - cola_pesada: llegadas de Poisson y ráfagas de Pareto (pocas muy largas).
+    - rafagas: grupos de 20 llegadas casi simultáneas separados por huecos de inactividad.
+    - llegada_cero: todos los procesos llegan en t=0.
+
+    `utilizacion` fija la tasa de llegada para que la CPU esté ocupada esa fracción del tiempo.
+    """
+    if distribucion not in DISTRIBUCIONES:
+        raise ValueError(f"Distribución desconocida: {distribucion}")
+    aleatorio = random.Random(semilla)
+    entre_llegadas_media = cpu_media / utilizacion
+    dentro_rafaga_media = entre_llegadas_media / PROCESOS_POR_RAFAGA
+    hueco_media = PROCESOS_POR_RAFAGA * entre_llegadas_media - (PROCESOS_POR_RAFAGA - 1) * dentro_rafaga_media
+    instante_llegada = 0.0
+
+    for i in range(num_procesos):
+        if distribucion == "cola_pesada":
+            # Pareto con alfa = 1.5 y media cpu_media
+            tiempo_cpu = cpu_media / 3 * aleatorio.paretovariate(1.5)
+        else:
+            tiempo_cpu = aleatorio.expovariate(1 / cpu_media)
+
+        if distribucion == "llegada_cero":
+            instante_llegada = 0.0
+        elif distribucion == "rafagas":
+            # Grupos de 20 procesos muy seguidos y, entre grupos, un hueco que completa la media: las 20 llegadas de
+            # un grupo ocupan en promedio 20 * entre_llegadas_media, como en las demás distribuciones
+            if i % PROCESOS_POR_RAFAGA == 0 and i > 0:
+                instante_llegada += aleatorio.expovariate(1 / hueco_media)
+            elif i > 0:
+                instante_llegada += aleatorio.expovariate(1 / dentro_rafaga_media)
+        elif i > 0:
+            instante_llegada += aleatorio.expovariate(1 / entre_llegadas_media)
+
+        yield f"P{i + 1}", max(1, round(tiempo_cpu)), int(instante_llegada)
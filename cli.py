@@ -0,0 +1,195 @@
+# cli.py
+"""Ejecución por lotes del simulador sin interfaz gráfica.
+
+Ejemplo:
+    python cli.py carga.csv --algoritmo SRTF
+    python cli.py carga.jsonl --algoritmo todos --quantum 4 --salida resultados.csv
+    python trazas_linux.py sched.txt --resolucion 1000 | python cli.py - --algoritmo RR --quantum 4
+    python cli.py carga.csv --algoritmo RR --eventos
+    python cli.py carga.csv --algoritmo SRTF --gantt srtf.svg
+"""
+import argparse
+import csv
+import os
+import sys
+
+from simulador import Simulador, ALGORITMOS, MODOS_COLAS, CostosCambio
+from politicas import obtener_politica, nombres_politicas, resolver_nombre
+from cargas import leer_carga
+from cache import CacheSimulaciones
+from eventos import EjecucionIncremental, INACTIVIDAD
+from metricas import PERCENTILES
+from instrumentacion import Instrumentacion
+
+COLUMNAS_PROCESO = ("algoritmo", "pid", "nombre", "llegada", "cpu", "prioridad", "finalizacion", "retorno", "espera",
+                    "indice_servicio")
+COLUMNAS_PROMEDIOS = ("algoritmo", "procesos", "retorno_promedio", "espera_promedio", "indice_servicio_promedio",
+                      "makespan", "rendimiento", "utilizacion", "espera_desviacion", "espera_p50", "espera_p95",
+                      "espera_p99", "retorno_p95", "retorno_p99", "cambios", "tiempo_cambios")
+COLUMNAS_EVENTO = ("tipo", "tiempo", "pid", "nombre")
+
+def resolver_algoritmos(nombre, multinucleo=False):
+    """Políticas del registro que corresponden a `nombre` (o a un alias); con `multinucleo`, 'todos' se limita a
+    las que se simulan con varios núcleos o costos de cambio."""
+    if nombre.lower() == "todos":
+        return [algoritmo for algoritmo in nombres_politicas()
+                if not multinucleo or obtener_politica(algoritmo).multinucleo]
+    return [resolver_nombre(nombre)]
+
+def agregar_argumentos_costos(parser):
+    grupo = parser.add_argument_group("sobrecarga de planificación (en unidades de tiempo)")
+    grupo.add_argument("--costo-cambio", type=int, default=0, help="Cambio de contexto entre dos procesos distintos.")
+    grupo.add_argument("--latencia-despacho", type=int, default=0, help="Latencia de cada despacho de un proceso.")
+    grupo.add_argument("--penalizacion-migracion", type=int, default=0,
+                       help="Calentamiento de caché cuando un proceso cambia de núcleo.")
+
+def costos_de_argumentos(args):
+    costos = CostosCambio(args.costo_cambio, args.latencia_despacho, args.penalizacion_migracion)
+    if any(costo < 0 for costo in costos):
+        raise ValueError("Los costos de cambio de contexto no pueden ser negativos.")
+    return costos
+
+def escribir_procesos(escritor, algoritmo, simulador):
+    for p in simulador.procesos_finalizados():
+        escritor.writerow((algoritmo, p.pid, p.nombre, p.instante_llegada, p.tiempo_cpu_total, p.prioridad,
+                           p.tiempo_finalizacion, p.tiempo_retorno, p.tiempo_espera, f"{p.indice_servicio:.4f}"))
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Simulador de planificación de procesos (modo por lotes).")
+    parser.add_argument("carga", help="Archivo CSV o JSONL con los campos nombre, cpu, llegada y, opcionalmente, "
+                                      "prioridad ('-' para la entrada estándar).")
+    parser.add_argument("-a", "--algoritmo", default="todos",
+                        help=f"{', '.join(nombres_politicas())}, RR, PRIO o 'todos' (por defecto: todos).")
+    parser.add_argument("-q", "--quantum", type=int, default=4,
+                        help="Quantum para Round Robin y el del primer nivel de MLFQ (por defecto: 4).")
+    parser.add_argument("-n", "--nucleos", type=int, default=1, help="Número de núcleos (por defecto: 1).")
+    parser.add_argument("--colas", choices=MODOS_COLAS, default="global",
+                        help="Con varios núcleos: cola global o una por núcleo, con o sin robo de trabajo.")
+    parser.add_argument("-f", "--formato", choices=("csv", "jsonl", "sched"),
+                        help="Formato de la carga; por defecto se deduce de la extensión. 'sched' es una traza de "
+                             "texto de perf sched o ftrace, en microsegundos (ver trazas_linux.py).")
+    parser.add_argument("-o", "--salida", help="Archivo de resultados (por defecto: salida estándar).")
+    parser.add_argument("--solo-promedios", action="store_true",
+                        help="Omite las métricas por proceso y escribe solo los promedios.")
+    parser.add_argument("--cache", help="Directorio de la caché de simulaciones, que se conserva entre ejecuciones.")
+    parser.add_argument("--gantt", help="Guarda los diagramas de Gantt en esta imagen (.png o .svg); con varios "
+                                        "algoritmos se añade el nombre de cada uno al archivo.")
+    parser.add_argument("--guardar-traza", help="Guarda cada simulación en esta traza binaria (.simt) que trazas.py "
+                                                "reabre sin cargarla en memoria; con varios algoritmos, una por algoritmo.")
+    parser.add_argument("--traza", help="Escribe en este archivo una traza de Chrome (JSON) con las fases y los "
+                                        "contadores de planificación de cada algoritmo.")
+    agregar_argumentos_costos(parser)
+    parser.add_argument("--eventos", action="store_true",
+                        help="Escribe los eventos de planificación a medida que ocurren, sin cargar la carga entera "
+                             "(requiere uno de FCFS, SJF, SRTF o Round Robin y una carga ordenada por llegada).")
+    parser.add_argument("--hasta", type=int, help="Con --eventos, se detiene en este instante de simulación.")
+    return parser
+
+def escribir_eventos(salida, algoritmo, quantum, procesos, hasta=None):
+    escritor = csv.writer(salida)
+    escritor.writerow(COLUMNAS_EVENTO)
+    for evento in EjecucionIncremental(algoritmo, quantum, procesos):
+        if hasta is not None and evento.tiempo > hasta:
+            break
+        escritor.writerow((evento.tipo, evento.tiempo, evento.pid, evento.nombre or ""))
+        if evento.tipo == INACTIVIDAD:
+            # La CPU espera a la siguiente llegada, que puede tardar en leerse de un flujo abierto
+            salida.flush()
+
+def ruta_por_algoritmo(ruta, algoritmo, varios):
+    """Con varios algoritmos, 'gantt.png' pasa a 'gantt_FCFS.png', 'gantt_Round_Robin.png', etc."""
+    if not varios:
+        return ruta
+    base, extension = os.path.splitext(ruta)
+    return f"{base}_{algoritmo.replace(' ', '_')}{extension}"
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        if args.nucleos <= 0:
+            raise ValueError("El número de núcleos debe ser positivo.")
+        costos = costos_de_argumentos(args)
+        multinucleo = args.nucleos > 1 or any(costos)
+        algoritmos = resolver_algoritmos(args.algoritmo, multinucleo)
+        if any(obtener_politica(algoritmo).usa_quantum for algoritmo in algoritmos) and args.quantum <= 0:
+            raise ValueError("El quantum debe ser positivo.")
+        if multinucleo and not all(obtener_politica(algoritmo).multinucleo for algoritmo in algoritmos):
+            raise ValueError(f"{args.algoritmo} solo se simula con un núcleo y sin costos de cambio.")
+        if args.gantt and os.path.splitext(args.gantt)[1].lower() not in (".png", ".svg"):
+            raise ValueError("--gantt debe terminar en .png o .svg.")
+        if args.eventos and (len(algoritmos) != 1 or args.nucleos != 1 or any(costos)):
+            raise ValueError("--eventos requiere un único algoritmo, un solo núcleo y sin costos de cambio.")
+        if args.eventos and algoritmos[0] not in ALGORITMOS:
+            # La ejecución incremental solo implementa los algoritmos propios del simulador
+            raise ValueError(f"--eventos solo admite {', '.join(ALGORITMOS)}; {algoritmos[0]} se simula por lotes.")
+        if not args.eventos:
+            # Con --solo-promedios no se guarda el historial (salvo para el Gantt o la traza): las métricas salen del
+            # acumulador en línea
+            simulador = Simulador(cache=CacheSimulaciones(directorio=args.cache) if args.cache else None,
+                                  registrar_historial=not args.solo_promedios or bool(args.gantt or args.guardar_traza),
+                                  instrumentacion=Instrumentacion() if args.traza else None)
+            simulador.cargar_carga(args.carga, args.formato)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if args.eventos:
+        return _main_eventos(parser, args, algoritmos[0])
+
+    salida = open(args.salida, "w", newline="", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        escritor = csv.writer(salida)
+        promedios = []
+        if not args.solo_promedios:
+            escritor.writerow(COLUMNAS_PROCESO)
+        for algoritmo in algoritmos:
+            simulador.ejecutar(algoritmo, args.quantum, args.nucleos, args.colas, costos)
+            if not args.solo_promedios:
+                escribir_procesos(escritor, algoritmo, simulador)
+            if args.gantt:
+                # Matplotlib solo se importa si se pide una imagen
+                from graficos import guardar_gantt
+                guardar_gantt(simulador, ruta_por_algoritmo(args.gantt, algoritmo, len(algoritmos) > 1),
+                              f"Diagrama de Gantt - {algoritmo}")
+            if args.guardar_traza:
+                # NumPy solo hace falta al reabrir la traza, pero el módulo lo importa al cargarse
+                from trazas import guardar_traza
+                guardar_traza(simulador, ruta_por_algoritmo(args.guardar_traza, algoritmo, len(algoritmos) > 1),
+                              algoritmo, args.quantum if obtener_politica(algoritmo).usa_quantum else None)
+            promedio_retorno, promedio_espera, promedio_indice_servicio = simulador.calcular_metricas()
+            sistema = simulador.metricas_sistema()
+            espera, retorno = simulador.acumulador.espera, simulador.acumulador.retorno
+            promedios.append((algoritmo, len(simulador.acumulador), f"{promedio_retorno:.4f}",
+                              f"{promedio_espera:.4f}", f"{promedio_indice_servicio:.4f}",
+                              sistema.makespan, f"{sistema.rendimiento:.4f}", f"{sistema.utilizacion:.4f}",
+                              f"{espera.desviacion():.4f}", *(f"{espera.percentil(q):.2f}" for q in PERCENTILES),
+                              f"{retorno.percentil(95):.2f}", f"{retorno.percentil(99):.2f}",
+                              sistema.cambios, sistema.tiempo_cambios))
+
+        if not args.solo_promedios:
+            salida.write("\n")
+        escritor.writerow(COLUMNAS_PROMEDIOS)
+        escritor.writerows(promedios)
+        if args.traza:
+            simulador.instrumentacion.exportar_chrome(args.traza)
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+def _main_eventos(parser, args, algoritmo):
+    salida = open(args.salida, "w", newline="", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        escribir_eventos(salida, algoritmo, args.quantum, leer_carga(args.carga, args.formato), args.hasta)
+    except (OSError, ValueError) as e:
+        # Los errores de la carga solo aparecen al llegar a la línea afectada
+        if isinstance(e, BrokenPipeError):
+            return 0
+        parser.error(str(e))
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
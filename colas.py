@@ -0,0 +1,249 @@
+# colas.py
+import heapq
+from collections import deque
+from itertools import count
+
+class ColaFIFO:
+    """Cola de listos en orden de llegada (FCFS, Round Robin) con inserción y extracción O(1)."""
+
+    __slots__ = ("_elementos",)
+
+    def __init__(self, elementos=()):
+        self._elementos = deque(elementos)
+
+    def agregar(self, proceso):
+        self._elementos.append(proceso)
+
+    def extender(self, procesos):
+        self._elementos.extend(procesos)
+
+    def extraer(self):
+        return self._elementos.popleft()
+
+    def primero(self):
+        return self._elementos[0]
+
+    def __len__(self):
+        return len(self._elementos)
+
+    def __bool__(self):
+        return bool(self._elementos)
+
+    def __iter__(self):
+        return iter(self._elementos)
+
+    def en_orden_insercion(self):
+        return list(self._elementos)
+
+
+class ColaPrioridad:
+    """Cola de listos sobre un montículo de mínimos con inserción y extracción O(log n).
+
+    `clave` se evalúa al insertar; los empates se resuelven por orden de inserción, igual que
+    un sort estable sobre una lista a la que se van añadiendo los procesos al final.
+    """
+
+    __slots__ = ("_monticulo", "_clave", "_contador")
+
+    def __init__(self, clave):
+        self._monticulo = []
+        self._clave = clave
+        self._contador = count()
+
+    def agregar(self, proceso):
+        heapq.heappush(self._monticulo, (self._clave(proceso), next(self._contador), proceso))
+
+    def extender(self, procesos):
+        for proceso in procesos:
+            self.agregar(proceso)
+
+    def extraer(self):
+        return heapq.heappop(self._monticulo)[2]
+
+    def primero(self):
+        return self._monticulo[0][2]
+
+    def clave_minima(self):
+        return self._monticulo[0][0]
+
+    def __len__(self):
+        return len(self._monticulo)
+
+    def __bool__(self):
+        return bool(self._monticulo)
+
+    def __iter__(self):
+        return (entrada[2] for entrada in self._monticulo)
+
+    def en_orden_insercion(self):
+        """Procesos en el orden en que se insertaron: reinsertarlos así reproduce los mismos desempates."""
+        return [entrada[2] for entrada in sorted(self._monticulo, key=lambda entrada: entrada[1])]
+
+
+class ColaRazonRespuesta:
+    """Cola de HRRN: extrae el proceso con mayor razón de respuesta (espera + CPU) / CPU en un instante dado.
+
+    La razón de cada proceso crece con el tiempo a ritmo 1 / CPU, así que dos procesos se cruzan como mucho una
+    vez. Es un montículo cinético indexado: cada proceso guarda el primer instante entero en que superará a su
+    padre y solo se recoloca cuando el reloj llega a ese instante (re-claveado perezoso), en lugar de recalcular
+    todas las razones en cada despacho. Los procesos con la misma CPU nunca se cruzan, así que esperan en una
+    FIFO por CPU y el montículo solo guarda el primero de cada una. Los empates se resuelven por orden de
+    inserción; los procesos se agregan en orden de llegada y el tiempo de las llamadas no puede retroceder.
+    """
+
+    __slots__ = ("_llegadas", "_cpu", "_grupos", "_total", "_monticulo", "_posicion", "_orden", "_version",
+                 "_eventos", "_contador", "_ahora")
+
+    def __init__(self, llegadas, cpu):
+        self._llegadas = llegadas
+        self._cpu = cpu
+        self._grupos = {} # CPU -> procesos en espera con esa CPU, por orden de llegada
+        self._total = 0
+        self._monticulo = [] # El primero de cada grupo
+        self._posicion = {} # Proceso -> posición en el montículo
+        self._orden = {} # Proceso -> orden de inserción
+        self._version = {} # Proceso -> versión de su certificado vigente
+        self._eventos = [] # (instante, versión, proceso): en ese instante el proceso supera a su padre
+        self._contador = count()
+        self._ahora = 0 # Instante en el que es válido el orden del montículo
+
+    def agregar(self, proceso, tiempo):
+        self._avanzar(tiempo)
+        self._orden[proceso] = next(self._contador)
+        self._total += 1
+        grupo = self._grupos.get(self._cpu[proceso])
+        if grupo:
+            grupo.append(proceso) # Llegó después que el primero del grupo: no lo supera nunca
+            return
+        self._grupos[self._cpu[proceso]] = deque((proceso,))
+        self._monticulo.append(proceso)
+        self._posicion[proceso] = len(self._monticulo) - 1
+        self._recertificar(self._subir(len(self._monticulo) - 1, tiempo))
+
+    def extraer(self, tiempo):
+        self._avanzar(tiempo)
+        monticulo = self._monticulo
+        primero = monticulo[0]
+        grupo = self._grupos[self._cpu[primero]]
+        grupo.popleft()
+        self._total -= 1
+        del self._posicion[primero], self._orden[primero], self._version[primero]
+        if grupo:
+            # El siguiente del grupo ocupa su lugar; llegó más tarde, así que solo puede bajar
+            self._colocar(grupo[0], 0)
+            self._recertificar(self._bajar(0, tiempo))
+        else:
+            del self._grupos[self._cpu[primero]]
+            ultimo = monticulo.pop()
+            if monticulo:
+                self._colocar(ultimo, 0)
+                self._recertificar(self._bajar(0, tiempo))
+        if len(self._eventos) > 2 * len(monticulo) + 64:
+            # Demasiados certificados caducados: se reconstruyen los vigentes
+            self._eventos = []
+            self._recertificar(range(len(monticulo)))
+        return primero
+
+    def __len__(self):
+        return self._total
+
+    def __bool__(self):
+        return bool(self._monticulo)
+
+    def __iter__(self):
+        return (proceso for grupo in self._grupos.values() for proceso in grupo)
+
+    def _mejor(self, i, j, tiempo):
+        """True si en `tiempo` la razón de respuesta de i supera a la de j (o empatan e i se insertó antes)."""
+        diferencia = (tiempo - self._llegadas[i]) * self._cpu[j] - (tiempo - self._llegadas[j]) * self._cpu[i]
+        return diferencia > 0 or (diferencia == 0 and self._orden[i] < self._orden[j])
+
+    def _colocar(self, proceso, posicion):
+        self._monticulo[posicion] = proceso
+        self._posicion[proceso] = posicion
+
+    def _subir(self, posicion, tiempo):
+        monticulo = self._monticulo
+        proceso = monticulo[posicion]
+        camino = [posicion]
+        while posicion > 0:
+            padre = (posicion - 1) >> 1
+            if not self._mejor(proceso, monticulo[padre], tiempo):
+                break
+            self._colocar(monticulo[padre], posicion)
+            posicion = padre
+            camino.append(posicion)
+        self._colocar(proceso, posicion)
+        return camino
+
+    def _bajar(self, posicion, tiempo):
+        monticulo = self._monticulo
+        n = len(monticulo)
+        proceso = monticulo[posicion]
+        camino = [posicion]
+        while True:
+            hijo = 2 * posicion + 1
+            if hijo >= n:
+                break
+            if hijo + 1 < n and self._mejor(monticulo[hijo + 1], monticulo[hijo], tiempo):
+                hijo += 1
+            if not self._mejor(monticulo[hijo], proceso, tiempo):
+                break
+            self._colocar(monticulo[hijo], posicion)
+            posicion = hijo
+            camino.append(posicion)
+        self._colocar(proceso, posicion)
+        return camino
+
+    def _avanzar(self, tiempo):
+        """Aplica, en orden, los cruces ocurridos hasta `tiempo`: cada uno intercambia un proceso con su padre."""
+        eventos, monticulo = self._eventos, self._monticulo
+        while eventos and eventos[0][0] <= tiempo:
+            instante, version, proceso = heapq.heappop(eventos)
+            if self._version.get(proceso) != version:
+                continue
+            self._ahora = instante
+            posicion = self._posicion[proceso]
+            padre = (posicion - 1) >> 1
+            # Los hermanos no se comparan entre sí: si el otro hijo es aún mejor, es él quien sube
+            hermano = posicion + 1 if posicion & 1 else posicion - 1
+            if hermano < len(monticulo) and self._mejor(monticulo[hermano], proceso, instante):
+                posicion = hermano
+            subido = monticulo[posicion]
+            self._colocar(monticulo[padre], posicion)
+            self._colocar(subido, padre)
+            self._recertificar((padre, posicion))
+        self._ahora = tiempo
+
+    def _recertificar(self, posiciones):
+        """Renueva el certificado de los procesos de `posiciones` y de sus hijos, cuyo padre ha cambiado."""
+        n = len(self._monticulo)
+        tocadas = set()
+        for posicion in posiciones:
+            tocadas.update((posicion, 2 * posicion + 1, 2 * posicion + 2))
+        for posicion in tocadas:
+            if posicion < n:
+                self._certificar(posicion)
+
+    def _certificar(self, posicion):
+        """Programa el primer instante en que el proceso de `posicion` superará a su padre, si llega a hacerlo."""
+        hijo = self._monticulo[posicion]
+        version = self._version[hijo] = next(self._contador)
+        if posicion == 0:
+            return
+        padre = self._monticulo[(posicion - 1) >> 1]
+        cpu_padre, cpu_hijo = self._cpu[padre], self._cpu[hijo]
+        if self._mejor(hijo, padre, self._ahora):
+            # Ya lo supera (varios cruces en el mismo instante): se corrige en esta misma pasada
+            heapq.heappush(self._eventos, (self._ahora, version, hijo))
+            return
+        if cpu_padre <= cpu_hijo:
+            return # La razón del padre crece al menos igual de rápido: el hijo no lo alcanza
+        # (T - llegada_hijo) * cpu_padre - (T - llegada_padre) * cpu_hijo crece con T y se anula en numerador / denominador
+        numerador = self._llegadas[hijo] * cpu_padre - self._llegadas[padre] * cpu_hijo
+        denominador = cpu_padre - cpu_hijo
+        if self._orden[hijo] < self._orden[padre]:
+            instante = -(-numerador // denominador) # El empate ya favorece al hijo
+        else:
+            instante = numerador // denominador + 1
+        heapq.heappush(self._eventos, (instante, version, hijo))
@@ -0,0 +1,159 @@
+# eventos.py
+"""Ejecución incremental de los algoritmos: produce los eventos de planificación a medida que ocurren."""
+import heapq
+from collections import deque, namedtuple
+from itertools import count
+
+from linea_tiempo import INACTIVO
+
+# Tipos de evento
+LLEGADA = "llegada"
+DESPACHO = "despacho"
+EXPROPIACION = "expropiacion"
+FINALIZACION = "finalizacion"
+INACTIVIDAD = "inactivo"
+
+# `tiempo` es el instante del evento. En INACTIVIDAD el pid es INACTIVO y la CPU queda libre
+# hasta el siguiente DESPACHO.
+Evento = namedtuple("Evento", ["tipo", "tiempo", "pid", "nombre", "llegada", "cpu"], defaults=(INACTIVO, None, None, None))
+
+# Posiciones en la lista de estado de cada proceso activo
+_PID, _NOMBRE, _LLEGADA, _CPU, _RESTANTE, _ORDEN = range(6)
+
+class EjecucionIncremental:
+    """Simulación perezosa de FCFS, SJF, SRTF o Round Robin sobre un flujo de procesos.
+
+    `procesos` es un iterable (posiblemente infinito) de tuplas (nombre, tiempo_cpu, instante_llegada[, pid])
+    ordenado por llegada; solo se consume hasta la siguiente llegada necesaria. Durante la ejecución se pueden
+    inyectar procesos nuevos con `inyectar`. Solo se guarda el estado de los procesos que aún no han terminado.
+    """
+
+    def __init__(self, algoritmo, quantum=None, procesos=(), primer_pid=1):
+        if algoritmo not in ("FCFS", "SJF", "SRTF", "Round Robin"):
+            raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+        if algoritmo == "Round Robin" and (quantum is None or quantum <= 0):
+            raise ValueError("El quantum debe ser positivo.")
+        self.algoritmo = algoritmo
+        self.quantum = quantum
+        self.tiempo_actual = 0
+
+        self._fuente = iter(procesos)
+        self._siguiente_fuente = None
+        self._ultima_llegada_fuente = 0
+        self._inyectados = [] # Montículo (llegada, orden, estado)
+        self._orden = count()
+        self._siguiente_pid = primer_pid
+        self._leer_fuente()
+
+    def _nuevo_estado(self, registro):
+        if len(registro) == 4:
+            nombre, tiempo_cpu, instante_llegada, pid = registro
+        else:
+            nombre, tiempo_cpu, instante_llegada = registro
+            pid = self._siguiente_pid
+        self._siguiente_pid = max(self._siguiente_pid, pid + 1)
+        if tiempo_cpu <= 0 or instante_llegada < 0:
+            raise ValueError(f"Proceso '{nombre}' no válido (CPU <= 0 o llegada < 0).")
+        return [pid, nombre, instante_llegada, tiempo_cpu, tiempo_cpu, next(self._orden)]
+
+    def _leer_fuente(self):
+        registro = next(self._fuente, None)
+        if registro is None:
+            self._siguiente_fuente = None
+            return
+        estado = self._nuevo_estado(registro)
+        if estado[_LLEGADA] < self._ultima_llegada_fuente:
+            raise ValueError(f"El flujo de procesos debe estar ordenado por llegada ('{estado[_NOMBRE]}').")
+        self._ultima_llegada_fuente = estado[_LLEGADA]
+        self._siguiente_fuente = estado
+
+    def inyectar(self, nombre, tiempo_cpu, instante_llegada):
+        """Añade un proceso durante la ejecución; no puede llegar antes del instante actual. Devuelve su PID."""
+        if instante_llegada < self.tiempo_actual:
+            raise ValueError("El proceso inyectado no puede llegar antes del instante actual.")
+        estado = self._nuevo_estado((nombre, tiempo_cpu, instante_llegada))
+        heapq.heappush(self._inyectados, (instante_llegada, estado[_ORDEN], estado))
+        return estado[_PID]
+
+    def _proxima_llegada(self):
+        candidatos = []
+        if self._siguiente_fuente is not None:
+            candidatos.append(self._siguiente_fuente[_LLEGADA])
+        if self._inyectados:
+            candidatos.append(self._inyectados[0][0])
+        return min(candidatos) if candidatos else None
+
+    def _extraer_llegada(self):
+        """Saca la siguiente llegada; a igual instante, el flujo va antes que los inyectados."""
+        fuente = self._siguiente_fuente
+        if fuente is not None and (not self._inyectados or fuente[_LLEGADA] <= self._inyectados[0][0]):
+            self._leer_fuente()
+            return fuente
+        return heapq.heappop(self._inyectados)[2]
+
+    def __iter__(self):
+        return self.eventos()
+
+    def eventos(self):
+        algoritmo = self.algoritmo
+        quantum = self.quantum
+        if algoritmo in ("FCFS", "Round Robin"):
+            cola = deque()
+            agregar, extraer = cola.append, cola.popleft
+        else:
+            # SJF ordena por CPU total y SRTF por CPU restante; después, por llegada y orden de admisión
+            campo = _CPU if algoritmo == "SJF" else _RESTANTE
+            cola = []
+            agregar = lambda e: heapq.heappush(cola, (e[campo], e[_LLEGADA], e[_ORDEN], e))
+            extraer = lambda: heapq.heappop(cola)[3]
+
+        def evento(tipo, estado):
+            return Evento(tipo, self.tiempo_actual, estado[_PID], estado[_NOMBRE], estado[_LLEGADA], estado[_CPU])
+
+        actual = None
+        fin_rodaja = None
+        while True:
+            proxima = self._proxima_llegada()
+            while proxima is not None and proxima <= self.tiempo_actual:
+                estado = self._extraer_llegada()
+                agregar(estado)
+                yield evento(LLEGADA, estado)
+                proxima = self._proxima_llegada()
+
+            if actual is not None:
+                if actual[_RESTANTE] == 0:
+                    yield evento(FINALIZACION, actual)
+                    actual = None
+                elif algoritmo == "Round Robin" and self.tiempo_actual == fin_rodaja:
+                    # Las llegadas de la rodaja ya están en cola, por delante del proceso expropiado
+                    agregar(actual)
+                    yield evento(EXPROPIACION, actual)
+                    actual = None
+                elif algoritmo == "SRTF" and cola and cola[0][:2] < (actual[_RESTANTE], actual[_LLEGADA]):
+                    agregar(actual)
+                    yield evento(EXPROPIACION, actual)
+                    actual = None
+
+            if actual is None:
+                if cola:
+                    actual = extraer()
+                    fin_rodaja = self.tiempo_actual + quantum if quantum else None
+                    yield evento(DESPACHO, actual)
+                else:
+                    yield Evento(INACTIVIDAD, self.tiempo_actual)
+                    # La llegada que termina la inactividad puede haberse inyectado durante el yield
+                    proxima = self._proxima_llegada()
+                    if proxima is None:
+                        return
+                    self.tiempo_actual = proxima
+                    continue
+
+            # Avanza hasta la finalización, el fin de la rodaja o la siguiente llegada, lo que ocurra antes
+            objetivo = self.tiempo_actual + actual[_RESTANTE]
+            if algoritmo == "Round Robin":
+                objetivo = min(objetivo, fin_rodaja)
+            proxima = self._proxima_llegada()
+            if proxima is not None and proxima < objetivo:
+                objetivo = proxima
+            actual[_RESTANTE] -= objetivo - self.tiempo_actual
+            self.tiempo_actual = objetivo
@@ -0,0 +1,230 @@
+# gantt.py
+"""Dibujo de diagramas de Gantt sobre un Axes de matplotlib a partir de una LineaTiempo.
+
+Cada carril se dibuja con una sola colección (broken_barh) y, cuando hay más tramos que píxeles,
+los tramos se agregan por nivel de detalle antes de dibujarlos.
+"""
+from matplotlib.collections import PolyCollection
+from matplotlib.ticker import FuncFormatter, MaxNLocator, MultipleLocator
+
+from linea_tiempo import LineaTiempo, INACTIVO, CAMBIO
+
+COLOR_INACTIVO = "#D3D3D3"
+COLOR_CAMBIO = "#404040"
+ALTURA_BARRA = 0.7
+
+# Por debajo de estos horizontes se conserva la cuadrícula por unidad y las marcas 'X' de cada instante
+LIMITE_CUADRICULA = 100
+LIMITE_MARCAS = 150
+# Con más carriles que estos, todos se dibujan en una única colección y solo se rotula una muestra
+MAXIMO_CARRILES_INDIVIDUALES = 200
+MAXIMO_ETIQUETAS_CARRIL = 40
+# Etiquetas de proceso en el Gantt de CPU: ancho mínimo del tramo en píxeles y máximo de etiquetas
+ANCHO_MINIMO_ETIQUETA_PX = 25
+MAXIMO_ETIQUETAS = 100
+
+def fusionar_por_detalle(tramos, resolucion):
+    """Agrega tramos (inicio, fin, pid) ordenados para que ninguno mida menos de `resolucion` unidades.
+
+    Un tramo se une al bloque anterior si le sigue a menos de un píxel y es del mismo PID o el bloque
+    todavía no llega a un píxel; el bloque conserva el PID de su primer tramo.
+    """
+    bloques = []
+    for inicio, fin, pid in tramos:
+        if bloques:
+            ultimo = bloques[-1]
+            if inicio - ultimo[1] < resolucion and (ultimo[2] == pid or ultimo[1] - ultimo[0] < resolucion):
+                ultimo[1] = fin
+                continue
+        bloques.append([inicio, fin, pid])
+    return bloques
+
+def _como_lineas(lineas):
+    """Acepta una LineaTiempo o una secuencia de ellas (una por núcleo) y descarta las vacías."""
+    if isinstance(lineas, LineaTiempo):
+        lineas = [lineas]
+    return [linea for linea in lineas if linea]
+
+def _resolucion(ax, lineas):
+    """Unidades de tiempo que ocupa un píxel del eje, o 0 si cada tramo cabe holgadamente."""
+    ancho_px = max(1.0, ax.get_window_extent().width)
+    if max((len(linea) for linea in lineas), default=0) <= ancho_px:
+        return 0
+    return (max(linea.fin for linea in lineas) - min(linea.inicio for linea in lineas)) / ancho_px
+
+def _rangos(tramos, resolucion):
+    """(inicio, ancho) de cada tramo; con nivel de detalle, ningún tramo mide menos de un píxel."""
+    return [(inicio, max(fin - inicio, resolucion)) for inicio, fin, _ in tramos]
+
+def _configurar_eje_tiempo(ax, inicio_total, fin_total):
+    """Marcas adaptativas en el eje de tiempo; la cuadrícula por unidad solo en horizontes cortos.
+
+    El eje empieza en el primer tramo: 0 en una simulación y el inicio de la ventana en una traza.
+    """
+    ax.set_xlim(inicio_total, fin_total)
+    ax.xaxis.set_major_locator(MaxNLocator(nbins="auto", integer=True))
+    ax.ticklabel_format(axis='x', style='plain', useOffset=False) # Instantes absolutos también en ventanas lejanas
+    if fin_total - inicio_total <= LIMITE_CUADRICULA:
+        ax.xaxis.set_minor_locator(MultipleLocator(1))
+
+def dibujar_gantt_procesos(ax, linea_tiempo, nombres, colores, titulo):
+    """Gantt con un carril por proceso. `nombres` relaciona PID y nombre; `colores`, nombre y color.
+
+    `linea_tiempo` puede ser una LineaTiempo o la lista de líneas de todos los núcleos.
+    """
+    ax.clear()
+    ax.set_title(titulo)
+    ax.set_xlabel('Tiempo')
+
+    lineas = _como_lineas(linea_tiempo)
+    nombres_procesos = sorted(set(nombres.values()))
+    if not lineas or not nombres_procesos:
+        return
+    y_pos = {nombre: i for i, nombre in enumerate(nombres_procesos)}
+    inicio_total = min(linea.inicio for linea in lineas)
+    fin_total = max(linea.fin for linea in lineas)
+    duracion = fin_total - inicio_total
+
+    tramos_por_carril = {nombre: [] for nombre in nombres_procesos}
+    for linea in lineas:
+        for inicio, fin, pid in linea:
+            if pid != INACTIVO and pid in nombres:
+                tramos_por_carril[nombres[pid]].append((inicio, fin, pid))
+    if len(lineas) > 1:
+        for tramos in tramos_por_carril.values():
+            tramos.sort()
+
+    resolucion = _resolucion(ax, lineas)
+    carriles_individuales = len(nombres_procesos) <= MAXIMO_CARRILES_INDIVIDUALES
+    rectangulos, colores_rectangulos = [], []
+    marcas_x, marcas_y = [], []
+    for nombre, tramos in tramos_por_carril.items():
+        if resolucion:
+            tramos = fusionar_por_detalle(tramos, resolucion)
+        y_coord = y_pos[nombre]
+        color = colores.get(nombre, 'gray')
+        if carriles_individuales:
+            ax.broken_barh(_rangos(tramos, resolucion), (y_coord - ALTURA_BARRA / 2, ALTURA_BARRA),
+                           facecolors=color, edgecolor='none', zorder=3)
+        else:
+            y0, y1 = y_coord - ALTURA_BARRA / 2, y_coord + ALTURA_BARRA / 2
+            for inicio, ancho in _rangos(tramos, resolucion):
+                rectangulos.append(((inicio, y0), (inicio, y1), (inicio + ancho, y1), (inicio + ancho, y0)))
+                colores_rectangulos.append(color)
+        if duracion <= LIMITE_MARCAS:
+            for inicio, fin, _ in tramos:
+                marcas_x.extend(t + 0.5 for t in range(inicio, fin))
+                marcas_y.extend([y_coord] * (fin - inicio))
+
+    if rectangulos:
+        # El borde del mismo color mantiene visibles los carriles de menos de un píxel de alto
+        ax.add_collection(PolyCollection(rectangulos, facecolors=colores_rectangulos, edgecolors=colores_rectangulos,
+                                         linewidths=0.5, zorder=3))
+    if marcas_x:
+        # Todas las marcas 'X' de cada instante en un único artista
+        ax.plot(marcas_x, marcas_y, linestyle='none', marker='$X$', markersize=5, color='white', zorder=4)
+
+    if len(nombres_procesos) <= MAXIMO_ETIQUETAS_CARRIL:
+        ax.set_yticks(list(y_pos.values()))
+        ax.set_yticklabels(nombres_procesos)
+        # Cuadrícula con las líneas de las marcas del eje en lugar de un axhline por carril
+        ax.yaxis.set_minor_locator(MultipleLocator(1, offset=0.5))
+        ax.tick_params(axis='y', which='minor', length=0)
+        ax.grid(True, axis='y', which='minor', color='gray', linestyle='-', linewidth=0.5, zorder=1)
+    else:
+        ax.yaxis.set_major_locator(MaxNLocator(nbins=MAXIMO_ETIQUETAS_CARRIL // 2, integer=True))
+        ax.yaxis.set_major_formatter(FuncFormatter(
+            lambda valor, _: nombres_procesos[int(valor)] if 0 <= int(valor) < len(nombres_procesos) else ''))
+    ax.set_ylim(-0.5, len(nombres_procesos) - 0.5)
+    ax.invert_yaxis()
+    _configurar_eje_tiempo(ax, inicio_total, fin_total)
+
+    # Cuadrícula vertical con las marcas del eje en lugar de un axvline por unidad
+    ax.grid(True, axis='x', which='minor' if duracion <= LIMITE_CUADRICULA else 'major',
+            color='gray', linestyle='-', linewidth=0.5, zorder=1)
+    ax.set_axisbelow(True)
+
+def _color_tramo(pid, nombres, colores):
+    if pid == INACTIVO:
+        return colores.get("Inactivo", COLOR_INACTIVO)
+    if pid == CAMBIO:
+        return colores.get("Cambio", COLOR_CAMBIO)
+    return colores.get(nombres.get(pid), 'gray')
+
+def _carriles_cpu(nucleos):
+    # Un carril por núcleo, el núcleo 0 arriba; con un solo núcleo, el carril queda centrado en 0.5
+    return [nucleos - n - 0.5 for n in range(nucleos)]
+
+def _configurar_carriles_cpu(ax, posiciones):
+    ax.set_yticks(posiciones)
+    ax.set_yticklabels(['CPU'] if len(posiciones) == 1 else [f'CPU {n}' for n in range(len(posiciones))])
+    ax.set_ylim(0, len(posiciones)) # Carriles de altura 1 centrados en cada posición
+
+def dibujar_gantt_cpu(ax, linea_tiempo, nombres, colores):
+    """Gantt con un carril por núcleo y el proceso que lo ocupa en cada tramo.
+
+    `linea_tiempo` puede ser una LineaTiempo (un solo núcleo) o la lista de líneas de todos los núcleos.
+    """
+    ax.clear()
+    ax.set_title('Diagrama de Gantt de la CPU')
+    ax.set_xlabel('Tiempo')
+    ax.set_ylabel('CPU')
+    lineas = [linea_tiempo] if isinstance(linea_tiempo, LineaTiempo) else list(linea_tiempo)
+    if not any(lineas):
+        return
+    inicio_total = min(linea.inicio for linea in lineas if linea)
+    fin_total = max(linea.fin for linea in lineas if linea)
+    duracion = fin_total - inicio_total
+    resolucion = _resolucion(ax, _como_lineas(lineas))
+
+    color = lambda pid: _color_tramo(pid, nombres, colores)
+
+    # Solo se etiquetan los tramos con espacio suficiente para el nombre
+    ancho_px = max(1.0, ax.get_window_extent().width)
+    ancho_minimo = ANCHO_MINIMO_ETIQUETA_PX * duracion / ancho_px
+    etiquetas = 0
+    posiciones = _carriles_cpu(len(lineas))
+    for linea, y_cpu in zip(lineas, posiciones):
+        tramos = fusionar_por_detalle(linea, resolucion) if resolucion else list(linea)
+        ax.broken_barh(_rangos(tramos, resolucion), (y_cpu - ALTURA_BARRA / 2, ALTURA_BARRA),
+                       facecolors=[color(pid) for _, _, pid in tramos],
+                       edgecolor='black' if not resolucion else 'none', linewidth=0.5)
+        for inicio, fin, pid in tramos:
+            if etiquetas >= MAXIMO_ETIQUETAS:
+                break
+            if pid > INACTIVO and fin - inicio >= ancho_minimo:
+                ax.text(inicio + (fin - inicio) / 2, y_cpu, nombres.get(pid, ''),
+                        ha='center', va='center', color='white', fontsize=9, fontweight='bold', clip_on=True)
+                etiquetas += 1
+
+    _configurar_carriles_cpu(ax, posiciones)
+    _configurar_eje_tiempo(ax, inicio_total, fin_total)
+    ax.grid(axis='x', which='minor' if duracion <= LIMITE_CUADRICULA else 'major', linestyle='--', alpha=0.7)
+
+def preparar_gantt_cpu(ax, nucleos):
+    """Gantt de CPU vacío al que agregar_tramos_cpu añade tramos mientras la simulación avanza."""
+    ax.clear()
+    ax.set_title('Diagrama de Gantt de la CPU (simulando...)')
+    ax.set_xlabel('Tiempo')
+    ax.set_ylabel('CPU')
+    _configurar_carriles_cpu(ax, _carriles_cpu(nucleos))
+    ax.set_xlim(0, 1)
+    ax.ticklabel_format(axis='x', style='plain', useOffset=False)
+
+def agregar_tramos_cpu(ax, nucleo, nucleos, tramos, nombres, colores):
+    """Añade tramos (inicio, fin, pid) de un núcleo a un Gantt de CPU sin redibujar los anteriores.
+
+    El eje se amplía hasta el último tramo y los tramos se agregan por nivel de detalle a esa escala.
+    """
+    if not tramos:
+        return
+    inicio_eje, fin_eje = ax.get_xlim()
+    fin_eje = max(fin_eje, tramos[-1][1])
+    ax.set_xlim(inicio_eje, fin_eje)
+    ancho_px = max(1.0, ax.get_window_extent().width)
+    resolucion = (fin_eje - inicio_eje) / ancho_px if len(tramos) > ancho_px else 0
+    if resolucion:
+        tramos = fusionar_por_detalle(tramos, resolucion)
+    y_cpu = _carriles_cpu(nucleos)[nucleo]
+    ax.broken_barh(_rangos(tramos, resolucion), (y_cpu - ALTURA_BARRA / 2, ALTURA_BARRA),
+                   facecolors=[_color_tramo(pid, nombres, colores) for _, _, pid in tramos], edgecolor='none')
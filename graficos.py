@@ -0,0 +1,41 @@
+# graficos.py
+"""Exportación no interactiva de los diagramas de Gantt a PNG o SVG (backend Agg, sin Tk ni pyplot).
+
+Matplotlib solo se importa al exportar, así que importar este módulo no retrasa el arranque.
+"""
+import os
+
+FORMATOS = (".png", ".svg")
+PALETA = "tab20"
+
+def colores_por_nombre(nombres):
+    """Color fijo para cada nombre de proceso (en orden alfabético) tomado de una paleta cíclica."""
+    from matplotlib import colormaps
+    from matplotlib.colors import to_hex
+
+    paleta = colormaps[PALETA]
+    return {nombre: to_hex(paleta(i % paleta.N)) for i, nombre in enumerate(sorted(set(nombres)))}
+
+def guardar_gantt(simulador, ruta, titulo="Diagrama de Gantt", colores=None, tamano=(10, 7), dpi=100):
+    """Dibuja el Gantt por proceso y el de la CPU de la última simulación en `ruta` (.png o .svg)."""
+    guardar_gantt_lineas(simulador.lineas_nucleos, simulador.nombres_por_pid(), ruta, titulo, colores, tamano, dpi)
+
+def guardar_gantt_lineas(lineas, nombres, ruta, titulo="Diagrama de Gantt", colores=None, tamano=(10, 7), dpi=100):
+    """Como guardar_gantt, a partir de las líneas de tiempo de cada núcleo y los nombres por PID."""
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension not in FORMATOS:
+        raise ValueError(f"Formato de imagen no soportado: '{extension}' (use .png o .svg).")
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    import gantt
+
+    if colores is None:
+        colores = colores_por_nombre(nombres.values())
+    figura = Figure(figsize=tamano, dpi=dpi)
+    FigureCanvasAgg(figura)
+    ax_procesos, ax_cpu = figura.subplots(2, 1)
+    # El ancho en píxeles de los ejes decide el nivel de detalle, así que se fija la disposición antes de dibujar
+    figura.tight_layout(pad=3.0)
+    gantt.dibujar_gantt_procesos(ax_procesos, lineas, nombres, colores, titulo)
+    gantt.dibujar_gantt_cpu(ax_cpu, lineas, nombres, colores)
+    figura.savefig(ruta)
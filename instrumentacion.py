@@ -0,0 +1,161 @@
+# instrumentacion.py
+"""Instrumentación opcional de los algoritmos: contadores, tiempos por fase y traza de Chrome.
+
+Se activa asignando una Instrumentacion a `Simulador.instrumentacion`; sin ella los algoritmos no pagan
+nada más que una comprobación por ejecución. La traza se abre en chrome://tracing o en Perfetto.
+"""
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from colas import ColaFIFO, ColaPrioridad, ColaRazonRespuesta
+from linea_tiempo import INACTIVO, CAMBIO
+
+class ColaFIFOContada(ColaFIFO):
+    """ColaFIFO que cuenta los procesos encolados y las extracciones (decisiones de planificación)."""
+
+    __slots__ = ("_contadores",)
+
+    def __init__(self, contadores, elementos=()):
+        super().__init__(elementos)
+        self._contadores = contadores
+        contadores["encolados"] += len(self)
+
+    def agregar(self, proceso):
+        self._contadores["encolados"] += 1
+        super().agregar(proceso)
+
+    def extender(self, procesos):
+        antes = len(self)
+        super().extender(procesos)
+        self._contadores["encolados"] += len(self) - antes
+
+    def extraer(self):
+        self._contadores["decisiones"] += 1
+        return super().extraer()
+
+class ColaPrioridadContada(ColaPrioridad):
+    """ColaPrioridad que cuenta los procesos encolados y las extracciones (decisiones de planificación)."""
+
+    __slots__ = ("_contadores",)
+
+    def __init__(self, contadores, clave):
+        super().__init__(clave)
+        self._contadores = contadores
+
+    def agregar(self, proceso):
+        self._contadores["encolados"] += 1
+        super().agregar(proceso)
+
+    def extraer(self):
+        self._contadores["decisiones"] += 1
+        return super().extraer()
+
+class ColaRazonRespuestaContada(ColaRazonRespuesta):
+    """ColaRazonRespuesta que cuenta los procesos encolados y las extracciones (decisiones de planificación)."""
+
+    __slots__ = ("_contadores",)
+
+    def __init__(self, contadores, llegadas, cpu):
+        super().__init__(llegadas, cpu)
+        self._contadores = contadores
+
+    def agregar(self, proceso, tiempo):
+        self._contadores["encolados"] += 1
+        super().agregar(proceso, tiempo)
+
+    def extraer(self, tiempo):
+        self._contadores["decisiones"] += 1
+        return super().extraer(tiempo)
+
+class Instrumentacion:
+    """Acumula contadores y tiempos de fase de las ejecuciones de un Simulador.
+
+    Contadores: procesos encolados, decisiones de planificación (extracciones de la cola de listos),
+    cambios de contexto (un núcleo pasa de un proceso a otro) e intervalos de inactividad.
+    """
+
+    def __init__(self):
+        self.contadores = Counter()
+        self.tiempos = Counter() # Segundos acumulados por fase (las fases anidadas se cuentan en ambas)
+        self.ejecuciones = [] # Un diccionario por ejecución: parámetros, segundos y contadores propios
+        self.eventos_traza = []
+        self._origen = time.perf_counter_ns()
+
+    def cola_fifo(self, elementos=()):
+        return ColaFIFOContada(self.contadores, elementos)
+
+    def cola_prioridad(self, clave):
+        return ColaPrioridadContada(self.contadores, clave)
+
+    def cola_razon_respuesta(self, llegadas, cpu):
+        return ColaRazonRespuestaContada(self.contadores, llegadas, cpu)
+
+    @contextmanager
+    def fase(self, nombre, **argumentos):
+        """Mide el bloque y lo añade a la traza como un evento completo ("X")."""
+        inicio = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            fin = time.perf_counter_ns()
+            self.tiempos[nombre] += (fin - inicio) / 1e9
+            self.eventos_traza.append({
+                "name": nombre, "cat": "simulador", "ph": "X",
+                "ts": (inicio - self._origen) / 1000, "dur": (fin - inicio) / 1000,
+                "pid": os.getpid(), "tid": threading.get_ident(), "args": argumentos,
+            })
+
+    def contar_lineas(self, lineas):
+        """Cuenta los cambios de contexto y los intervalos de inactividad de las líneas de tiempo de una ejecución.
+
+        Un cambio de contexto es cada despacho de un proceso distinto del último que ocupó el núcleo, aunque entre
+        ambos haya un intervalo inactivo; el primer despacho de cada núcleo no cuenta.
+        """
+        for linea in lineas:
+            anterior = None
+            for pid in linea.pids:
+                if pid == CAMBIO:
+                    continue # La sobrecarga modelada no separa al proceso saliente del entrante
+                if pid == INACTIVO:
+                    self.contadores["intervalos_inactivos"] += 1
+                    continue
+                if anterior is not None and pid != anterior:
+                    self.contadores["cambios_contexto"] += 1
+                anterior = pid
+
+    @contextmanager
+    def ejecucion(self, algoritmo, quantum, nucleos, colas):
+        """Fase que envuelve una llamada a Simulador.ejecutar y guarda sus contadores propios."""
+        antes = Counter(self.contadores)
+        inicio = time.perf_counter()
+        with self.fase(f"ejecutar {algoritmo}", quantum=quantum, nucleos=nucleos, colas=colas):
+            yield
+        propios = self.contadores - antes
+        self.ejecuciones.append({"algoritmo": algoritmo, "quantum": quantum, "nucleos": nucleos, "colas": colas,
+                                 "segundos": time.perf_counter() - inicio, **propios})
+        # Los contadores de la ejecución se muestran como una serie en la traza
+        self.eventos_traza.append({"name": "contadores", "ph": "C", "ts": (time.perf_counter_ns() - self._origen) / 1000,
+                                   "pid": os.getpid(), "args": dict(propios)})
+
+    def resumen_por_algoritmo(self):
+        """Segundos y contadores sumados por algoritmo."""
+        resumen = {}
+        for ejecucion in self.ejecuciones:
+            total = resumen.setdefault(ejecucion["algoritmo"], Counter())
+            total.update({clave: valor for clave, valor in ejecucion.items()
+                          if clave not in ("algoritmo", "quantum", "nucleos", "colas")})
+            total["ejecuciones"] += 1
+        return resumen
+
+    def traza_chrome(self):
+        """Diccionario en el formato de eventos de traza de Chrome."""
+        return {"traceEvents": self.eventos_traza, "displayTimeUnit": "ms",
+                "otherData": {"contadores": dict(self.contadores)}}
+
+    def exportar_chrome(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(self.traza_chrome(), archivo)
@@ -0,0 +1,78 @@
+# linea_tiempo.py
+from array import array
+from bisect import bisect_right
+
+# PID reservado para los tramos en los que la CPU no ejecuta ningún proceso
+INACTIVO = 0
+# PID reservado para los tramos de cambio de contexto, despacho o calentamiento tras una migración
+CAMBIO = -1
+
+class LineaTiempo:
+    """Línea de tiempo compacta de la CPU como intervalos [inicio, fin) con el PID que la ocupa.
+
+    La memoria crece con el número de cambios de contexto y no con el tiempo simulado.
+    """
+
+    __slots__ = ("inicios", "fines", "pids")
+
+    def __init__(self):
+        self.inicios = array('q')
+        self.fines = array('q')
+        self.pids = array('q')
+
+    def agregar(self, inicio, fin, pid):
+        """Añade el tramo [inicio, fin) fusionándolo con el último si es contiguo y del mismo PID."""
+        if fin <= inicio:
+            return
+        if self.pids and self.pids[-1] == pid and self.fines[-1] == inicio:
+            self.fines[-1] = fin
+        else:
+            self.inicios.append(inicio)
+            self.fines.append(fin)
+            self.pids.append(pid)
+
+    def truncar(self, tramos, fin):
+        """Conserva los `tramos` primeros con el último terminando en `fin` (deshace fusiones posteriores)."""
+        del self.inicios[tramos:]
+        del self.fines[tramos:]
+        del self.pids[tramos:]
+        if tramos:
+            self.fines[-1] = fin
+
+    def get(self, tiempo, default=None):
+        """Devuelve el PID que ocupa la CPU en el instante dado (búsqueda binaria)."""
+        i = bisect_right(self.inicios, tiempo) - 1
+        if i >= 0 and tiempo < self.fines[i]:
+            return self.pids[i]
+        return default
+
+    def __getitem__(self, tiempo):
+        pid = self.get(tiempo)
+        if pid is None:
+            raise KeyError(tiempo)
+        return pid
+
+    def __contains__(self, tiempo):
+        return self.get(tiempo) is not None
+
+    def __iter__(self):
+        """Itera los tramos como tuplas (inicio, fin, pid)."""
+        return zip(self.inicios, self.fines, self.pids)
+
+    def __len__(self):
+        return len(self.pids)
+
+    def __bool__(self):
+        return len(self.pids) > 0
+
+    @property
+    def inicio(self):
+        return self.inicios[0] if self.inicios else 0
+
+    @property
+    def fin(self):
+        """Instante en el que termina el último tramo (horizonte de la simulación)."""
+        return self.fines[-1] if self.fines else 0
+
+    def pids_presentes(self):
+        return set(self.pids)
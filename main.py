@@ -2,40 +2,62 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import filedialog
 import random
-import numpy as np
+import time
 # Importamos la clase Simulador (que a su vez importa Proceso)
-from simulador import Simulador 
+from simulador import Simulador, MODOS_COLAS, CostosCambio
+from politicas import obtener_politica, nombres_politicas
+from cache import CacheSimulaciones
+from linea_tiempo import INACTIVO, CAMBIO
+from vistas import ListaVirtual, TablaVirtual
+from tareas import SimulacionEnSegundoPlano
+
+# Intervalo entre cuadros de la animación (~60 fps)
+INTERVALO_CUADRO_MS = 16
+# Intervalo de consulta del progreso de una simulación en segundo plano
+INTERVALO_PROGRESO_MS = 100
 
 class SimuladorApp:
     def __init__(self, master):
         self.master = master
         self.master.title("Simulador de Procesos")
-        self.simulador = Simulador()
-        self.simulaciones_historial = {}
+        # Simulaciones ya calculadas: repetir la misma carga, algoritmo y quantum no vuelve a simular
+        self.simulaciones_historial = CacheSimulaciones(capacidad=16)
+        self.simulador = Simulador(cache=self.simulaciones_historial, puntos_control=True)
 
         self.algoritmo_var = tk.StringVar(self.master)
-        self.quantum = tk.IntVar(self.master, value=4) # Valor inicial para RR
+        self.quantum = tk.IntVar(self.master, value=4) # Valor inicial para RR y MLFQ
+        self.nucleos = tk.IntVar(self.master, value=1)
+        self.colas_var = tk.StringVar(self.master, value=MODOS_COLAS[0])
+        self.costo_cambio = tk.IntVar(self.master, value=0) # Unidades de tiempo por cambio de contexto
+        self.tarea = None # SimulacionEnSegundoPlano en curso
+        self.nucleos_avance = 1 # Núcleos del Gantt de CPU que se dibuja mientras simula
+        self.progreso_var = tk.DoubleVar(self.master, value=0.0)
 
         self.label_tiempo_retorno_promedio = None
         self.label_tiempo_espera_promedio = None
         self.label_indice_servicio_promedio = None 
+        self.label_metricas_sistema = None
         
         self.colores_procesos = {}
 
-        # MODIFICACIÓN CLAVE 1: Crear dos subplots nuevamente: 
-        # uno para el Gantt por Proceso y otro para el Gantt de CPU.
-        self.fig, (self.ax_gantt_per_process, self.ax_gantt_cpu) = plt.subplots(2, 1, figsize=(8, 6)) 
-        self.fig.tight_layout(pad=3.0) 
-
-        # Renombramos el Gantt principal para mayor claridad
-        self.ax_gantt = self.ax_gantt_per_process 
+        # La figura de Matplotlib se crea con la primera simulación (ver crear_figura): la ventana abre sin
+        # esperar a importar Matplotlib
+        self.fig = None
+        self.ax_gantt_per_process = self.ax_gantt_cpu = self.ax_gantt = None
+        self.canvas_gantt = None
         
         self.instante_actual_animacion = 0
-        self.historial_visual_keys = []
+        self.fin_animacion = 0
         self.animation_id = None
+        # Reproducción con blitting: fondo estático cacheado y solo el cursor se redibuja en cada cuadro
+        self.velocidad_animacion = tk.DoubleVar(self.master, value=2.0) # Unidades de tiempo por segundo
+        self.instante_animacion_var = tk.DoubleVar(self.master, value=0.0)
+        self.fondo_animacion = None
+        self.cursor_animacion = None
+        self.etiqueta_animacion = None
+        self.ultimo_cuadro_animacion = 0.0
         
         self.treeview_metricas_por_proceso = None
 
@@ -44,54 +66,184 @@ class SimuladorApp:
     def generar_color_aleatorio(self):
         return "#%06x" % random.randint(0, 0xFFFFFF)
 
+    def simulacion_en_curso(self):
+        if self.tarea is not None and self.tarea.en_curso():
+            messagebox.showwarning("Advertencia", "Espere a que termine la simulación o cancélela.")
+            return True
+        return False
+
     def anadir_proceso(self):
+        if self.simulacion_en_curso():
+            return
         try:
             nombre = self.entry_nombre.get()
             tiempo_cpu = int(self.entry_tiempo_cpu.get())
             instante_llegada = int(self.entry_instante_llegada.get())
+            prioridad = int(self.entry_prioridad.get() or 0) # Vacío: prioridad 0
 
             if not nombre or tiempo_cpu <= 0 or instante_llegada < 0:
                 messagebox.showwarning("Advertencia", "Datos no válidos.")
                 return
 
-            self.simulador.agregar_proceso(nombre, tiempo_cpu, instante_llegada)
-            self.actualizar_visualizacion_lista_procesos()
+            self.simulador.agregar_proceso(nombre, tiempo_cpu, instante_llegada, prioridad)
+            self.lista_procesos_cola.agregar() # Solo se inserta la nueva fila
 
             self.entry_nombre.delete(0, tk.END)
             self.entry_tiempo_cpu.delete(0, tk.END)
             self.entry_instante_llegada.delete(0, tk.END)
+            self.entry_prioridad.delete(0, tk.END)
 
         except ValueError:
             messagebox.showerror("Error", "Ingrese valores numéricos válidos.")
 
+    def cargar_archivo(self):
+        """Agrega en bloque todos los procesos de un archivo de carga CSV o JSONL."""
+        if self.simulacion_en_curso():
+            return
+        ruta = filedialog.askopenfilename(title="Cargar procesos",
+                                          filetypes=[("Cargas de trabajo", "*.csv *.jsonl *.ndjson"), ("Todos", "*.*")])
+        if not ruta:
+            return
+        try:
+            pids = self.simulador.cargar_carga(ruta)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudo cargar el archivo:\n{e}")
+            return
+        self.actualizar_visualizacion_lista_procesos()
+        messagebox.showinfo("Carga", f"Se agregaron {len(pids)} procesos.")
+
     def actualizar_visualizacion_lista_procesos(self):
-        self.lista_procesos_cola.delete(0, tk.END)
-        for proceso in self.simulador.cola_llegadas:
-            self.lista_procesos_cola.insert(tk.END, f"PID: {proceso.pid} - Nombre: {proceso.nombre} - CPU: {proceso.tiempo_cpu_total} - Llegada: {proceso.instante_llegada}")
+        self.lista_procesos_cola.actualizar()
+
+    # Fuentes de las vistas virtualizadas: solo se consultan las filas visibles
+    def fila_proceso(self, i):
+        tabla = self.simulador.tabla
+        return (f"PID: {i + 1} - Nombre: {tabla.nombres[i]} - CPU: {tabla.cpu[i]} - Llegada: {tabla.llegadas[i]}"
+                f" - Prioridad: {tabla.prioridades[i]}")
+
+    def fila_historial(self, k):
+        i = self.simulador.historial_ejecucion[k]
+        return f"PID: {i + 1} - Nombre: {self.simulador.tabla.nombres[i]} - Tiempo Final: {self.simulador.tabla.finalizacion[i]}"
+
+    def fila_metricas(self, k):
+        proceso = self.simulador.tabla.proceso(self.simulador.historial_ejecucion[k])
+        return (proceso.nombre, proceso.instante_llegada, proceso.tiempo_cpu_total, proceso.tiempo_finalizacion,
+                proceso.tiempo_retorno, proceso.tiempo_espera, f"{proceso.indice_servicio:.2f}")
     
     def iniciar_simulacion(self):
-        if not self.simulador.cola_llegadas:
+        if self.simulacion_en_curso():
+            return
+        if not len(self.simulador.tabla):
             messagebox.showwarning("Advertencia", "Añade al menos un proceso.")
             return
 
         if self.animation_id:
             self.master.after_cancel(self.animation_id)
+            self.animation_id = None
+        # Los artistas del cursor anterior desaparecen al limpiar los ejes
+        self.cursor_animacion = None
+        self.etiqueta_animacion = None
 
         algoritmo = self.algoritmo_var.get()
         
         # Ejecución del algoritmo
-        if algoritmo == "FCFS":
-            self.simulador.ejecutar_fcfs()
-        elif algoritmo == "SJF":
-            self.simulador.ejecutar_sjf()
-        elif algoritmo == "SRTF":
-            self.simulador.ejecutar_srtf()
-        elif algoritmo == "Round Robin":
-            quantum_valor = self.quantum.get()
-            if quantum_valor <= 0:
-                messagebox.showwarning("Advertencia", "El quantum debe ser positivo.")
-                return
-            self.simulador.ejecutar_round_robin(quantum_valor)
+        politica = obtener_politica(algoritmo)
+        quantum_valor = self.quantum.get() if politica.usa_quantum else None
+        if quantum_valor is not None and quantum_valor <= 0:
+            messagebox.showwarning("Advertencia", "El quantum debe ser positivo.")
+            return
+        try:
+            nucleos = self.nucleos.get()
+        except tk.TclError:
+            nucleos = 0
+        if nucleos <= 0:
+            messagebox.showwarning("Advertencia", "El número de núcleos debe ser positivo.")
+            return
+        try:
+            costo_cambio = self.costo_cambio.get()
+        except tk.TclError:
+            costo_cambio = -1
+        if costo_cambio < 0:
+            messagebox.showwarning("Advertencia", "El costo de cambio de contexto no puede ser negativo.")
+            return
+        if (nucleos > 1 or costo_cambio) and not politica.multinucleo:
+            messagebox.showwarning("Advertencia", f"{algoritmo} solo se simula con un núcleo y sin costo de cambio.")
+            return
+        # La simulación corre en un hilo; consultar_simulacion sigue su progreso desde el bucle de Tk
+        self.tarea = SimulacionEnSegundoPlano(self.simulador, algoritmo, quantum_valor, nucleos, self.colas_var.get(),
+                                              CostosCambio(cambio=costo_cambio)).iniciar()
+        # Mientras simula, las vistas de resultados quedan vacías y el Gantt de CPU se dibuja con el avance
+        self.actualizar_tabla_metricas()
+        self.preparar_gantt_avance(nucleos)
+        self.boton_iniciar.state(["disabled"])
+        self.boton_cancelar.state(["!disabled"])
+        self.progreso_var.set(0.0)
+        self.label_progreso.config(text="Simulando...")
+        self.master.after(INTERVALO_PROGRESO_MS, self.consultar_simulacion)
+
+    def cancelar_simulacion(self):
+        if self.tarea is not None:
+            self.tarea.cancelar()
+            self.label_progreso.config(text="Cancelando...")
+
+    def consultar_simulacion(self):
+        tarea = self.tarea
+        if tarea.en_curso():
+            self.progreso_var.set(100 * tarea.fraccion())
+            self.label_progreso.config(text=f"Simulando... {tarea.terminados} de {tarea.total} procesos terminados")
+            self.dibujar_avance()
+            self.master.after(INTERVALO_PROGRESO_MS, self.consultar_simulacion)
+            return
+
+        self.boton_iniciar.state(["!disabled"])
+        self.boton_cancelar.state(["disabled"])
+        if tarea.cancelada or tarea.error is not None:
+            tarea.descartar()
+            self.progreso_var.set(0.0)
+            self.label_progreso.config(text="Simulación cancelada." if tarea.cancelada else "La simulación falló.")
+            self.actualizar_tabla_metricas()
+            if tarea.error is not None:
+                messagebox.showerror("Error", f"No se pudo simular:\n{tarea.error}")
+            return
+        self.progreso_var.set(100.0)
+        self.label_progreso.config(text=f"Simulación terminada: {tarea.total} procesos.")
+        self.mostrar_resultados()
+
+    def filas_resultados(self):
+        # El hilo de la simulación reescribe el historial: mientras simula no se muestra ninguna fila
+        if self.tarea is not None and self.tarea.en_curso():
+            return 0
+        return len(self.simulador.historial_ejecucion)
+
+    def preparar_gantt_avance(self, nucleos):
+        import gantt
+        if self.fig is None:
+            self.crear_figura()
+        self.nucleos_avance = nucleos
+        gantt.preparar_gantt_cpu(self.ax_gantt_cpu, nucleos)
+        self.fig.canvas.draw_idle()
+
+    def dibujar_avance(self):
+        """Añade al Gantt de CPU los tramos que la simulación en curso ha copiado desde la consulta anterior."""
+        import gantt
+        tramos_nuevos = self.tarea.tramos_nuevos()
+        if not tramos_nuevos:
+            return
+        # Los nombres no cambian durante la simulación: se pueden leer desde este hilo
+        nombres = self.simulador.tabla.nombres
+        for nucleo, inicios, fines, pids in tramos_nuevos:
+            nombres_tramos = {pid: nombres[pid - 1] for pid in set(pids) if pid > INACTIVO}
+            for nombre in nombres_tramos.values():
+                if nombre not in self.colores_procesos:
+                    self.colores_procesos[nombre] = self.generar_color_aleatorio()
+            gantt.agregar_tramos_cpu(self.ax_gantt_cpu, nucleo, self.nucleos_avance, list(zip(inicios, fines, pids)),
+                                     nombres_tramos, self.colores_procesos)
+        self.fig.canvas.draw_idle()
+
+    def mostrar_resultados(self):
+        """Dibuja los resultados por etapas; entre una y otra el bucle de Tk atiende los eventos pendientes."""
+        if self.fig is None:
+            self.crear_figura()
         
         # Post-simulación
         self.asignar_colores_procesos()
@@ -99,130 +251,120 @@ class SimuladorApp:
         self.actualizar_metricas_ui()
         
         # MODIFICACIÓN CLAVE 2: Llamar a la nueva función para dibujar el Gantt de CPU
-        self.dibujar_gantt_cpu() 
-        
+        self.master.after_idle(self.dibujar_gantt_cpu)
+        self.master.after_idle(self.mostrar_gantt_procesos)
+
+    def mostrar_gantt_procesos(self):
         # Reiniciar y empezar la visualización del Gantt por proceso
         self.instante_actual_animacion = 0
-        self.historial_visual_keys = sorted(list(self.simulador.historial_ejecucion_visual.keys()))
+        self.fin_animacion = self.simulador.instante_final()
         self.dibujar_gantt_estatico()
         self.iniciar_animacion_gantt()
         
     def asignar_colores_procesos(self):
-        nombres_procesos = set(self.simulador.historial_ejecucion_visual.values())
+        nombres_procesos = set(self.simulador.nombres_por_pid().values())
         
-        if "Inactivo" in nombres_procesos:
+        if any(INACTIVO in linea.pids_presentes() for linea in self.simulador.lineas_nucleos):
             self.colores_procesos["Inactivo"] = "#D3D3D3" # Gris claro
-            nombres_procesos.remove("Inactivo")
+        if any(CAMBIO in linea.pids_presentes() for linea in self.simulador.lineas_nucleos):
+            self.colores_procesos["Cambio"] = "#404040" # Gris oscuro
         
         for nombre in sorted(list(nombres_procesos)):
             if nombre not in self.colores_procesos:
                 self.colores_procesos[nombre] = self.generar_color_aleatorio()
 
     # =================================================================
-    # DIBUJO DEL GANTT EN CUADRÍCULA (SIN CAMBIOS)
+    # DIBUJO DEL GANTT EN CUADRÍCULA
     # =================================================================
-    def dibujar_gantt_estatico(self):
-        self.ax_gantt.clear()
-        algoritmo = self.algoritmo_var.get()
-        self.ax_gantt.set_title(f'Diagrama de Gantt - {algoritmo}')
-        self.ax_gantt.set_xlabel('Tiempo')
-        
-        tiempos = sorted(self.simulador.historial_ejecucion_visual.keys())
-        if not tiempos:
-            self.fig.canvas.draw()
-            return
+    def crear_figura(self):
+        """Importa Matplotlib y coloca la figura con los dos Gantt en el lugar reservado de la ventana."""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-        fin_total = max(tiempos) + 1 if tiempos else 0
-        
-        nombres_procesos_ejecutados = sorted(list(set(p.nombre for p in self.simulador.historial_ejecucion)))
-        
-        y_pos = {nombre: i for i, nombre in enumerate(nombres_procesos_ejecutados)}
-        
-        if not nombres_procesos_ejecutados:
-            self.fig.canvas.draw()
-            return
+        # MODIFICACIÓN CLAVE 1: Crear dos subplots nuevamente: 
+        # uno para el Gantt por Proceso y otro para el Gantt de CPU.
+        self.fig = Figure(figsize=(8, 6))
+        self.ax_gantt_per_process, self.ax_gantt_cpu = self.fig.subplots(2, 1)
+        self.fig.tight_layout(pad=3.0) 
 
-        segmentos = []
-        if tiempos:
-            inicio_segmento = tiempos[0]
-            proceso_anterior = self.simulador.historial_ejecucion_visual.get(inicio_segmento)
-            
-            for i in range(1, len(tiempos)):
-                tiempo_actual_iteracion = tiempos[i]
-                proceso_actual_iteracion = self.simulador.historial_ejecucion_visual.get(tiempo_actual_iteracion)
-                
-                if proceso_actual_iteracion != proceso_anterior:
-                    segmentos.append({
-                        'proceso': proceso_anterior,
-                        'inicio': inicio_segmento,
-                        'fin': tiempo_actual_iteracion
-                    })
-                    inicio_segmento = tiempo_actual_iteracion
-                    proceso_anterior = proceso_actual_iteracion
-            
-            segmentos.append({
-                'proceso': proceso_anterior,
-                'inicio': inicio_segmento,
-                'fin': fin_total
-            })
-
-        for seg in segmentos:
-            nombre = seg['proceso']
-            inicio = seg['inicio']
-            fin = seg['fin']
-            
-            if nombre != "Inactivo" and nombre in y_pos:
-                y_coord = y_pos[nombre]
-                
-                self.ax_gantt.barh(y_coord, fin - inicio, left=inicio, height=0.7, 
-                                    color=self.colores_procesos.get(nombre, 'gray'), edgecolor='none', zorder=3)
-                                    
-                for t_step in range(inicio, fin):
-                    if self.simulador.historial_ejecucion_visual.get(t_step) == nombre:
-                        simbolo = 'X' 
-                        self.ax_gantt.text(t_step + 0.5, y_coord, simbolo,
-                                        ha='center', va='center', color='white', fontsize=8, zorder=4)
-
-        self.ax_gantt.set_yticks(list(y_pos.values()))
-        self.ax_gantt.set_yticklabels(nombres_procesos_ejecutados)
-        self.ax_gantt.set_ylim(-0.5, len(nombres_procesos_ejecutados) - 0.5) 
-        self.ax_gantt.invert_yaxis() 
-
-        self.ax_gantt.set_xlim(0, fin_total)
-        self.ax_gantt.set_xticks(np.arange(0, fin_total + 1, 1))
-        
-        self.ax_gantt.grid(False) 
-        
-        for x_val in np.arange(0, fin_total + 1, 1):
-            self.ax_gantt.axvline(x=x_val, color='gray', linestyle='-', linewidth=0.5, zorder=1)
-        
-        for y_val in np.arange(-0.5, len(nombres_procesos_ejecutados), 1):
-            self.ax_gantt.axhline(y=y_val, color='gray', linestyle='-', linewidth=0.5, zorder=1)
+        # Renombramos el Gantt principal para mayor claridad
+        self.ax_gantt = self.ax_gantt_per_process 
 
+        self.etiqueta_gantt_pendiente.destroy()
+        self.canvas_gantt = FigureCanvasTkAgg(self.fig, master=self.frame_metricas_y_gantt)
+        self.canvas_gantt.mpl_connect('draw_event', self.capturar_fondo_animacion)
+        self.canvas_gantt_widget = self.canvas_gantt.get_tk_widget()
+        # El canvas de Matplotlib ahora tiene ambos subplots
+        self.canvas_gantt_widget.grid(row=5, column=0, sticky="nsew")
+
+    def dibujar_gantt_estatico(self):
+        import gantt
+        algoritmo = self.algoritmo_var.get()
+        gantt.dibujar_gantt_procesos(self.ax_gantt, self.simulador.lineas_nucleos,
+                                     self.simulador.nombres_por_pid(), self.colores_procesos,
+                                     f'Diagrama de Gantt - {algoritmo}')
         self.fig.canvas.draw()
         
     def iniciar_animacion_gantt(self):
-        # Esta función solo actualizará la línea de tiempo sobre el Gantt estático (el de cuadrícula)
-        if not self.historial_visual_keys or self.instante_actual_animacion > max(self.historial_visual_keys, default=0):
-            self.ax_gantt.lines = [l for l in self.ax_gantt.lines if not l.get_color() == 'red']
-            self.ax_gantt.texts = [t for t in self.ax_gantt.texts if not t.get_color() == 'red']
-            self.fig.canvas.draw()
+        # El cursor y su etiqueta son artistas animados: no forman parte del fondo cacheado
+        self.cursor_animacion = self.ax_gantt.axvline(x=0, color='red', linestyle='--', linewidth=1.5, zorder=5, animated=True)
+        self.etiqueta_animacion = self.ax_gantt.text(0, 1.0, 't=0', transform=self.ax_gantt.get_xaxis_transform(),
+                                                     ha='center', va='bottom', fontsize=8, color='red', zorder=5, animated=True)
+        self.escala_animacion.configure(to=max(self.fin_animacion, 1))
+        self.fig.canvas.draw() # Dispara capturar_fondo_animacion
+
+        self.ultimo_cuadro_animacion = time.perf_counter()
+        self.animation_id = self.master.after(INTERVALO_CUADRO_MS, self.avanzar_animacion_gantt)
+
+    def capturar_fondo_animacion(self, evento=None):
+        """Guarda el fondo estático tras cada redibujado completo (inicio, cambio de tamaño) y repone el cursor."""
+        self.fondo_animacion = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        if self.cursor_animacion is not None:
+            self.dibujar_cursor_animacion()
+
+    def dibujar_cursor_animacion(self):
+        if self.fondo_animacion is None or self.cursor_animacion is None:
+            return
+        instante = min(self.instante_actual_animacion, self.fin_animacion)
+        self.cursor_animacion.set_xdata([instante, instante])
+        self.etiqueta_animacion.set_x(instante)
+        self.etiqueta_animacion.set_text(f't={int(instante)}')
+
+        self.fig.canvas.restore_region(self.fondo_animacion)
+        self.ax_gantt.draw_artist(self.cursor_animacion)
+        self.ax_gantt.draw_artist(self.etiqueta_animacion)
+        self.fig.canvas.blit(self.fig.bbox)
+
+    def avanzar_animacion_gantt(self):
+        ahora = time.perf_counter()
+        try:
+            velocidad = max(self.velocidad_animacion.get(), 0.0)
+        except tk.TclError: # Campo de velocidad vacío o no numérico mientras se edita
+            velocidad = 0.0
+        self.instante_actual_animacion += (ahora - self.ultimo_cuadro_animacion) * velocidad
+        self.ultimo_cuadro_animacion = ahora
+
+        if self.instante_actual_animacion >= self.fin_animacion:
+            # Fin de la reproducción: se retira el cursor y se repone el fondo limpio
+            self.cursor_animacion.set_visible(False)
+            self.etiqueta_animacion.set_visible(False)
+            self.fig.canvas.restore_region(self.fondo_animacion)
+            self.fig.canvas.blit(self.fig.bbox)
+            self.animation_id = None
             return
 
-        tiempo_actual_en_simulacion = self.historial_visual_keys[self.instante_actual_animacion]
-        
-        self.ax_gantt.lines = [l for l in self.ax_gantt.lines if not (l.get_color() == 'red' and l.get_linestyle() == '--')] 
-        self.ax_gantt.axvline(x=tiempo_actual_en_simulacion, color='red', linestyle='--', linewidth=1.5, zorder=5) 
+        self.instante_animacion_var.set(self.instante_actual_animacion)
+        self.dibujar_cursor_animacion()
+        self.animation_id = self.master.after(INTERVALO_CUADRO_MS, self.avanzar_animacion_gantt)
+
+    def desplazar_animacion(self, valor):
+        """Mueve el cursor al instante elegido en la barra de desplazamiento."""
+        self.instante_actual_animacion = float(valor)
+        if self.cursor_animacion is not None:
+            self.cursor_animacion.set_visible(True)
+            self.etiqueta_animacion.set_visible(True)
+            self.dibujar_cursor_animacion()
 
-        self.ax_gantt.texts = [t for t in self.ax_gantt.texts if not t.get_color() == 'red'] 
-        self.ax_gantt.text(tiempo_actual_en_simulacion, -1.0, f't={tiempo_actual_en_simulacion}', 
-                            ha='center', va='bottom', fontsize=8, color='red', zorder=5)
-        
-        self.fig.canvas.draw()
-        
-        self.instante_actual_animacion += 1
-        self.animation_id = self.master.after(500, self.iniciar_animacion_gantt) 
-        
     def actualizar_metricas_ui(self):
         promedio_retorno, promedio_espera, promedio_indice_servicio = self.simulador.calcular_metricas()
             
@@ -230,100 +372,26 @@ class SimuladorApp:
         self.label_tiempo_espera_promedio.config(text=f"Tiempo de Espera Promedio: {promedio_espera:.2f}")
         self.label_indice_servicio_promedio.config(text=f"Índice de Servicio Promedio: {promedio_indice_servicio:.2f}")
 
+        sistema = self.simulador.metricas_sistema()
+        espera = self.simulador.acumulador.espera
+        self.label_metricas_sistema.config(text=f"Makespan: {sistema.makespan} - Rendimiento: {sistema.rendimiento:.3f} proc/u"
+                                                f" - Utilización: {sistema.utilizacion:.1%} - Migraciones: {sistema.migraciones}"
+                                                f" - Espera P95/P99: {espera.percentil(95):.1f}/{espera.percentil(99):.1f}"
+                                                f" - Cambios: {sistema.cambios} ({sistema.tiempo_cambios} u)")
+
     # =================================================================
     # NUEVA FUNCIÓN: Dibuja el Gantt de la CPU (similar a la Imagen 2)
     # =================================================================
     def dibujar_gantt_cpu(self):
-        self.ax_gantt_cpu.clear()
-        algoritmo = self.algoritmo_var.get()
-        self.ax_gantt_cpu.set_title('Diagrama de Gantt de la CPU')
-        self.ax_gantt_cpu.set_xlabel('Tiempo')
-        self.ax_gantt_cpu.set_ylabel('CPU')
-        
-        tiempos = sorted(self.simulador.historial_ejecucion_visual.keys())
-        if not tiempos:
-            self.fig.canvas.draw()
-            return
-
-        fin_total = max(tiempos) + 1 if tiempos else 0
-        
-        # Preparar segmentos para el Gantt de CPU
-        segmentos_cpu = []
-        if tiempos:
-            inicio_segmento = tiempos[0]
-            proceso_actual_en_cpu = self.simulador.historial_ejecucion_visual.get(inicio_segmento)
-            
-            for i in range(1, len(tiempos)):
-                tiempo_actual_iteracion = tiempos[i]
-                siguiente_proceso_en_cpu = self.simulador.historial_ejecucion_visual.get(tiempo_actual_iteracion)
-                
-                if siguiente_proceso_en_cpu != proceso_actual_en_cpu:
-                    segmentos_cpu.append({
-                        'proceso': proceso_actual_en_cpu,
-                        'inicio': inicio_segmento,
-                        'fin': tiempo_actual_iteracion
-                    })
-                    inicio_segmento = tiempo_actual_iteracion
-                    proceso_actual_en_cpu = siguiente_proceso_en_cpu
-            
-            segmentos_cpu.append({
-                'proceso': proceso_actual_en_cpu,
-                'inicio': inicio_segmento,
-                'fin': fin_total
-            })
-
-        # Dibujar los segmentos en una sola línea para la CPU
-        y_cpu = 0.5 # Posición fija para la línea de la CPU
-        for seg in segmentos_cpu:
-            nombre_proceso = seg['proceso']
-            inicio = seg['inicio']
-            fin = seg['fin']
-            
-            color = self.colores_procesos.get(nombre_proceso, 'gray')
-            if nombre_proceso == "Inactivo":
-                color = self.colores_procesos.get("Inactivo", '#D3D3D3') # Color específico para inactivo
-
-            self.ax_gantt_cpu.barh(y_cpu, fin - inicio, left=inicio, height=0.7, 
-                                    color=color, edgecolor='black', linewidth=0.5)
-            
-            # Añadir la etiqueta del proceso en el centro del segmento
-            if nombre_proceso != "Inactivo":
-                self.ax_gantt_cpu.text(inicio + (fin - inicio) / 2, y_cpu, nombre_proceso,
-                                        ha='center', va='center', color='white', fontsize=9, fontweight='bold')
-
-        # Configuración del eje Y para la CPU
-        self.ax_gantt_cpu.set_yticks([y_cpu])
-        self.ax_gantt_cpu.set_yticklabels(['CPU'])
-        self.ax_gantt_cpu.set_ylim(0, 1) # Para centrar la barra 'CPU'
-        
-        # Configuración del eje X para el tiempo
-        self.ax_gantt_cpu.set_xlim(0, fin_total)
-        self.ax_gantt_cpu.set_xticks(np.arange(0, fin_total + 1, 1))
-        
-        # Añadir líneas de cuadrícula para cada unidad de tiempo
-        self.ax_gantt_cpu.grid(axis='x', linestyle='--', alpha=0.7)
-        
+        import gantt
+        gantt.dibujar_gantt_cpu(self.ax_gantt_cpu, self.simulador.lineas_nucleos,
+                                self.simulador.nombres_por_pid(), self.colores_procesos)
         self.fig.canvas.draw()
         
     def actualizar_tabla_metricas(self):
-        for item in self.treeview_metricas_por_proceso.get_children():
-            self.treeview_metricas_por_proceso.delete(item)
-
-        self.simulador.calcular_metricas()
-        
-        self.lista_procesos_historial.delete(0, tk.END)
-        
-        for proceso in self.simulador.historial_ejecucion:
-            self.treeview_metricas_por_proceso.insert('', tk.END, values=(
-                proceso.nombre,
-                proceso.instante_llegada,
-                proceso.tiempo_cpu_total,
-                proceso.tiempo_finalizacion,
-                proceso.tiempo_retorno,
-                proceso.tiempo_espera,
-                f"{proceso.indice_servicio:.2f}"
-            ))
-            self.lista_procesos_historial.insert(tk.END, f"PID: {proceso.pid} - Nombre: {proceso.nombre} - Tiempo Final: {proceso.tiempo_finalizacion}")
+        # Las vistas virtualizadas solo materializan las filas visibles de la nueva simulación
+        self.treeview_metricas_por_proceso.actualizar(reiniciar=True)
+        self.lista_procesos_historial.actualizar(reiniciar=True)
 
     def crear_widgets(self):
         main_frame = ttk.Frame(self.master, padding="10")
@@ -338,6 +406,7 @@ class SimuladorApp:
         frame_crear_proceso.grid_columnconfigure(1, weight=1)
         frame_crear_proceso.grid_columnconfigure(3, weight=1)
         frame_crear_proceso.grid_columnconfigure(5, weight=1)
+        frame_crear_proceso.grid_columnconfigure(7, weight=1)
 
         ttk.Label(frame_crear_proceso, text="Nombre:").grid(row=0, column=0, padx=2, pady=2, sticky="w")
         self.entry_nombre = ttk.Entry(frame_crear_proceso)
@@ -351,23 +420,51 @@ class SimuladorApp:
         self.entry_instante_llegada = ttk.Entry(frame_crear_proceso)
         self.entry_instante_llegada.grid(row=0, column=5, padx=2, pady=2, sticky="ew")
 
-        ttk.Button(frame_crear_proceso, text="Añadir Proceso", command=self.anadir_proceso).grid(row=0, column=6, padx=10, pady=2)
+        ttk.Label(frame_crear_proceso, text="Prioridad:").grid(row=0, column=6, padx=2, pady=2, sticky="w")
+        self.entry_prioridad = ttk.Entry(frame_crear_proceso, width=5)
+        self.entry_prioridad.grid(row=0, column=7, padx=2, pady=2, sticky="ew")
+
+        ttk.Button(frame_crear_proceso, text="Añadir Proceso", command=self.anadir_proceso).grid(row=0, column=8, padx=10, pady=2)
+        ttk.Button(frame_crear_proceso, text="Cargar Archivo...", command=self.cargar_archivo).grid(row=0, column=9, padx=2, pady=2)
         
         # --- Fila 1: Configuración de Simulación ---
         frame_algoritmo = ttk.LabelFrame(main_frame, text="Configuración de Simulación", padding="10")
         frame_algoritmo.grid(row=1, column=0, columnspan=2, padx=5, pady=5, sticky="ew")
 
-        algoritmos = ["FCFS", "SJF", "SRTF", "Round Robin"]
+        algoritmos = list(nombres_politicas())
         self.algoritmo_var.set(algoritmos[0])
         
         ttk.Label(frame_algoritmo, text="Algoritmo:").grid(row=0, column=0, padx=2, pady=2, sticky="w")
         opcion_menu_algoritmo = ttk.OptionMenu(frame_algoritmo, self.algoritmo_var, algoritmos[0], *algoritmos)
         opcion_menu_algoritmo.grid(row=0, column=1, padx=2, pady=2, sticky="ew")
         
-        ttk.Label(frame_algoritmo, text="Quantum (RR):").grid(row=0, column=2, padx=2, pady=2, sticky="w")
+        ttk.Label(frame_algoritmo, text="Quantum:").grid(row=0, column=2, padx=2, pady=2, sticky="w")
         ttk.Entry(frame_algoritmo, textvariable=self.quantum, width=5).grid(row=0, column=3, padx=2, pady=2, sticky="ew")
         
-        ttk.Button(frame_algoritmo, text="Iniciar Simulación", command=self.iniciar_simulacion).grid(row=0, column=4, padx=10, pady=2)
+        self.boton_iniciar = ttk.Button(frame_algoritmo, text="Iniciar Simulación", command=self.iniciar_simulacion)
+        self.boton_iniciar.grid(row=0, column=4, padx=10, pady=2)
+
+        ttk.Label(frame_algoritmo, text="Velocidad (u/s):").grid(row=0, column=5, padx=2, pady=2, sticky="w")
+        ttk.Entry(frame_algoritmo, textvariable=self.velocidad_animacion, width=6).grid(row=0, column=6, padx=2, pady=2, sticky="ew")
+
+        ttk.Label(frame_algoritmo, text="Instante:").grid(row=1, column=0, padx=2, pady=2, sticky="w")
+        self.escala_animacion = ttk.Scale(frame_algoritmo, from_=0, to=1, orient=tk.HORIZONTAL,
+                                          variable=self.instante_animacion_var, command=self.desplazar_animacion)
+        self.escala_animacion.grid(row=1, column=1, columnspan=6, padx=2, pady=2, sticky="ew")
+        frame_algoritmo.grid_columnconfigure(6, weight=1)
+
+        ttk.Label(frame_algoritmo, text="Núcleos:").grid(row=2, column=0, padx=2, pady=2, sticky="w")
+        ttk.Spinbox(frame_algoritmo, from_=1, to=64, textvariable=self.nucleos, width=5).grid(row=2, column=1, padx=2, pady=2, sticky="w")
+        ttk.Label(frame_algoritmo, text="Colas:").grid(row=2, column=2, padx=2, pady=2, sticky="w")
+        ttk.OptionMenu(frame_algoritmo, self.colas_var, MODOS_COLAS[0], *MODOS_COLAS).grid(row=2, column=3, padx=2, pady=2, sticky="ew")
+        ttk.Label(frame_algoritmo, text="Costo cambio:").grid(row=2, column=5, padx=2, pady=2, sticky="w")
+        ttk.Spinbox(frame_algoritmo, from_=0, to=100, textvariable=self.costo_cambio, width=5).grid(row=2, column=6, padx=2, pady=2, sticky="w")
+
+        ttk.Progressbar(frame_algoritmo, variable=self.progreso_var, maximum=100).grid(row=3, column=0, columnspan=2, padx=2, pady=2, sticky="ew")
+        self.label_progreso = ttk.Label(frame_algoritmo, text="")
+        self.label_progreso.grid(row=3, column=2, columnspan=3, padx=2, pady=2, sticky="w")
+        self.boton_cancelar = ttk.Button(frame_algoritmo, text="Cancelar", command=self.cancelar_simulacion, state="disabled")
+        self.boton_cancelar.grid(row=3, column=5, padx=2, pady=2, sticky="w")
         
         # --- Fila 2: Listas y Gráficas ---
         main_frame.grid_rowconfigure(2, weight=1) 
@@ -378,21 +475,24 @@ class SimuladorApp:
         frame_listas.grid_rowconfigure(3, weight=1) 
 
         ttk.Label(frame_listas, text="Cola de Procesos Listos").grid(row=0, column=0, pady=2, sticky="ew")
-        self.lista_procesos_cola = tk.Listbox(frame_listas, height=10, width=50) 
+        self.lista_procesos_cola = ListaVirtual(frame_listas, lambda: len(self.simulador.tabla), self.fila_proceso,
+                                                filas_visibles=10, width=50)
         self.lista_procesos_cola.grid(row=1, column=0, sticky="nsew", padx=5, pady=2) 
         
         ttk.Label(frame_listas, text="Historial de Procesos Ejecutados").grid(row=2, column=0, pady=2, sticky="ew")
-        self.lista_procesos_historial = tk.Listbox(frame_listas, height=10) 
+        self.lista_procesos_historial = ListaVirtual(frame_listas, self.filas_resultados,
+                                                     self.fila_historial, filas_visibles=10)
         self.lista_procesos_historial.grid(row=3, column=0, sticky="nsew", padx=5, pady=2)
         
-        frame_metricas_y_gantt = ttk.Frame(main_frame)
+        frame_metricas_y_gantt = self.frame_metricas_y_gantt = ttk.Frame(main_frame)
         frame_metricas_y_gantt.grid(row=2, column=1, padx=5, pady=5, sticky="nsew")
         
         frame_metricas_y_gantt.grid_rowconfigure(0, weight=0) 
         frame_metricas_y_gantt.grid_rowconfigure(1, weight=0) 
         frame_metricas_y_gantt.grid_rowconfigure(2, weight=0) 
         frame_metricas_y_gantt.grid_rowconfigure(3, weight=0) 
-        frame_metricas_y_gantt.grid_rowconfigure(4, weight=1) # El canvas del Gantt por Proceso
+        frame_metricas_y_gantt.grid_rowconfigure(4, weight=0) 
+        frame_metricas_y_gantt.grid_rowconfigure(5, weight=1) # El canvas del Gantt por Proceso
         
         ttk.Label(frame_metricas_y_gantt, text="Métricas de Rendimiento", font=('Arial', 10, 'bold')).grid(row=0, column=0, pady=(5,2), sticky="w")
         
@@ -404,11 +504,13 @@ class SimuladorApp:
 
         self.label_indice_servicio_promedio = ttk.Label(frame_metricas_y_gantt, text="Índice de Servicio Promedio: 0.00")
         self.label_indice_servicio_promedio.grid(row=3, column=0, pady=1, sticky="w")
+
+        self.label_metricas_sistema = ttk.Label(frame_metricas_y_gantt, text="Makespan: 0 - Rendimiento: 0.000 proc/u - Utilización: 0.0%")
+        self.label_metricas_sistema.grid(row=4, column=0, pady=1, sticky="w")
         
-        self.canvas_gantt = FigureCanvasTkAgg(self.fig, master=frame_metricas_y_gantt)
-        self.canvas_gantt_widget = self.canvas_gantt.get_tk_widget()
-        # El canvas de Matplotlib ahora tiene ambos subplots
-        self.canvas_gantt_widget.grid(row=4, column=0, sticky="nsew")
+        # Lugar del canvas de los Gantt hasta la primera simulación
+        self.etiqueta_gantt_pendiente = ttk.Label(frame_metricas_y_gantt, text="Los diagramas de Gantt aparecerán al iniciar la simulación.")
+        self.etiqueta_gantt_pendiente.grid(row=5, column=0, sticky="nsew")
 
 
         # --- Fila 3: Tabla de Métricas por Proceso (Cuadrícula) ---
@@ -417,7 +519,9 @@ class SimuladorApp:
 
         columnas = ("proceso", "llegada", "cpu", "finalizacion", "retorno", "espera", "servicio")
         
-        self.treeview_metricas_por_proceso = ttk.Treeview(frame_tabla_detallada, columns=columnas, show='headings', height=6)
+        self.treeview_metricas_por_proceso = TablaVirtual(frame_tabla_detallada, columnas,
+                                                          self.filas_resultados,
+                                                          self.fila_metricas, filas_visibles=6)
         
         self.treeview_metricas_por_proceso.heading("proceso", text="Proceso")
         self.treeview_metricas_por_proceso.heading("llegada", text="Instante de llegada ($T_l$)")
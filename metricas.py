@@ -0,0 +1,151 @@
+# metricas.py
+"""Acumulación en línea de las métricas de los procesos terminados.
+
+Cada métrica guarda conteo, suma, media y varianza (Welford), mínimo y máximo, y un histograma
+logarítmico para los percentiles: la memoria no depende del número de procesos. Mientras hay pocos valores
+se guardan también tal cual y los percentiles son exactos.
+"""
+import math
+
+# Error relativo de los percentiles: cada cubeta del histograma abarca un factor (1 + PRECISION)
+PRECISION_HISTOGRAMA = 0.01
+PERCENTILES = (50, 95, 99)
+# Valores que se guardan exactos; a partir de aquí los percentiles salen del histograma
+LIMITE_EXACTO = 1024
+
+class EstadisticaEnLinea:
+    """Media, varianza y percentiles aproximados de una serie de valores no negativos."""
+
+    __slots__ = ("conteo", "suma", "media", "_m2", "minimo", "maximo", "ceros", "cubetas", "_log_base",
+                 "_valores", "_enteros")
+
+    def __init__(self, precision=PRECISION_HISTOGRAMA):
+        self.conteo = 0
+        self.suma = 0
+        self.media = 0.0
+        self._m2 = 0.0
+        self.minimo = None
+        self.maximo = None
+        self.ceros = 0
+        self.cubetas = {} # Índice de cubeta logarítmica -> conteo
+        self._log_base = math.log1p(precision)
+        self._valores = [] # None cuando se supera LIMITE_EXACTO
+        self._enteros = True
+
+    def agregar(self, valor):
+        self.conteo += 1
+        self.suma += valor
+        delta = valor - self.media
+        self.media += delta / self.conteo
+        self._m2 += delta * (valor - self.media)
+        if self.minimo is None or valor < self.minimo:
+            self.minimo = valor
+        if self.maximo is None or valor > self.maximo:
+            self.maximo = valor
+        if valor <= 0:
+            self.ceros += 1
+        else:
+            cubeta = math.floor(math.log(valor) / self._log_base)
+            self.cubetas[cubeta] = self.cubetas.get(cubeta, 0) + 1
+        if self._valores is not None:
+            if self.conteo <= LIMITE_EXACTO:
+                self._valores.append(valor)
+            else:
+                self._valores = None
+        if self._enteros and not float(valor).is_integer():
+            self._enteros = False
+
+    def copia(self):
+        copia = EstadisticaEnLinea.__new__(EstadisticaEnLinea)
+        for atributo in self.__slots__:
+            setattr(copia, atributo, getattr(self, atributo))
+        copia.cubetas = dict(self.cubetas)
+        if self._valores is not None:
+            copia._valores = list(self._valores)
+        return copia
+
+    def promedio(self):
+        # Suma / conteo da exactamente el mismo promedio que sumar los valores en orden
+        return self.suma / self.conteo if self.conteo else 0
+
+    def varianza(self):
+        return self._m2 / self.conteo if self.conteo else 0.0
+
+    def desviacion(self):
+        return math.sqrt(self.varianza())
+
+    def percentil(self, q):
+        """Valor bajo el que queda el q % de las observaciones: exacto con hasta LIMITE_EXACTO valores y, después,
+        con error relativo <= PRECISION_HISTOGRAMA / 2, sin salirse nunca de los valores posibles de su cubeta."""
+        if not self.conteo:
+            return 0
+        objetivo = max(1, math.ceil(q / 100 * self.conteo))
+        if objetivo >= self.conteo:
+            return self.maximo
+        if self._valores is not None:
+            return sorted(self._valores)[objetivo - 1]
+        acumulado = self.ceros
+        if acumulado >= objetivo:
+            return 0
+        for cubeta in sorted(self.cubetas):
+            acumulado += self.cubetas[cubeta]
+            if acumulado >= objetivo:
+                # Centro geométrico de la cubeta, acotado por los extremos observados; si todos los valores
+                # son enteros, el entero más cercano dentro de la cubeta
+                valor = math.exp((cubeta + 0.5) * self._log_base)
+                if self._enteros:
+                    menor = math.ceil(math.exp(cubeta * self._log_base))
+                    mayor = max(menor, math.ceil(math.exp((cubeta + 1) * self._log_base)) - 1)
+                    valor = min(max(round(valor), menor), mayor)
+                return min(max(valor, self.minimo), self.maximo)
+        return self.maximo
+
+class AcumuladorMetricas:
+    """Métricas de tiempo de retorno, espera e índice de servicio actualizadas al terminar cada proceso."""
+
+    __slots__ = ("retorno", "espera", "indice_servicio", "ultima_finalizacion")
+
+    def __init__(self):
+        self.retorno = EstadisticaEnLinea()
+        self.espera = EstadisticaEnLinea()
+        self.indice_servicio = EstadisticaEnLinea()
+        self.ultima_finalizacion = 0
+
+    def registrar(self, tiempo_finalizacion, tiempo_cpu, instante_llegada):
+        """Registra un proceso terminado con las mismas fórmulas que Proceso.calcular_metricas."""
+        tiempo_retorno = tiempo_finalizacion - instante_llegada
+        self.retorno.agregar(tiempo_retorno)
+        self.espera.agregar(max(tiempo_retorno - tiempo_cpu, 0))
+        self.indice_servicio.agregar(tiempo_cpu / tiempo_retorno if tiempo_retorno > 0 else 0.0)
+        if tiempo_finalizacion > self.ultima_finalizacion:
+            self.ultima_finalizacion = tiempo_finalizacion
+
+    def copia(self):
+        """Copia independiente del estado acumulado (para los puntos de control del simulador)."""
+        copia = AcumuladorMetricas.__new__(AcumuladorMetricas)
+        copia.retorno = self.retorno.copia()
+        copia.espera = self.espera.copia()
+        copia.indice_servicio = self.indice_servicio.copia()
+        copia.ultima_finalizacion = self.ultima_finalizacion
+        return copia
+
+    def __len__(self):
+        return self.retorno.conteo
+
+    def promedios(self):
+        """(retorno, espera, índice de servicio) promedio, como Simulador.calcular_metricas."""
+        return self.retorno.promedio(), self.espera.promedio(), self.indice_servicio.promedio()
+
+    def resumen(self):
+        """Diccionario con media, desviación, mínimo, máximo y percentiles de cada métrica."""
+        resumen = {}
+        for nombre in ("retorno", "espera", "indice_servicio"):
+            estadistica = getattr(self, nombre)
+            resumen[nombre] = {
+                "media": estadistica.promedio(),
+                "desviacion": estadistica.desviacion(),
+                "minimo": estadistica.minimo,
+                "maximo": estadistica.maximo,
+                **{f"p{q}": estadistica.percentil(q) for q in PERCENTILES},
+            }
+        return resumen
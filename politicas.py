@@ -0,0 +1,296 @@
+# politicas.py
+"""Registro de políticas de planificación: Simulador.ejecutar, la interfaz y la CLI las buscan por nombre.
+
+Además de FCFS, SJF, SRTF y Round Robin (los motores de Simulador), incluye colas multinivel con
+realimentación (MLFQ), HRRN y prioridades con envejecimiento, todas sobre montículos para escalar a
+cientos de miles de procesos. Una política nueva se añade con `registrar_politica`.
+"""
+from array import array
+from collections import deque
+
+from linea_tiempo import INACTIVO
+
+# Niveles de MLFQ: el quantum del nivel k es quantum * 2**k y el último nivel no baja más
+NIVELES_MLFQ = 3
+# Unidades de espera con las que un proceso mejora un nivel de prioridad
+ENVEJECIMIENTO = 10
+
+class Politica:
+    """Política de planificación de un núcleo.
+
+    `ejecutar(simulador, quantum, punto)` simula la tabla del simulador desde cero con las mismas piezas que
+    los algoritmos de Simulador: `simulador._reset_simulacion()` devuelve los índices por orden de llegada,
+    los tramos se añaden a `simulador.historial_ejecucion_visual`, cada proceso se cierra con
+    `simulador._finalizar(indice, instante)` y el bucle llama a `simulador._latido()` para el progreso.
+    `punto` solo lo usan las políticas con puntos de control.
+    """
+
+    nombre = None
+    alias = () # Otros nombres aceptados en la línea de comandos (sin distinguir mayúsculas)
+    usa_quantum = False
+    multinucleo = False # La simula también Simulador.ejecutar_multinucleo (varios núcleos y costos de cambio)
+
+    def ejecutar(self, simulador, quantum, punto=None):
+        raise NotImplementedError
+
+    def parametros(self):
+        """Parámetros propios de la política que cambian su resultado (forman parte de la clave de la caché)."""
+        return {}
+
+class PoliticaSimulador(Politica):
+    """Uno de los algoritmos propios de Simulador (FCFS, SJF, SRTF o Round Robin), llamado por su método."""
+
+    multinucleo = True
+
+    def __init__(self, nombre, metodo, usa_quantum=False, alias=()):
+        self.nombre = nombre
+        self.metodo = metodo
+        self.usa_quantum = usa_quantum
+        self.alias = alias
+
+    def ejecutar(self, simulador, quantum, punto=None):
+        if self.usa_quantum:
+            return getattr(simulador, self.metodo)(quantum, punto)
+        return getattr(simulador, self.metodo)(punto)
+
+class MLFQ(Politica):
+    """Colas multinivel con realimentación sobre un único montículo con clave (nivel, orden de entrada).
+
+    Los procesos llegan al nivel 0; quien agota su quantum baja un nivel y una llegada expropia a un proceso
+    de un nivel inferior, que vuelve al final de su nivel sin bajar. Dentro de un nivel es Round Robin.
+    """
+
+    nombre = "MLFQ"
+    usa_quantum = True
+
+    def __init__(self, niveles=NIVELES_MLFQ):
+        self.niveles = niveles
+
+    def parametros(self):
+        return {"niveles": self.niveles}
+
+    def ejecutar(self, simulador, quantum, punto=None):
+        procesos_para_simular = simulador._reset_simulacion()
+        tabla = simulador.tabla
+        llegadas, restante, inicio = tabla.llegadas, tabla.restante, tabla.inicio
+        linea = simulador.historial_ejecucion_visual
+        nivel = array('q', [0]) * len(tabla)
+        ultimo_nivel = self.niveles - 1
+        procesos_pendientes = deque(procesos_para_simular)
+        cola_listos = simulador._cola_prioridad(clave=nivel.__getitem__)
+        tiempo_actual = 0
+        latido = simulador._latido()
+
+        while procesos_pendientes or cola_listos:
+            latido -= 1
+            if not latido:
+                latido = simulador._latido()
+            while procesos_pendientes and llegadas[procesos_pendientes[0]] <= tiempo_actual:
+                cola_listos.agregar(procesos_pendientes.popleft())
+
+            if not cola_listos:
+                tiempo_siguiente_llegada = llegadas[procesos_pendientes[0]]
+                linea.agregar(tiempo_actual, tiempo_siguiente_llegada, INACTIVO)
+                tiempo_actual = tiempo_siguiente_llegada
+                continue
+
+            proceso_actual = cola_listos.extraer()
+            if inicio[proceso_actual] == -1:
+                inicio[proceso_actual] = tiempo_actual
+            fin_rodaja = tiempo_actual + min(restante[proceso_actual], quantum << nivel[proceso_actual])
+            # Fuera del nivel 0, la siguiente llegada (que entra en el nivel 0) corta la rodaja
+            expropiado = (nivel[proceso_actual] > 0 and procesos_pendientes
+                          and llegadas[procesos_pendientes[0]] < fin_rodaja)
+            if expropiado:
+                fin_rodaja = llegadas[procesos_pendientes[0]]
+
+            linea.agregar(tiempo_actual, fin_rodaja, proceso_actual + 1)
+            restante[proceso_actual] -= fin_rodaja - tiempo_actual
+            tiempo_actual = fin_rodaja
+
+            # Como en Round Robin, las llegadas de la rodaja se encolan antes que el proceso expropiado
+            while procesos_pendientes and llegadas[procesos_pendientes[0]] <= tiempo_actual:
+                cola_listos.agregar(procesos_pendientes.popleft())
+
+            if restante[proceso_actual] == 0:
+                simulador._finalizar(proceso_actual, tiempo_actual)
+            else:
+                if not expropiado and nivel[proceso_actual] < ultimo_nivel:
+                    nivel[proceso_actual] += 1
+                cola_listos.agregar(proceso_actual)
+
+class HRRN(Politica):
+    """Highest Response Ratio Next: no expropiativo; despacha el proceso con mayor (espera + CPU) / CPU.
+
+    Las razones cambian con el tiempo; la cola (ver colas.ColaRazonRespuesta) solo recoloca un proceso
+    cuando su razón alcanza la de su padre en el montículo, así que cada despacho cuesta O(log n) amortizado.
+    """
+
+    nombre = "HRRN"
+
+    def ejecutar(self, simulador, quantum, punto=None):
+        procesos_para_simular = simulador._reset_simulacion()
+        tabla = simulador.tabla
+        llegadas, cpu, inicio = tabla.llegadas, tabla.cpu, tabla.inicio
+        linea = simulador.historial_ejecucion_visual
+        procesos_pendientes = deque(procesos_para_simular)
+        cola_listos = simulador._cola_razon_respuesta(llegadas, cpu)
+        tiempo_actual = 0
+        latido = simulador._latido()
+
+        while procesos_pendientes or cola_listos:
+            latido -= 1
+            if not latido:
+                latido = simulador._latido()
+            while procesos_pendientes and llegadas[procesos_pendientes[0]] <= tiempo_actual:
+                cola_listos.agregar(procesos_pendientes.popleft(), tiempo_actual)
+
+            if not cola_listos:
+                tiempo_siguiente_llegada = llegadas[procesos_pendientes[0]]
+                linea.agregar(tiempo_actual, tiempo_siguiente_llegada, INACTIVO)
+                tiempo_actual = tiempo_siguiente_llegada
+                continue
+
+            proceso_actual = cola_listos.extraer(tiempo_actual)
+            inicio[proceso_actual] = tiempo_actual
+            inicio_ejecucion = tiempo_actual
+            tiempo_actual += cpu[proceso_actual]
+            simulador._finalizar(proceso_actual, tiempo_actual)
+            linea.agregar(inicio_ejecucion, tiempo_actual, proceso_actual + 1)
+
+class PrioridadEnvejecimiento(Politica):
+    """Prioridad expropiativa (menor valor = más prioritario) con envejecimiento por niveles.
+
+    El nivel de un proceso en cola es su prioridad menos un punto por cada `envejecimiento` unidades completas
+    de espera. Solo envejece la espera: el proceso en CPU conserva el nivel con el que se despachó, y uno
+    expropiado vuelve a la cola con su prioridad base. Uno en cola solo expropia al de la CPU si su nivel es
+    estrictamente mejor. Los procesos que entraron en la cola con el mismo resto módulo `envejecimiento` suben
+    de nivel en los mismos instantes y su orden relativo no cambia: hay un montículo por resto, y el tramo en
+    CPU se corta en el primer salto de nivel que deja a alguno por delante del proceso en CPU.
+    """
+
+    nombre = "Prioridad"
+    alias = ("PRIO",)
+
+    def __init__(self, envejecimiento=ENVEJECIMIENTO):
+        if envejecimiento <= 0:
+            raise ValueError("El intervalo de envejecimiento debe ser positivo.")
+        self.envejecimiento = envejecimiento
+
+    def parametros(self):
+        return {"envejecimiento": self.envejecimiento}
+
+    def ejecutar(self, simulador, quantum, punto=None):
+        procesos_para_simular = simulador._reset_simulacion()
+        tabla = simulador.tabla
+        llegadas, prioridades, restante, inicio = tabla.llegadas, tabla.prioridades, tabla.restante, tabla.inicio
+        linea = simulador.historial_ejecucion_visual
+        envejecimiento = self.envejecimiento
+        en_cola_desde = array('q', llegadas)
+        procesos_pendientes = deque(procesos_para_simular)
+        # Nivel en el instante t: clave(i) - (t - resto) // envejecimiento, con resto = en_cola_desde[i] % envejecimiento
+        clave = lambda i: prioridades[i] + en_cola_desde[i] // envejecimiento
+        colas = {} # Resto -> montículo de los procesos en cola con ese resto (solo los no vacíos)
+        tiempo_actual = 0
+        proceso_ejecutandose = None
+        nivel_ejecutandose = 0 # Nivel con el que se despachó el proceso en CPU, que no envejece
+
+        def encolar(proceso):
+            resto = en_cola_desde[proceso] % envejecimiento
+            cola = colas.get(resto)
+            if cola is None:
+                cola = colas[resto] = simulador._cola_prioridad(clave=clave)
+            cola.agregar(proceso)
+
+        def mejor_en_cola():
+            # (nivel, entrada en la cola, resto) del primero; a igual nivel gana quien entró antes
+            return min((cola.clave_minima() - (tiempo_actual - resto) // envejecimiento,
+                        en_cola_desde[cola.primero()], resto) for resto, cola in colas.items())
+
+        def desencolar(resto):
+            cola = colas[resto]
+            proceso = cola.extraer()
+            if not cola:
+                del colas[resto]
+            return proceso
+
+        latido = simulador._latido()
+
+        while procesos_pendientes or colas or proceso_ejecutandose is not None:
+            latido -= 1
+            if not latido:
+                latido = simulador._latido()
+            while procesos_pendientes and llegadas[procesos_pendientes[0]] <= tiempo_actual:
+                encolar(procesos_pendientes.popleft())
+
+            if proceso_ejecutandose is None:
+                if not colas:
+                    tiempo_siguiente_llegada = llegadas[procesos_pendientes[0]]
+                    linea.agregar(tiempo_actual, tiempo_siguiente_llegada, INACTIVO)
+                    tiempo_actual = tiempo_siguiente_llegada
+                    continue
+                nivel_ejecutandose, _, resto = mejor_en_cola()
+                proceso_ejecutandose = desencolar(resto)
+            elif colas:
+                nivel, _, resto = mejor_en_cola()
+                if nivel < nivel_ejecutandose:
+                    expropiado = proceso_ejecutandose
+                    proceso_ejecutandose, nivel_ejecutandose = desencolar(resto), nivel
+                    en_cola_desde[expropiado] = tiempo_actual
+                    encolar(expropiado)
+
+            if inicio[proceso_ejecutandose] == -1:
+                inicio[proceso_ejecutandose] = tiempo_actual
+
+            # Ejecuta hasta terminar, hasta la siguiente llegada o hasta que el primero de una cola lo supere
+            tiempo_fin_tramo = tiempo_actual + restante[proceso_ejecutandose]
+            if procesos_pendientes:
+                tiempo_fin_tramo = min(tiempo_fin_tramo, llegadas[procesos_pendientes[0]])
+            for resto, cola in colas.items():
+                # El primero de la cola baja al nivel clave - k en el instante resto + k * envejecimiento; ninguno
+                # supera ahora al proceso en CPU, así que el primer instante en que lo hace es posterior
+                saltos = cola.clave_minima() - nivel_ejecutandose + 1
+                tiempo_fin_tramo = min(tiempo_fin_tramo, resto + saltos * envejecimiento)
+
+            linea.agregar(tiempo_actual, tiempo_fin_tramo, proceso_ejecutandose + 1)
+            restante[proceso_ejecutandose] -= tiempo_fin_tramo - tiempo_actual
+            tiempo_actual = tiempo_fin_tramo
+
+            if restante[proceso_ejecutandose] == 0:
+                simulador._finalizar(proceso_ejecutandose, tiempo_actual)
+                proceso_ejecutandose = None
+
+# Políticas registradas por nombre, en el orden en que se muestran
+POLITICAS = {}
+
+def registrar_politica(politica):
+    """Añade una política al registro; su nombre no puede estar ya en uso."""
+    if politica.nombre in POLITICAS:
+        raise ValueError(f"Ya hay una política registrada con el nombre '{politica.nombre}'.")
+    POLITICAS[politica.nombre] = politica
+    return politica
+
+def obtener_politica(nombre):
+    try:
+        return POLITICAS[nombre]
+    except KeyError:
+        raise ValueError(f"Algoritmo desconocido: {nombre}") from None
+
+def nombres_politicas():
+    return tuple(POLITICAS)
+
+def resolver_nombre(nombre):
+    """Nombre registrado que corresponde a `nombre` o a uno de sus alias, sin distinguir mayúsculas."""
+    buscado = nombre.upper()
+    for politica in POLITICAS.values():
+        if buscado == politica.nombre.upper() or buscado in (alias.upper() for alias in politica.alias):
+            return politica.nombre
+    raise ValueError(f"Algoritmo desconocido: {nombre}")
+
+registrar_politica(PoliticaSimulador("FCFS", "ejecutar_fcfs"))
+registrar_politica(PoliticaSimulador("SJF", "ejecutar_sjf"))
+registrar_politica(PoliticaSimulador("SRTF", "ejecutar_srtf"))
+registrar_politica(PoliticaSimulador("Round Robin", "ejecutar_round_robin", usa_quantum=True, alias=("RR",)))
+registrar_politica(MLFQ())
+registrar_politica(HRRN())
+registrar_politica(PrioridadEnvejecimiento())
@@ -3,13 +3,20 @@ import math
 
 class Proceso:
     siguiente_pid = 1
+
+    __slots__ = ("pid", "nombre", "tiempo_cpu_total", "instante_llegada", "prioridad", "tiempo_restante",
+                 "tiempo_inicio_ejecucion", "tiempo_finalizacion", "tiempo_retorno", "tiempo_espera", "indice_servicio")
     
-    def __init__(self, nombre, tiempo_cpu, instante_llegada):
-        self.pid = Proceso.siguiente_pid
-        Proceso.siguiente_pid += 1
+    def __init__(self, nombre, tiempo_cpu, instante_llegada, pid=None, prioridad=0):
+        # Si no se indica el PID (p. ej. al materializar una fila de TablaProcesos), se asigna el siguiente
+        if pid is None:
+            pid = Proceso.siguiente_pid
+            Proceso.siguiente_pid += 1
+        self.pid = pid
         self.nombre = nombre
         self.tiempo_cpu_total = tiempo_cpu       # Tiempo de CPU original requerido (T_CPU)
         self.instante_llegada = instante_llegada # Instante de llegada (T_l)
+        self.prioridad = prioridad               # Menor valor = más prioritario (solo lo usa la política "Prioridad")
         self.tiempo_restante = tiempo_cpu        # Tiempo de CPU restante para la simulación
         
         self.tiempo_inicio_ejecucion = -1
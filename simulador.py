@@ -1,202 +1,695 @@
 # simulador.py
 import math
-# Asume que la clase Proceso está en el archivo proceso.py
-from proceso import Proceso 
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque, namedtuple
+from contextlib import nullcontext
+from itertools import islice
+from operator import attrgetter
+from tabla_procesos import TablaProcesos
+from linea_tiempo import LineaTiempo, INACTIVO, CAMBIO
+from colas import ColaFIFO, ColaPrioridad, ColaRazonRespuesta
+from eventos import EjecucionIncremental
+from cache import ResultadoCache, clave_simulacion
+from cargas import leer_columnas
+from metricas import AcumuladorMetricas
+from politicas import obtener_politica
+
+# Algoritmos propios del simulador, los únicos con varios núcleos y costos de cambio; la lista completa de
+# políticas (con MLFQ, HRRN y prioridades) está en el registro de politicas.py
+ALGORITMOS = ("FCFS", "SJF", "SRTF", "Round Robin")
+# Disposición de las colas de listos con varios núcleos: una cola compartida, una por núcleo con robo de
+# trabajo entre núcleos, o una por núcleo sin robo (cada proceso se queda en el núcleo asignado al llegar)
+MODOS_COLAS = ("global", "por_nucleo", "por_nucleo_sin_robo")
+
+MetricasSistema = namedtuple("MetricasSistema", ["nucleos", "makespan", "rendimiento", "utilizacion",
+                                                 "utilizacion_nucleos", "migraciones", "cambios", "tiempo_cambios"])
+
+# Iteraciones de un motor entre dos llamadas a Simulador.progreso (y, con ellas, comprobaciones de cancelación)
+ITERACIONES_PROGRESO = 4096
+
+class SimulacionCancelada(Exception):
+    """La lanza la función de progreso para interrumpir una simulación en curso."""
+
+# Sobrecarga de planificación en unidades de tiempo: cambio de contexto entre dos procesos distintos,
+# latencia de cada despacho y calentamiento de caché cuando un proceso cambia de núcleo
+CostosCambio = namedtuple("CostosCambio", ["cambio", "despacho", "migracion"], defaults=(0, 0, 0))
+
+# Estado de un algoritmo de un núcleo al empezar una iteración: instante, primer proceso sin admitir (posición en
+# el orden de llegada), cola de listos en orden de inserción, proceso en CPU (-1 si ninguno), tiempo restante e
+# inicio de los procesos en cola y en CPU, longitud del historial y de la línea de tiempo con sus métricas parciales,
+# y número de orden del punto en la ejecución
+PuntoControl = namedtuple("PuntoControl", ["tiempo", "pendiente", "cola", "ejecutando", "restantes", "inicios",
+                                           "finalizados", "tramos", "fin_ultimo_tramo", "acumulador", "numero"])
+# Mínimo de iteraciones entre dos puntos de control; con una cola de listos más larga, el intervalo es su longitud
+INTERVALO_MINIMO_PUNTOS = 256
 
 class Simulador:
     """Clase principal del simulador de planificación de procesos."""
 
-    def __init__(self):
-        self.cola_llegadas = []
-        self.historial_ejecucion = []
-        self.historial_ejecucion_visual = {} # {tiempo: nombre_proceso}
+    def __init__(self, cache=None, registrar_historial=True, instrumentacion=None, puntos_control=False):
+        self.tabla = TablaProcesos()
+        self.cache = cache # CacheSimulaciones opcional (ver cache.py)
+        self.instrumentacion = instrumentacion # Instrumentacion opcional (ver instrumentacion.py)
+        # Función opcional progreso(terminados, total), llamada desde el bucle de los motores al empezar y cada
+        # ITERACIONES_PROGRESO iteraciones, aunque no termine ningún proceso; puede leer el estado parcial (las
+        # líneas de tiempo) y lanzar SimulacionCancelada para interrumpir la ejecución (la tabla queda a medio simular)
+        self.progreso = None
+        # Sin historial, los algoritmos solo actualizan el acumulador de métricas al terminar cada proceso
+        self.registrar_historial = registrar_historial
+        self.historial_ejecucion = array('q') # Índices en la tabla, en orden de finalización
+        self.acumulador = AcumuladorMetricas()
+        self.historial_ejecucion_visual = LineaTiempo() # Tramos (inicio, fin, pid) del núcleo 0
+        self.lineas_nucleos = [self.historial_ejecucion_visual] # Una línea de tiempo por núcleo
+        self.migraciones = 0
+        # Con puntos de control, los algoritmos de un núcleo guardan su estado periódicamente y, si tras la
+        # ejecución solo se agregan procesos posteriores a un punto, la siguiente ejecución se reanuda desde él
+        self.puntos_control = puntos_control
+        self._puntos = []
+        self._firma_puntos = None # (algoritmo, quantum, procesos, historial) de la ejecución que guardó los puntos
+        self._periodo_puntos = 0
+
+    def agregar_proceso(self, nombre, tiempo_cpu, instante_llegada, prioridad=0):
+        # NOTA: La tabla asigna el PID (índice + 1) al agregar el proceso.
+        return self.tabla.agregar(nombre, tiempo_cpu, instante_llegada, prioridad)
 
-    def agregar_proceso(self, nombre, tiempo_cpu, instante_llegada):
-        # NOTA: Al agregar un proceso, la clase Proceso maneja la asignación de PID.
-        proceso = Proceso(nombre, tiempo_cpu, instante_llegada)
-        self.cola_llegadas.append(proceso)
+    def agregar_procesos(self, procesos):
+        """Agrega en bloque un iterable de tuplas (nombre, tiempo_cpu, instante_llegada[, prioridad]); devuelve el rango de PID."""
+        nombres, tiempos_cpu, instantes_llegada, prioridades = [], array('q'), array('q'), array('q')
+        try:
+            for nombre, tiempo_cpu, instante_llegada, *prioridad in procesos:
+                tiempos_cpu.append(tiempo_cpu)
+                instantes_llegada.append(instante_llegada)
+                prioridades.append(prioridad[0] if prioridad else 0)
+                nombres.append(nombre)
+        except TypeError:
+            raise ValueError(f"Proceso {len(nombres) + 1}: el tiempo de CPU, la llegada y la prioridad deben ser enteros.") from None
+        return self.tabla.extender(nombres, tiempos_cpu, instantes_llegada, prioridades)
+
+    def agregar_columnas(self, nombres, tiempos_cpu, instantes_llegada, prioridades=None):
+        """Agrega en bloque procesos dados por columnas (listas, array o arreglos de NumPy)."""
+        return self.tabla.extender(nombres, tiempos_cpu, instantes_llegada, prioridades)
+
+    def cargar_carga(self, ruta, formato=None):
+        """Agrega todos los procesos de un archivo de carga CSV o JSONL (ver cargas.leer_columnas)."""
+        return self.agregar_columnas(*leer_columnas(ruta, formato))
 
     def _reset_simulacion(self):
-        """Prepara el simulador para una nueva ejecución, clonando los procesos y reiniciando el estado."""
-        self.historial_ejecucion = []
-        self.historial_ejecucion_visual = {}
-        
-        # Clonar procesos para que los originales en cola_llegadas no se alteren
-        procesos_clonados = []
-        Proceso.siguiente_pid = 1 # Resetear el contador de PID antes de clonar
-        for p in self.cola_llegadas:
-            # Crea una nueva instancia de Proceso con los datos originales
-            proceso_clon = Proceso(p.nombre, p.tiempo_cpu_total, p.instante_llegada)
-            procesos_clonados.append(proceso_clon)
-            
-        # Ordenar los procesos por llegada para la simulación
-        procesos_clonados.sort(key=lambda p: p.instante_llegada)
-        return procesos_clonados
-    
+        """Prepara el simulador para una nueva ejecución reiniciando solo las columnas mutables de la tabla."""
+        with self._fase("reinicio"):
+            self.historial_ejecucion = array('q')
+            self.acumulador = AcumuladorMetricas()
+            self.historial_ejecucion_visual = LineaTiempo()
+            self.lineas_nucleos = [self.historial_ejecucion_visual]
+            self.migraciones = 0
+            self._puntos = []
+            self._firma_puntos = None
+            self._periodo_puntos = INTERVALO_MINIMO_PUNTOS if self.puntos_control else 0
+            self.tabla.reiniciar()
+
+            # Índices de los procesos ordenados por llegada para la simulación
+            return self.tabla.orden_llegada()
+
+    def _preparar(self, punto):
+        """Estado inicial de un algoritmo de un núcleo: desde cero o desde un punto de control.
+
+        Devuelve el orden de llegada, el instante inicial, cuántos procesos de ese orden ya se admitieron, la
+        cola de listos y el proceso en CPU.
+        """
+        if punto is None:
+            return self._reset_simulacion(), 0, 0, (), None
+        with self._fase("reanudacion"):
+            self._reanudar(punto)
+        return (self.tabla.orden_llegada(), punto.tiempo, punto.pendiente, punto.cola,
+                punto.ejecutando if punto.ejecutando >= 0 else None)
+
+    def _reanudar(self, punto):
+        """Devuelve la tabla, el historial y las métricas al estado guardado en `punto`, en tiempo proporcional a la cola."""
+        tabla = self.tabla
+        cpu, restante, inicio, finalizacion = tabla.cpu, tabla.restante, tabla.inicio, tabla.finalizacion
+        # Los procesos sin admitir vuelven a su estado inicial; los terminados antes del punto no cambian
+        for i in islice(tabla.orden_llegada(), punto.pendiente, None):
+            restante[i] = cpu[i]
+            inicio[i] = -1
+            finalizacion[i] = -1
+        activos = punto.cola if punto.ejecutando < 0 else punto.cola + array('q', [punto.ejecutando])
+        for i, tiempo_restante, tiempo_inicio in zip(activos, punto.restantes, punto.inicios):
+            restante[i] = tiempo_restante
+            inicio[i] = tiempo_inicio
+            finalizacion[i] = -1
+        del self.historial_ejecucion[punto.finalizados:]
+        self.historial_ejecucion_visual.truncar(punto.tramos, punto.fin_ultimo_tramo)
+        self.acumulador = punto.acumulador.copia()
+
+    def _guardar_punto(self, tiempo, pendiente, cola, ejecutando=None):
+        """Guarda el estado actual como punto de control y devuelve las iteraciones hasta el siguiente.
+
+        El intervalo nunca es menor que la cola copiada, así que guardar cuesta O(1) amortizado por iteración
+        aunque el sistema esté cargado. Los puntos antiguos se aclaran exponencialmente: a una distancia de d
+        puntos del último solo se conservan los de número múltiplo de ~d/8, de modo que quedan O(log n) puntos
+        y el anterior a cualquier instante está como mucho a vez y media de su distancia al final (el costo de
+        reanudar es proporcional a lo que queda por simular).
+        """
+        numero = self._puntos[-1].numero + 1 if self._puntos else 1
+        procesos = array('q', cola.en_orden_insercion() if cola else ())
+        activos = procesos if ejecutando is None else procesos + array('q', [ejecutando])
+        restante, inicio = self.tabla.restante, self.tabla.inicio
+        linea = self.historial_ejecucion_visual
+        self._puntos.append(PuntoControl(tiempo, pendiente, procesos, -1 if ejecutando is None else ejecutando,
+                                         array('q', (restante[i] for i in activos)),
+                                         array('q', (inicio[i] for i in activos)),
+                                         len(self.historial_ejecucion), len(linea), linea.fin, self.acumulador.copia(),
+                                         numero))
+        self._puntos = [punto for punto in self._puntos
+                        if punto.numero % (1 << max(0, (numero - punto.numero).bit_length() - 3)) == 0]
+        return max(INTERVALO_MINIMO_PUNTOS, len(procesos))
+
+    def _punto_reanudacion(self, algoritmo, quantum):
+        """Último punto de control de la ejecución anterior desde el que se puede reanudar, o None.
+
+        Sirve si la ejecución anterior tenía los mismos parámetros y desde entonces solo se agregaron procesos
+        que llegan después del punto: hasta ese instante la planificación no puede cambiar.
+        """
+        if self._firma_puntos is None:
+            return None
+        algoritmo_anterior, quantum_anterior, procesos, registrar_historial = self._firma_puntos
+        if ((algoritmo_anterior, quantum_anterior, registrar_historial) != (algoritmo, quantum, self.registrar_historial)
+                or len(self.tabla) <= procesos):
+            return None
+        primera_llegada = min(islice(self.tabla.llegadas, procesos, None))
+        ultimo = bisect_left(self._puntos, primera_llegada, key=attrgetter("tiempo")) - 1
+        if ultimo < 0:
+            return None
+        # Los puntos posteriores dejan de valer; los anteriores siguen sirviendo para la próxima edición
+        del self._puntos[ultimo + 1:]
+        self._firma_puntos = None
+        return self._puntos[ultimo]
+
+    def _latido(self):
+        """Llama a la función de progreso desde el bucle de un motor y devuelve las iteraciones hasta la siguiente.
+
+        Sin función de progreso devuelve 0: el contador del motor pasa a negativo y no vuelve a llamar.
+        """
+        if self.progreso is None:
+            return 0
+        self.progreso(len(self.acumulador), len(self.tabla))
+        return ITERACIONES_PROGRESO
+
+    def _fase(self, nombre):
+        """Fase medida por la instrumentación, o un contexto vacío si no hay instrumentación."""
+        if self.instrumentacion is None:
+            return nullcontext()
+        return self.instrumentacion.fase(nombre)
+
+    def _cola_fifo(self, elementos=()):
+        if self.instrumentacion is None:
+            return ColaFIFO(elementos)
+        return self.instrumentacion.cola_fifo(elementos)
+
+    def _cola_prioridad(self, clave):
+        if self.instrumentacion is None:
+            return ColaPrioridad(clave=clave)
+        return self.instrumentacion.cola_prioridad(clave)
+
+    def _cola_razon_respuesta(self, llegadas, cpu):
+        if self.instrumentacion is None:
+            return ColaRazonRespuesta(llegadas, cpu)
+        return self.instrumentacion.cola_razon_respuesta(llegadas, cpu)
+
+    def nombres_por_pid(self):
+        """Relaciona los PID de la última simulación con sus nombres para traducir la línea de tiempo."""
+        nombres = self.tabla.nombres
+        return {i + 1: nombres[i] for i in self.historial_ejecucion}
+
+    def procesos_finalizados(self):
+        """Procesos terminados en la última simulación, en orden de finalización, como objetos Proceso."""
+        return (self.tabla.proceso(i) for i in self.historial_ejecucion)
+
     # [MODIFICACIÓN CLAVE]: Devuelve los 3 promedios, incluyendo el Índice de Servicio.
     def calcular_metricas(self):
-        """Calcula las métricas promedio a partir de los procesos terminados, incluyendo el índice de servicio."""
-        
-        for p in self.historial_ejecucion:
-            p.calcular_metricas() # Aseguramos que el índice individual esté calculado
-             
-        total_tiempo_retorno = sum(p.tiempo_retorno for p in self.historial_ejecucion)
-        total_tiempo_espera = sum(p.tiempo_espera for p in self.historial_ejecucion)
-        total_indice_servicio = sum(p.indice_servicio for p in self.historial_ejecucion)
-        
-        num_procesos = len(self.historial_ejecucion)
-        
-        promedio_retorno = total_tiempo_retorno / num_procesos if num_procesos > 0 else 0
-        promedio_espera = total_tiempo_espera / num_procesos if num_procesos > 0 else 0
-        promedio_indice_servicio = total_indice_servicio / num_procesos if num_procesos > 0 else 0
-        
+        """Métricas promedio de los procesos terminados, incluyendo el índice de servicio.
+
+        Se leen del acumulador que los algoritmos actualizan al terminar cada proceso (ver metricas.py), sin
+        recorrer el historial; `self.acumulador.resumen()` añade desviación y percentiles p50/p95/p99.
+        """
         # [CORREGIDO] Retorna los 3 valores: Retorno, Espera, Índice de Servicio
-        return promedio_retorno, promedio_espera, promedio_indice_servicio
+        with self._fase("metricas"):
+            return self.acumulador.promedios()
+
+    def metricas_sistema(self):
+        """Makespan, rendimiento (procesos por unidad de tiempo) y utilización global y por núcleo.
+
+        La utilización solo cuenta el tiempo de los procesos; los cambios de contexto se informan aparte
+        (número de tramos de cambio y tiempo total que ocupan).
+        """
+        makespan = self.acumulador.ultima_finalizacion
+        with self._fase("metricas"):
+            ocupado = [sum(fin - inicio for inicio, fin, pid in linea if pid > INACTIVO) for linea in self.lineas_nucleos]
+            cambios = [(inicio, fin) for linea in self.lineas_nucleos for inicio, fin, pid in linea if pid == CAMBIO]
+        tiempo_cambios = sum(fin - inicio for inicio, fin in cambios)
+        nucleos = len(self.lineas_nucleos)
+        if makespan == 0:
+            return MetricasSistema(nucleos, 0, 0.0, 0.0, [0.0] * nucleos, self.migraciones, len(cambios), tiempo_cambios)
+        return MetricasSistema(nucleos, makespan, len(self.acumulador) / makespan,
+                               sum(ocupado) / (nucleos * makespan), [t / makespan for t in ocupado], self.migraciones,
+                               len(cambios), tiempo_cambios)
+
+    def instante_final(self):
+        """Último instante registrado en las líneas de tiempo de todos los núcleos."""
+        return max((linea.fin for linea in self.lineas_nucleos if linea), default=0)
+
+    def ejecutar(self, algoritmo, quantum=None, nucleos=1, colas="global", costos=None):
+        """Ejecuta la política indicada por su nombre (ver politicas.POLITICAS) sobre `nucleos` CPU.
+
+        `costos` (CostosCambio) añade la sobrecarga de cada cambio de contexto como tramos CAMBIO en la línea
+        de tiempo; sin costos los algoritmos tratan el despacho como gratuito. Con una caché asignada, si la misma carga ya se simuló con los mismos parámetros se restaura el resultado.
+        """
+        instrumentacion = self.instrumentacion
+        if instrumentacion is None:
+            return self._ejecutar(algoritmo, quantum, nucleos, colas, costos)
+        with instrumentacion.ejecucion(algoritmo, quantum, nucleos, colas):
+            self._ejecutar(algoritmo, quantum, nucleos, colas, costos)
+            instrumentacion.contar_lineas(self.lineas_nucleos)
+
+    def _ejecutar(self, algoritmo, quantum, nucleos, colas, costos):
+        politica = obtener_politica(algoritmo)
+        if politica.usa_quantum and (quantum is None or quantum <= 0):
+            raise ValueError("El quantum debe ser positivo.")
+        if nucleos < 1:
+            raise ValueError("El número de núcleos debe ser positivo.")
+        if colas not in MODOS_COLAS:
+            raise ValueError(f"Disposición de colas desconocida: {colas}")
+        costos = CostosCambio(*costos) if costos else CostosCambio()
+        if any(costo < 0 for costo in costos):
+            raise ValueError("Los costos de cambio de contexto no pueden ser negativos.")
+        un_nucleo = nucleos == 1 and not any(costos)
+        if not (un_nucleo or politica.multinucleo):
+            raise ValueError(f"{algoritmo} solo se simula con un núcleo y sin costos de cambio.")
+        clave = None
+        if self.cache is not None and self.registrar_historial:
+            clave = clave_simulacion(self.tabla, algoritmo, quantum, nucleos, colas, costos)
+            with self._fase("cache"):
+                resultado = self.cache.obtener(clave)
+                if resultado is not None:
+                    self._restaurar(resultado)
+            if resultado is not None:
+                return
+
+        # Los puntos de control solo los guardan los algoritmos de un núcleo sin costos de cambio
+        quantum_puntos = quantum if politica.usa_quantum else None
+        punto = self._punto_reanudacion(algoritmo, quantum_puntos) if un_nucleo else None
+        with self._fase("planificacion"):
+            if un_nucleo:
+                politica.ejecutar(self, quantum, punto)
+            else:
+                # Los costos de cambio solo se modelan en el motor por eventos, que con un núcleo equivale a los demás
+                self.ejecutar_multinucleo(algoritmo, quantum, nucleos, colas, costos)
+        if self.puntos_control and un_nucleo:
+            self._firma_puntos = (algoritmo, quantum_puntos, len(self.tabla), self.registrar_historial)
+
+        if clave is not None:
+            self.cache.guardar(clave, self._resultado_cache())
+
+    def _resultado_cache(self):
+        tabla = self.tabla
+        inicios, fines, pids = array('q'), array('q'), array('q')
+        for linea in self.lineas_nucleos:
+            inicios.extend(linea.inicios)
+            fines.extend(linea.fines)
+            pids.extend(linea.pids)
+        return ResultadoCache(array('q', self.historial_ejecucion), inicios, fines, pids,
+                              array('q', (len(linea) for linea in self.lineas_nucleos)), array('q', tabla.restante),
+                              array('q', tabla.inicio), array('q', tabla.finalizacion), array('q', [self.migraciones]))
+
+    def _restaurar(self, resultado):
+        """Copia un resultado de la caché en los historiales y las columnas mutables de la tabla."""
+        self.historial_ejecucion = array('q', resultado.historial)
+        self.lineas_nucleos = []
+        desde = 0
+        for num_tramos in resultado.tramos_nucleo:
+            linea = LineaTiempo()
+            linea.inicios.extend(resultado.inicios[desde:desde + num_tramos])
+            linea.fines.extend(resultado.fines[desde:desde + num_tramos])
+            linea.pids.extend(resultado.pids[desde:desde + num_tramos])
+            self.lineas_nucleos.append(linea)
+            desde += num_tramos
+        self.historial_ejecucion_visual = self.lineas_nucleos[0]
+        self.migraciones = resultado.migraciones[0]
+        self.tabla.restante[:] = resultado.restante
+        self.tabla.inicio = array('q', resultado.inicio)
+        self.tabla.finalizacion = array('q', resultado.finalizacion)
+        self.acumulador = AcumuladorMetricas()
+        self._puntos = []
+        self._firma_puntos = None
+        tabla = self.tabla
+        for i in self.historial_ejecucion:
+            self.acumulador.registrar(tabla.finalizacion[i], tabla.cpu[i], tabla.llegadas[i])
+
+    def pasos(self, algoritmo, quantum=None):
+        """Ejecución incremental sobre los procesos de la tabla: un iterador de Evento (ver eventos.py).
+
+        No modifica la tabla ni los historiales; admite `inyectar` para añadir procesos durante la ejecución.
+        """
+        tabla = self.tabla
+        procesos = ((tabla.nombres[i], tabla.cpu[i], tabla.llegadas[i], i + 1) for i in tabla.orden_llegada())
+        return EjecucionIncremental(algoritmo, quantum, procesos, primer_pid=len(tabla) + 1)
+
+    def _finalizar(self, indice, tiempo_actual):
+        tabla = self.tabla
+        tabla.restante[indice] = 0
+        tabla.finalizacion[indice] = tiempo_actual
+        self.acumulador.registrar(tiempo_actual, tabla.cpu[indice], tabla.llegadas[indice])
+        if self.registrar_historial:
+            self.historial_ejecucion.append(indice)
 
     # ------------------ ALGORITMOS NO PREVENTIVOS (FCFS, SJF) ------------------
 
-    def ejecutar_fcfs(self):
-        procesos_para_simular = self._reset_simulacion()
-        tiempo_actual = 0
-        
-        cola_listos = procesos_para_simular 
-        
+    def ejecutar_fcfs(self, punto=None):
+        procesos_para_simular, tiempo_actual, admitidos, _, _ = self._preparar(punto)
+        llegadas, cpu, inicio = self.tabla.llegadas, self.tabla.cpu, self.tabla.inicio
+        total_procesos = len(procesos_para_simular)
+
+        cola_listos = self._cola_fifo(procesos_para_simular[admitidos:])
+        iteraciones, periodo_puntos = 0, self._periodo_puntos
+        latido = self._latido()
+
         while cola_listos:
-            proceso_actual = cola_listos.pop(0)
+            latido -= 1
+            if not latido:
+                latido = self._latido()
+            iteraciones += 1
+            if iteraciones == periodo_puntos:
+                iteraciones = 0
+                periodo_puntos = self._guardar_punto(tiempo_actual, total_procesos - len(cola_listos), ())
+
+            proceso_actual = cola_listos.extraer()
 
-            if tiempo_actual < proceso_actual.instante_llegada:
-                self.historial_ejecucion_visual.update({i: "Inactivo" for i in range(tiempo_actual, proceso_actual.instante_llegada)})
-                tiempo_actual = proceso_actual.instante_llegada
+            if tiempo_actual < llegadas[proceso_actual]:
+                self.historial_ejecucion_visual.agregar(tiempo_actual, llegadas[proceso_actual], INACTIVO)
+                tiempo_actual = llegadas[proceso_actual]
 
-            proceso_actual.tiempo_inicio_ejecucion = tiempo_actual
+            inicio[proceso_actual] = tiempo_actual
             inicio_ejecucion = tiempo_actual
-            tiempo_actual += proceso_actual.tiempo_cpu_total # Uso de tiempo_cpu_total
-            
-            proceso_actual.tiempo_finalizacion = tiempo_actual
-            proceso_actual.calcular_metricas() 
-            
-            self.historial_ejecucion.append(proceso_actual)
-            self.historial_ejecucion_visual.update({i: proceso_actual.nombre for i in range(inicio_ejecucion, proceso_actual.tiempo_finalizacion)})
-
-    def ejecutar_sjf(self):
-        procesos_para_simular = self._reset_simulacion()
-        tiempo_actual = 0
-        procesos_pendientes = procesos_para_simular
-        cola_listos = []
-        
+            tiempo_actual += cpu[proceso_actual]
+
+            self._finalizar(proceso_actual, tiempo_actual)
+            self.historial_ejecucion_visual.agregar(inicio_ejecucion, tiempo_actual, proceso_actual + 1)
+
+    def ejecutar_sjf(self, punto=None):
+        procesos_para_simular, tiempo_actual, admitidos, en_cola, _ = self._preparar(punto)
+        llegadas, cpu, inicio = self.tabla.llegadas, self.tabla.cpu, self.tabla.inicio
+        total_procesos = len(procesos_para_simular)
+        procesos_pendientes = deque(procesos_para_simular[admitidos:])
+        # SJF ordena por tiempo_cpu_total
+        cola_listos = self._cola_prioridad(clave=lambda i: (cpu[i], llegadas[i]))
+        cola_listos.extender(en_cola)
+        iteraciones, periodo_puntos = 0, self._periodo_puntos
+        latido = self._latido()
+
         while procesos_pendientes or cola_listos:
-            while procesos_pendientes and procesos_pendientes[0].instante_llegada <= tiempo_actual:
-                cola_listos.append(procesos_pendientes.pop(0))
-                
-            if cola_listos:
-                # SJF ordena por tiempo_cpu_total
-                cola_listos.sort(key=lambda p: (p.tiempo_cpu_total, p.instante_llegada))
-                proceso_ejecutandose = cola_listos.pop(0)
+            latido -= 1
+            if not latido:
+                latido = self._latido()
+            iteraciones += 1
+            if iteraciones == periodo_puntos:
+                iteraciones = 0
+                periodo_puntos = self._guardar_punto(tiempo_actual, total_procesos - len(procesos_pendientes),
+                                                     cola_listos)
 
-                if tiempo_actual < proceso_ejecutandose.instante_llegada:
-                    self.historial_ejecucion_visual.update({i: "Inactivo" for i in range(tiempo_actual, proceso_ejecutandose.instante_llegada)})
-                    tiempo_actual = proceso_ejecutandose.instante_llegada
+            while procesos_pendientes and llegadas[procesos_pendientes[0]] <= tiempo_actual:
+                cola_listos.agregar(procesos_pendientes.popleft())
 
-                proceso_ejecutandose.tiempo_inicio_ejecucion = tiempo_actual
+            if cola_listos:
+                proceso_ejecutandose = cola_listos.extraer()
+
+                inicio[proceso_ejecutandose] = tiempo_actual
                 inicio_ejecucion = tiempo_actual
-                tiempo_actual += proceso_ejecutandose.tiempo_cpu_total # Uso de tiempo_cpu_total
-                
-                proceso_ejecutandose.tiempo_finalizacion = tiempo_actual
-                proceso_ejecutandose.calcular_metricas()
+                tiempo_actual += cpu[proceso_ejecutandose]
 
-                self.historial_ejecucion.append(proceso_ejecutandose)
-                self.historial_ejecucion_visual.update({i: proceso_ejecutandose.nombre for i in range(inicio_ejecucion, proceso_ejecutandose.tiempo_finalizacion)})
+                self._finalizar(proceso_ejecutandose, tiempo_actual)
+                self.historial_ejecucion_visual.agregar(inicio_ejecucion, tiempo_actual, proceso_ejecutandose + 1)
             else:
                 if procesos_pendientes:
-                    tiempo_siguiente_llegada = procesos_pendientes[0].instante_llegada
-                    self.historial_ejecucion_visual.update({i: "Inactivo" for i in range(tiempo_actual, tiempo_siguiente_llegada)})
+                    tiempo_siguiente_llegada = llegadas[procesos_pendientes[0]]
+                    self.historial_ejecucion_visual.agregar(tiempo_actual, tiempo_siguiente_llegada, INACTIVO)
                     tiempo_actual = tiempo_siguiente_llegada
                 else:
                     break
 
     # ------------------ ALGORITMOS PREVENTIVOS (SRTF, Round Robin) ------------------
-    
-    def ejecutar_srtf(self):
-        procesos_para_simular = self._reset_simulacion()
-        tiempo_actual = 0
-        procesos_pendientes = procesos_para_simular
-        cola_listos = []
-        proceso_ejecutandose = None
-
-        while procesos_pendientes or cola_listos or proceso_ejecutandose:
-            while procesos_pendientes and procesos_pendientes[0].instante_llegada <= tiempo_actual:
-                cola_listos.append(procesos_pendientes.pop(0))
-            
-            if proceso_ejecutandose and proceso_ejecutandose.tiempo_restante > 0:
-                cola_listos.append(proceso_ejecutandose)
-                
-            proximo_proceso_elegido = None
-            if cola_listos:
-                cola_listos.sort(key=lambda p: (p.tiempo_restante, p.instante_llegada))
-                proximo_proceso_elegido = cola_listos.pop(0)
 
-            proceso_ejecutandose = proximo_proceso_elegido
-            
+    def ejecutar_srtf(self, punto=None):
+        """SRTF dirigido por eventos: solo despierta en la siguiente llegada o en la siguiente finalización."""
+        procesos_para_simular, tiempo_actual, admitidos, en_cola, proceso_ejecutandose = self._preparar(punto)
+        llegadas, restante, inicio = self.tabla.llegadas, self.tabla.restante, self.tabla.inicio
+        total_procesos = len(procesos_para_simular)
+        procesos_pendientes = deque(procesos_para_simular[admitidos:])
+        # La clave se evalúa al insertar, así que el proceso expropiado se reinserta con su tiempo restante actual
+        cola_listos = self._cola_prioridad(clave=lambda i: (restante[i], llegadas[i]))
+        cola_listos.extender(en_cola)
+        iteraciones, periodo_puntos = 0, self._periodo_puntos
+        latido = self._latido()
+
+        while procesos_pendientes or cola_listos or proceso_ejecutandose is not None:
+            latido -= 1
+            if not latido:
+                latido = self._latido()
+            iteraciones += 1
+            if iteraciones == periodo_puntos:
+                iteraciones = 0
+                periodo_puntos = self._guardar_punto(tiempo_actual, total_procesos - len(procesos_pendientes),
+                                                     cola_listos, proceso_ejecutandose)
+
+            while procesos_pendientes and llegadas[procesos_pendientes[0]] <= tiempo_actual:
+                cola_listos.agregar(procesos_pendientes.popleft())
+
             if proceso_ejecutandose is None:
-                if procesos_pendientes:
-                    tiempo_siguiente_llegada = procesos_pendientes[0].instante_llegada
-                    self.historial_ejecucion_visual.update({i: "Inactivo" for i in range(tiempo_actual, tiempo_siguiente_llegada)})
-                    tiempo_actual = tiempo_siguiente_llegada
-                    continue
-                else:
-                    break
-            
-            if proceso_ejecutandose.tiempo_inicio_ejecucion == -1:
-                proceso_ejecutandose.tiempo_inicio_ejecucion = tiempo_actual 
-
-            self.historial_ejecucion_visual[tiempo_actual] = proceso_ejecutandose.nombre
-            proceso_ejecutandose.tiempo_restante -= 1
-            
-            if proceso_ejecutandose.tiempo_restante == 0:
-                proceso_ejecutandose.tiempo_finalizacion = tiempo_actual + 1
-                proceso_ejecutandose.calcular_metricas()
-                self.historial_ejecucion.append(proceso_ejecutandose)
+                if not cola_listos:
+                    if procesos_pendientes:
+                        tiempo_siguiente_llegada = llegadas[procesos_pendientes[0]]
+                        self.historial_ejecucion_visual.agregar(tiempo_actual, tiempo_siguiente_llegada, INACTIVO)
+                        tiempo_actual = tiempo_siguiente_llegada
+                        continue
+                    else:
+                        break
+                proceso_ejecutandose = cola_listos.extraer()
+            elif cola_listos and cola_listos.clave_minima() < (restante[proceso_ejecutandose], llegadas[proceso_ejecutandose]):
+                # Expropiación: una llegada tiene menos tiempo restante que el proceso en CPU
+                cola_listos.agregar(proceso_ejecutandose)
+                proceso_ejecutandose = cola_listos.extraer()
+
+            if inicio[proceso_ejecutandose] == -1:
+                inicio[proceso_ejecutandose] = tiempo_actual
+
+            # Ejecuta hasta la siguiente llegada o hasta que el proceso termine
+            tiempo_fin_tramo = tiempo_actual + restante[proceso_ejecutandose]
+            if procesos_pendientes:
+                tiempo_fin_tramo = min(tiempo_fin_tramo, llegadas[procesos_pendientes[0]])
+
+            self.historial_ejecucion_visual.agregar(tiempo_actual, tiempo_fin_tramo, proceso_ejecutandose + 1)
+            restante[proceso_ejecutandose] -= tiempo_fin_tramo - tiempo_actual
+            tiempo_actual = tiempo_fin_tramo
+
+            if restante[proceso_ejecutandose] == 0:
+                self._finalizar(proceso_ejecutandose, tiempo_actual)
                 proceso_ejecutandose = None
-            
-            tiempo_actual += 1
 
 
-    def ejecutar_round_robin(self, quantum):
-        procesos_para_simular = self._reset_simulacion()
-        tiempo_actual = 0
-        procesos_pendientes = procesos_para_simular
-        cola_rr = []
+    def ejecutar_round_robin(self, quantum, punto=None):
+        """Round Robin por bloques: cada rodaja de quantum se avanza de una vez, sin recorrerla tick a tick."""
+        orden, tiempo_actual, admitidos, en_cola, _ = self._preparar(punto)
+        restante, inicio = self.tabla.restante, self.tabla.inicio
+        # Solo los procesos aún sin admitir (todos, salvo al reanudar desde un punto de control)
+        procesos_para_simular = orden[admitidos:]
+        # Instantes de llegada ordenados: las llegadas de cada rodaja se admiten con una sola bisección
+        llegadas = [self.tabla.llegadas[i] for i in procesos_para_simular]
+        total_procesos = len(procesos_para_simular)
+        indice_pendiente = 0
+        cola_rr = self._cola_fifo(en_cola)
+        iteraciones, periodo_puntos = 0, self._periodo_puntos
+        latido = self._latido()
+
+        while indice_pendiente < total_procesos or cola_rr:
+            latido -= 1
+            if not latido:
+                latido = self._latido()
+            iteraciones += 1
+            if iteraciones == periodo_puntos:
+                iteraciones = 0
+                periodo_puntos = self._guardar_punto(tiempo_actual, admitidos + indice_pendiente, cola_rr)
+
+            limite = bisect_right(llegadas, tiempo_actual, indice_pendiente)
+            cola_rr.extender(procesos_para_simular[indice_pendiente:limite])
+            indice_pendiente = limite
 
-        while procesos_pendientes or cola_rr:
-            while procesos_pendientes and procesos_pendientes[0].instante_llegada <= tiempo_actual:
-                cola_rr.append(procesos_pendientes.pop(0))
-            
             if not cola_rr:
-                if procesos_pendientes:
-                    tiempo_siguiente_llegada = procesos_pendientes[0].instante_llegada
-                    self.historial_ejecucion_visual.update({i: "Inactivo" for i in range(tiempo_actual, tiempo_siguiente_llegada)})
+                if indice_pendiente < total_procesos:
+                    tiempo_siguiente_llegada = llegadas[indice_pendiente]
+                    self.historial_ejecucion_visual.agregar(tiempo_actual, tiempo_siguiente_llegada, INACTIVO)
                     tiempo_actual = tiempo_siguiente_llegada
                     continue
                 else:
                     break
 
-            proceso_actual = cola_rr.pop(0)
-            tiempo_ejecucion = min(proceso_actual.tiempo_restante, quantum)
-
-            if proceso_actual.tiempo_inicio_ejecucion == -1:
-                proceso_actual.tiempo_inicio_ejecucion = tiempo_actual
-            
-            for _ in range(tiempo_ejecucion):
-                self.historial_ejecucion_visual[tiempo_actual] = proceso_actual.nombre
-                tiempo_actual += 1
-                proceso_actual.tiempo_restante -= 1
-                
-                while procesos_pendientes and procesos_pendientes[0].instante_llegada == tiempo_actual:
-                    cola_rr.append(procesos_pendientes.pop(0))
-
-            if proceso_actual.tiempo_restante == 0:
-                proceso_actual.tiempo_finalizacion = tiempo_actual
-                proceso_actual.calcular_metricas()
-                self.historial_ejecucion.append(proceso_actual)
+            proceso_actual = cola_rr.extraer()
+            tiempo_ejecucion = min(restante[proceso_actual], quantum)
+
+            if inicio[proceso_actual] == -1:
+                inicio[proceso_actual] = tiempo_actual
+
+            self.historial_ejecucion_visual.agregar(tiempo_actual, tiempo_actual + tiempo_ejecucion, proceso_actual + 1)
+            tiempo_actual += tiempo_ejecucion
+            restante[proceso_actual] -= tiempo_ejecucion
+
+            # Los que llegan durante la rodaja (incluido su último instante) se encolan antes que el proceso expropiado
+            limite = bisect_right(llegadas, tiempo_actual, indice_pendiente)
+            cola_rr.extender(procesos_para_simular[indice_pendiente:limite])
+            indice_pendiente = limite
+
+            if restante[proceso_actual] == 0:
+                self._finalizar(proceso_actual, tiempo_actual)
             else:
-                cola_rr.append(proceso_actual)
\ No newline at end of file
+                cola_rr.agregar(proceso_actual)
+
+    # ------------------ VARIOS NÚCLEOS ------------------
+
+    def ejecutar_multinucleo(self, algoritmo, quantum, nucleos, colas="global", costos=None):
+        """Cualquiera de los cuatro algoritmos sobre varios núcleos, dirigido por eventos.
+
+        Con `colas="global"` todos los núcleos comparten una cola de listos y, en SRTF, se ejecutan siempre los
+        procesos con menos tiempo restante. Con colas por núcleo, cada llegada va al núcleo menos cargado y un
+        núcleo sin trabajo roba el siguiente proceso de la cola más larga (salvo en "por_nucleo_sin_robo").
+
+        Con `costos`, cada despacho de un proceso distinto del que ocupaba el núcleo pasa antes por un tramo
+        CAMBIO (latencia de despacho, más el cambio de contexto si el núcleo venía de otro proceso, más el
+        calentamiento si el proceso migra). El tramo no se interrumpe y la rodaja de RR empieza al terminarlo.
+        """
+        costo_cambio, latencia_despacho, penalizacion_migracion = costos or CostosCambio()
+        procesos_para_simular = self._reset_simulacion()
+        llegadas, cpu, restante, inicio = self.tabla.llegadas, self.tabla.cpu, self.tabla.restante, self.tabla.inicio
+        self.lineas_nucleos = [LineaTiempo() for _ in range(nucleos)]
+        self.historial_ejecucion_visual = self.lineas_nucleos[0]
+        lineas = self.lineas_nucleos
+
+        if algoritmo in ("FCFS", "Round Robin"):
+            nueva_cola = self._cola_fifo
+        elif algoritmo == "SJF":
+            nueva_cola = lambda: self._cola_prioridad(clave=lambda i: (cpu[i], llegadas[i]))
+        else:
+            nueva_cola = lambda: self._cola_prioridad(clave=lambda i: (restante[i], llegadas[i]))
+        cola_global = colas == "global"
+        colas_listos = [nueva_cola() for _ in range(1 if cola_global else nucleos)]
+        cola_de = (lambda n: colas_listos[0]) if cola_global else (lambda n: colas_listos[n])
+        robo_trabajo = colas == "por_nucleo"
+
+        ejecutando = [None] * nucleos
+        fin_rodaja = [0] * nucleos
+        inicio_tramo = [0] * nucleos # Inicio del tramo abierto de cada núcleo (ejecución o inactividad)
+        listo = [0] * nucleos # Fin del cambio de contexto en curso: el proceso avanza a partir de ese instante
+        anterior = [None] * nucleos # Último proceso despachado en cada núcleo
+        ultimo_nucleo = array('q', [-1]) * len(self.tabla)
+        procesos_pendientes = deque(procesos_para_simular)
+        tiempo_actual = 0
+        quantum = quantum if algoritmo == "Round Robin" else None
+        latido = self._latido()
+
+        def liberar(n):
+            proceso = ejecutando[n]
+            lineas[n].agregar(inicio_tramo[n], tiempo_actual, proceso + 1)
+            inicio_tramo[n] = tiempo_actual
+            ejecutando[n] = None
+            return proceso
+
+        def despachar(n, proceso):
+            lineas[n].agregar(inicio_tramo[n], tiempo_actual, INACTIVO)
+            migra = ultimo_nucleo[proceso] not in (-1, n)
+            sobrecarga = 0
+            if anterior[n] != proceso: # El mismo proceso que sigue en su núcleo no paga el cambio
+                sobrecarga = latencia_despacho + (costo_cambio if anterior[n] is not None else 0)
+                sobrecarga += penalizacion_migracion if migra else 0
+            lineas[n].agregar(tiempo_actual, tiempo_actual + sobrecarga, CAMBIO)
+            listo[n] = inicio_tramo[n] = tiempo_actual + sobrecarga
+            if inicio[proceso] == -1:
+                inicio[proceso] = listo[n]
+            if migra:
+                self.migraciones += 1
+            ultimo_nucleo[proceso] = n
+            anterior[n] = proceso
+            ejecutando[n] = proceso
+            if quantum is not None:
+                fin_rodaja[n] = listo[n] + quantum
+
+        def clave_en_cpu(n):
+            return (restante[ejecutando[n]], llegadas[ejecutando[n]])
+
+        while True:
+            latido -= 1
+            if not latido:
+                latido = self._latido()
+            while procesos_pendientes and llegadas[procesos_pendientes[0]] <= tiempo_actual:
+                proceso = procesos_pendientes.popleft()
+                if cola_global:
+                    colas_listos[0].agregar(proceso)
+                else:
+                    # Al núcleo con menos trabajo (en cola más en ejecución); a igualdad, el de menor número
+                    destino = min(range(nucleos), key=lambda n: len(colas_listos[n]) + (ejecutando[n] is not None))
+                    colas_listos[destino].agregar(proceso)
+
+            for n in range(nucleos):
+                proceso = ejecutando[n]
+                if proceso is None:
+                    continue
+                if restante[proceso] == 0:
+                    self._finalizar(liberar(n), tiempo_actual)
+                elif quantum is not None and tiempo_actual == fin_rodaja[n]:
+                    # Las llegadas de la rodaja ya están en cola, por delante del proceso expropiado
+                    cola_de(n).agregar(liberar(n))
+                elif (algoritmo == "SRTF" and not cola_global and listo[n] <= tiempo_actual and cola_de(n)
+                      and cola_de(n).clave_minima() < clave_en_cpu(n)):
+                    cola_de(n).agregar(liberar(n))
+
+            for n in range(nucleos):
+                if ejecutando[n] is None and cola_de(n):
+                    despachar(n, cola_de(n).extraer())
+            if robo_trabajo:
+                for n in range(nucleos):
+                    if ejecutando[n] is None:
+                        victima = max(colas_listos, key=len)
+                        if victima:
+                            despachar(n, victima.extraer())
+
+            if algoritmo == "SRTF" and cola_global:
+                # Mientras haya un proceso en cola más corto que alguno en CPU, expropia al más largo
+                cola = colas_listos[0]
+                while cola and all(proceso is not None for proceso in ejecutando):
+                    # Un núcleo en pleno cambio de contexto no se expropia
+                    expropiables = [n for n in range(nucleos) if listo[n] <= tiempo_actual]
+                    if not expropiables:
+                        break
+                    n = max(expropiables, key=clave_en_cpu)
+                    if not cola.clave_minima() < clave_en_cpu(n):
+                        break
+                    cola.agregar(liberar(n))
+                    despachar(n, cola.extraer())
+
+            # Siguiente evento: una llegada, una finalización, el fin de una rodaja o el de un cambio de contexto
+            siguiente = llegadas[procesos_pendientes[0]] if procesos_pendientes else None
+            for n, proceso in enumerate(ejecutando):
+                if proceso is not None:
+                    fin_evento = max(tiempo_actual, listo[n]) + restante[proceso]
+                    if quantum is not None:
+                        fin_evento = min(fin_evento, fin_rodaja[n])
+                    if listo[n] > tiempo_actual:
+                        fin_evento = min(fin_evento, listo[n])
+                    if siguiente is None or fin_evento < siguiente:
+                        siguiente = fin_evento
+            if siguiente is None:
+                break
+
+            for n, proceso in enumerate(ejecutando):
+                if proceso is not None:
+                    # Solo avanza el tiempo posterior al cambio de contexto
+                    desde = max(tiempo_actual, listo[n])
+                    if siguiente > desde:
+                        restante[proceso] -= siguiente - desde
+            tiempo_actual = siguiente
@@ -0,0 +1,168 @@
+# tabla_procesos.py
+import hashlib
+import heapq
+from array import array
+from bisect import insort
+from itertools import islice
+from operator import le
+
+from proceso import Proceso
+
+class TablaProcesos:
+    """Tabla de procesos por columnas: cada proceso es un índice i y su PID es i + 1.
+
+    Las columnas estáticas (nombres, llegadas, cpu, prioridades) se escriben al agregar el proceso; las mutables
+    (restante, inicio, finalizacion) son las que modifican los algoritmos y las únicas que se
+    reinician entre ejecuciones, sin clonar objetos.
+    """
+
+    __slots__ = ("nombres", "llegadas", "cpu", "prioridades", "restante", "inicio", "finalizacion", "_orden_llegada", "_huella")
+
+    def __init__(self):
+        self.nombres = []
+        self.llegadas = array('q')
+        self.cpu = array('q')
+        self.prioridades = array('q') # Menor valor = más prioritario
+        self.restante = array('q')
+        self.inicio = array('q')
+        self.finalizacion = array('q')
+        self._orden_llegada = []
+        self._huella = None
+
+    def agregar(self, nombre, tiempo_cpu, instante_llegada, prioridad=0):
+        """Añade un proceso y devuelve su PID."""
+        indice = len(self.nombres)
+        self.nombres.append(nombre)
+        self.llegadas.append(instante_llegada)
+        self.cpu.append(tiempo_cpu)
+        self.prioridades.append(prioridad)
+        self.restante.append(tiempo_cpu)
+        self.inicio.append(-1)
+        self.finalizacion.append(-1)
+        self._huella = None
+
+        # El orden por llegada se mantiene incrementalmente; una llegada que retrocede se inserta
+        # tras las de su mismo instante para conservar el orden de inserción en los empates
+        if self._orden_llegada and instante_llegada < self.llegadas[self._orden_llegada[-1]]:
+            insort(self._orden_llegada, indice, key=self.llegadas.__getitem__)
+        else:
+            self._orden_llegada.append(indice)
+        return indice + 1
+
+    def extender(self, nombres, tiempos_cpu, instantes_llegada, prioridades=None):
+        """Añade un bloque de procesos dado por columnas y devuelve el rango de PID asignados.
+
+        Cada columna se valida de una pasada (nombres no vacíos, CPU > 0, llegada >= 0) antes de modificar
+        la tabla, así que un bloque con errores no deja procesos a medias. Acepta listas, `array` o arreglos
+        de NumPy de enteros; sin `prioridades`, todos los procesos tienen prioridad 0.
+        """
+        nombres = list(nombres)
+        cpu = _columna_enteros(tiempos_cpu)
+        llegadas = _columna_enteros(instantes_llegada)
+        n = len(nombres)
+        prioridades = array('q', [0]) * n if prioridades is None else _columna_enteros(prioridades)
+        if len(cpu) != n or len(llegadas) != n or len(prioridades) != n:
+            raise ValueError("Las columnas de nombres, CPU, llegada y prioridad deben tener la misma longitud.")
+        base = len(self.nombres)
+        if n == 0:
+            return range(base + 1, base + 1)
+
+        if not all(nombres):
+            raise ValueError(f"Proceso {next(i for i, nombre in enumerate(nombres) if not nombre) + 1}: nombre vacío.")
+        if min(cpu) <= 0:
+            raise ValueError(f"Proceso {next(i for i, t in enumerate(cpu) if t <= 0) + 1}: el tiempo de CPU debe ser positivo.")
+        if min(llegadas) < 0:
+            raise ValueError(f"Proceso {next(i for i, t in enumerate(llegadas) if t < 0) + 1}: la llegada no puede ser negativa.")
+
+        self.nombres.extend(nombres)
+        self.llegadas.extend(llegadas)
+        self.cpu.extend(cpu)
+        self.prioridades.extend(prioridades)
+        self.restante.extend(cpu)
+        pendientes = array('q', [-1]) * n
+        self.inicio.extend(pendientes)
+        self.finalizacion.extend(pendientes)
+        self._huella = None
+
+        nuevos = range(base, base + n)
+        # Un bloque ya ordenado (el caso habitual de una traza) no se reordena
+        if all(map(le, llegadas, islice(llegadas, 1, None))):
+            nuevos = list(nuevos)
+        else:
+            nuevos = sorted(nuevos, key=self.llegadas.__getitem__)
+        orden = self._orden_llegada
+        if not orden or self.llegadas[nuevos[0]] >= self.llegadas[orden[-1]]:
+            orden.extend(nuevos)
+        else:
+            # Mezcla estable: a igual llegada, los procesos anteriores van primero
+            self._orden_llegada = list(heapq.merge(orden, nuevos, key=self.llegadas.__getitem__))
+        return range(base + 1, base + n + 1)
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def __iter__(self):
+        """Itera los procesos en orden de inserción como objetos Proceso (vistas de solo lectura)."""
+        return (self.proceso(i) for i in range(len(self.nombres)))
+
+    @staticmethod
+    def pid(indice):
+        return indice + 1
+
+    def orden_llegada(self):
+        """Índices ordenados por instante de llegada; los empates conservan el orden de inserción."""
+        return self._orden_llegada
+
+    def huella(self):
+        """Resumen SHA-256 de las columnas estáticas (nombres, llegadas, CPU y prioridades), calculado una vez por contenido."""
+        if self._huella is None:
+            resumen = hashlib.sha256()
+            resumen.update("\0".join(self.nombres).encode("utf-8"))
+            resumen.update(b"\1")
+            resumen.update(self.llegadas.tobytes())
+            resumen.update(self.cpu.tobytes())
+            resumen.update(self.prioridades.tobytes())
+            self._huella = resumen.hexdigest()
+        return self._huella
+
+    def reiniciar(self):
+        """Restablece solo las columnas mutables para una nueva ejecución."""
+        n = len(self.nombres)
+        self.restante[:] = self.cpu
+        self.inicio = array('q', [-1]) * n
+        self.finalizacion = array('q', [-1]) * n
+
+    def metricas(self, indice):
+        """Tiempo de retorno, de espera e índice de servicio del proceso (ver Proceso.calcular_metricas)."""
+        if self.finalizacion[indice] == -1:
+            return 0, 0, 0.0
+        tiempo_retorno = self.finalizacion[indice] - self.llegadas[indice]
+        tiempo_espera = max(tiempo_retorno - self.cpu[indice], 0)
+        indice_servicio = self.cpu[indice] / tiempo_retorno if tiempo_retorno > 0 else 0.0
+        return tiempo_retorno, tiempo_espera, indice_servicio
+
+    def proceso(self, indice):
+        """Materializa la fila como un Proceso con sus métricas calculadas (para mostrar o exportar)."""
+        p = Proceso(self.nombres[indice], self.cpu[indice], self.llegadas[indice], pid=indice + 1,
+                    prioridad=self.prioridades[indice])
+        p.tiempo_restante = self.restante[indice]
+        p.tiempo_inicio_ejecucion = self.inicio[indice]
+        p.tiempo_finalizacion = self.finalizacion[indice]
+        p.calcular_metricas()
+        return p
+
+def _columna_enteros(valores):
+    """Convierte una columna a array('q'); los arreglos de NumPy se copian en bloque por su búfer."""
+    if isinstance(valores, array) and valores.typecode == 'q':
+        return valores
+    tipo = getattr(valores, "dtype", None)
+    if tipo is not None:
+        if tipo.kind not in "iu":
+            raise ValueError("El tiempo de CPU, la llegada y la prioridad deben ser enteros.")
+        columna = array('q')
+        columna.frombytes(valores.astype("int64").tobytes())
+        return columna
+    try:
+        return array('q', valores)
+    except (TypeError, OverflowError):
+        raise ValueError("El tiempo de CPU, la llegada y la prioridad deben ser enteros.") from None
@@ -0,0 +1,94 @@
+# tareas.py
+"""Simulaciones en un hilo de fondo para que la interfaz siga respondiendo.
+
+El hilo nunca toca Tk ni deja que la interfaz lea el simulador a medio ejecutar: en cada llamada de progreso
+copia el avance (procesos terminados y tramos nuevos de las líneas de tiempo) en atributos que el hilo de la
+interfaz consulta con `master.after`.
+"""
+import threading
+from array import array
+
+from simulador import SimulacionCancelada
+
+class SimulacionEnSegundoPlano:
+    """Ejecuta `simulador.ejecutar(*argumentos)` en un hilo con progreso y cancelación.
+
+    Mientras `en_curso()` sea verdadero no se debe modificar la tabla de procesos del simulador ni leer sus
+    resultados: el avance se consulta con `fraccion()` y `tramos_nuevos()`. Tras una simulación cancelada o
+    fallida, `descartar()` (desde el hilo de la interfaz) deja el simulador sin resultados.
+    """
+
+    def __init__(self, simulador, *argumentos):
+        self.simulador = simulador
+        self.argumentos = argumentos
+        self.total = len(simulador.tabla)
+        self.terminados = 0
+        self.cancelada = False
+        self.error = None
+        self._cancelar = threading.Event()
+        self._cerrojo = threading.Lock()
+        self._tramos = [] # (núcleo, inicios, fines, pids) copiados por el hilo de la simulación
+        self._enviados = None # Tramos ya copiados de cada línea de tiempo
+        self._hilo = threading.Thread(target=self._ejecutar, name="simulacion", daemon=True)
+
+    def iniciar(self):
+        self._hilo.start()
+        return self
+
+    def cancelar(self):
+        """Pide la cancelación; el motor se detiene en su siguiente llamada de progreso."""
+        self._cancelar.set()
+
+    def en_curso(self):
+        return self._hilo.is_alive()
+
+    def esperar(self, tiempo=None):
+        self._hilo.join(tiempo)
+
+    def fraccion(self):
+        return self.terminados / self.total if self.total else 1.0
+
+    def tramos_nuevos(self):
+        """Tramos (núcleo, inicios, fines, pids) copiados desde la consulta anterior.
+
+        El primero de cada bloque repite el último del anterior, que pudo alargarse al fusionarse con otro.
+        """
+        with self._cerrojo:
+            tramos, self._tramos = self._tramos, []
+        return tramos
+
+    def descartar(self):
+        """Deja el simulador sin resultados tras una simulación cancelada o fallida (hilo de la interfaz)."""
+        self.esperar()
+        self.simulador._reset_simulacion()
+
+    def _progreso(self, terminados, total):
+        # Se ejecuta en el hilo de la simulación, con el motor detenido: las líneas no cambian mientras se copian
+        self.terminados = terminados
+        lineas = self.simulador.lineas_nucleos
+        if self._enviados is None:
+            self._enviados = [0] * len(lineas)
+        copias = []
+        for n, linea in enumerate(lineas):
+            desde = max(self._enviados[n] - 1, 0)
+            if len(linea) > desde:
+                copias.append((n, array('q', linea.inicios[desde:]), array('q', linea.fines[desde:]),
+                               array('q', linea.pids[desde:])))
+                self._enviados[n] = len(linea)
+        if copias:
+            with self._cerrojo:
+                self._tramos.extend(copias)
+        if self._cancelar.is_set():
+            raise SimulacionCancelada()
+
+    def _ejecutar(self):
+        self.simulador.progreso = self._progreso
+        try:
+            self.simulador.ejecutar(*self.argumentos)
+            self.terminados = len(self.simulador.acumulador)
+        except SimulacionCancelada:
+            self.cancelada = True
+        except Exception as e: # Se muestra en la interfaz al terminar
+            self.error = e
+        finally:
+            self.simulador.progreso = None
@@ -0,0 +1,176 @@
+"""Planificadores de referencia, unidad a unidad de tiempo, para comparar con los motores del simulador.
+
+FCFS, SJF, SRTF y Round Robin reproducen los algoritmos originales del proyecto (listas ordenadas en cada paso);
+los demás siguen la definición de cada política sin ninguna optimización. Cada función recibe una lista de
+(tiempo_cpu, instante_llegada, prioridad) y devuelve (finalizaciones por índice, {instante: pid}), con pid 0
+para la CPU inactiva entre procesos.
+"""
+from collections import deque
+
+def _por_llegada(procesos):
+    return deque(sorted(range(len(procesos)), key=lambda i: procesos[i][1]))
+
+def _inactivo(ticks, desde, hasta):
+    for t in range(desde, hasta):
+        ticks[t] = 0
+
+def fcfs(procesos):
+    return _no_expropiativo(procesos, lambda listos: listos[0])
+
+def sjf(procesos):
+    return _no_expropiativo(procesos, lambda listos: min(listos, key=lambda i: (procesos[i][0], procesos[i][1])))
+
+def hrrn(procesos):
+    def elegir(listos, t):
+        mejor = listos[0]
+        for i in listos[1:]:
+            # Razón (espera + cpu) / cpu comparada sin divisiones; a igualdad, el que llegó antes a la cola
+            if (t - procesos[i][1]) * procesos[mejor][0] > (t - procesos[mejor][1]) * procesos[i][0]:
+                mejor = i
+        return mejor
+    return _no_expropiativo(procesos, elegir, con_tiempo=True)
+
+def _no_expropiativo(procesos, elegir, con_tiempo=False):
+    pendientes = _por_llegada(procesos)
+    finalizacion, ticks, listos, t = [None] * len(procesos), {}, [], 0
+    while pendientes or listos:
+        while pendientes and procesos[pendientes[0]][1] <= t:
+            listos.append(pendientes.popleft())
+        if not listos:
+            _inactivo(ticks, t, procesos[pendientes[0]][1])
+            t = procesos[pendientes[0]][1]
+            continue
+        i = elegir(listos, t) if con_tiempo else elegir(listos)
+        listos.remove(i)
+        for _ in range(procesos[i][0]):
+            ticks[t] = i + 1
+            t += 1
+        finalizacion[i] = t
+    return finalizacion, ticks
+
+def srtf(procesos):
+    pendientes = _por_llegada(procesos)
+    restante = [cpu for cpu, _, _ in procesos]
+    finalizacion, ticks, listos, t, actual = [None] * len(procesos), {}, [], 0, None
+    while pendientes or listos or actual is not None:
+        while pendientes and procesos[pendientes[0]][1] <= t:
+            listos.append(pendientes.popleft())
+        if actual is not None:
+            listos.append(actual)
+        listos.sort(key=lambda i: (restante[i], procesos[i][1]))
+        actual = listos.pop(0) if listos else None
+        if actual is None:
+            _inactivo(ticks, t, procesos[pendientes[0]][1])
+            t = procesos[pendientes[0]][1]
+            continue
+        ticks[t] = actual + 1
+        restante[actual] -= 1
+        t += 1
+        if restante[actual] == 0:
+            finalizacion[actual] = t
+            actual = None
+    return finalizacion, ticks
+
+def round_robin(procesos, quantum):
+    pendientes = _por_llegada(procesos)
+    restante = [cpu for cpu, _, _ in procesos]
+    finalizacion, ticks, cola, t = [None] * len(procesos), {}, deque(), 0
+    while pendientes or cola:
+        while pendientes and procesos[pendientes[0]][1] <= t:
+            cola.append(pendientes.popleft())
+        if not cola:
+            _inactivo(ticks, t, procesos[pendientes[0]][1])
+            t = procesos[pendientes[0]][1]
+            continue
+        i = cola.popleft()
+        for _ in range(min(restante[i], quantum)):
+            ticks[t] = i + 1
+            t += 1
+            restante[i] -= 1
+            while pendientes and procesos[pendientes[0]][1] == t:
+                cola.append(pendientes.popleft())
+        if restante[i]:
+            cola.append(i)
+        else:
+            finalizacion[i] = t
+    return finalizacion, ticks
+
+def mlfq(procesos, quantum, niveles=3):
+    """Niveles con quantum q * 2**k; una llegada expropia a un proceso de nivel > 0, que no baja de nivel."""
+    pendientes = _por_llegada(procesos)
+    restante = [cpu for cpu, _, _ in procesos]
+    nivel = [0] * len(procesos)
+    colas = [deque() for _ in range(niveles)]
+    finalizacion, ticks, t, actual, usado = [None] * len(procesos), {}, 0, None, 0
+    while pendientes or actual is not None or any(colas):
+        llegadas = []
+        while pendientes and procesos[pendientes[0]][1] <= t:
+            llegadas.append(pendientes.popleft())
+        colas[0].extend(llegadas)
+        if actual is not None:
+            if restante[actual] == 0:
+                finalizacion[actual] = t
+                actual = None
+            elif usado == quantum << nivel[actual]:
+                nivel[actual] = min(nivel[actual] + 1, niveles - 1)
+                colas[nivel[actual]].append(actual)
+                actual = None
+            elif nivel[actual] > 0 and llegadas:
+                colas[nivel[actual]].append(actual)
+                actual = None
+        if actual is None:
+            cola = next((cola for cola in colas if cola), None)
+            if cola is None:
+                if pendientes:
+                    _inactivo(ticks, t, procesos[pendientes[0]][1])
+                    t = procesos[pendientes[0]][1]
+                continue
+            actual, usado = cola.popleft(), 0
+        ticks[t] = actual + 1
+        restante[actual] -= 1
+        usado += 1
+        t += 1
+    return finalizacion, ticks
+
+def prioridad(procesos, envejecimiento):
+    """Nivel = prioridad - (t - entrada en la cola) // envejecimiento mientras espera; en CPU conserva el nivel del
+    despacho. Solo expropia un nivel estrictamente mejor y el expropiado vuelve a la cola con su prioridad base."""
+    pendientes = _por_llegada(procesos)
+    restante = [cpu for cpu, _, _ in procesos]
+    desde = [llegada for _, llegada, _ in procesos]
+    orden, listos, insertados = {}, [], 0
+    finalizacion, ticks, t, actual, nivel_actual = [None] * len(procesos), {}, 0, None, None
+    nivel = lambda i: procesos[i][2] - (t - desde[i]) // envejecimiento
+    while pendientes or listos or actual is not None:
+        while pendientes and procesos[pendientes[0]][1] <= t:
+            i = pendientes.popleft()
+            listos.append(i)
+            orden[i], insertados = insertados, insertados + 1
+        if listos:
+            mejor = min(listos, key=lambda i: (nivel(i), desde[i], orden[i]))
+            if actual is None or nivel(mejor) < nivel_actual:
+                listos.remove(mejor)
+                if actual is not None:
+                    desde[actual] = t
+                    listos.append(actual)
+                    orden[actual], insertados = insertados, insertados + 1
+                actual, nivel_actual = mejor, nivel(mejor)
+        if actual is None:
+            _inactivo(ticks, t, procesos[pendientes[0]][1])
+            t = procesos[pendientes[0]][1]
+            continue
+        ticks[t] = actual + 1
+        restante[actual] -= 1
+        t += 1
+        if restante[actual] == 0:
+            finalizacion[actual] = t
+            actual = None
+    return finalizacion, ticks
+
+def expandir(linea):
+    """{instante: pid} de una LineaTiempo del simulador (0 = inactivo), para comparar con las referencias."""
+    ticks = {}
+    for inicio, fin, pid in linea:
+        for t in range(inicio, fin):
+            ticks[t] = pid
+    return ticks
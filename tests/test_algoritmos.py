@@ -0,0 +1,152 @@
+"""Motores del simulador frente a los planificadores de referencia de tests/referencia.py."""
+import random
+
+import pytest
+
+import referencia
+from simulador import Simulador, ALGORITMOS, MODOS_COLAS
+from linea_tiempo import INACTIVO, CAMBIO
+from politicas import nombres_politicas, PrioridadEnvejecimiento
+
+def cargas(semillas, maximo=30):
+    for semilla in range(semillas):
+        rnd = random.Random(semilla)
+        yield semilla, rnd, [(rnd.randint(1, 12), rnd.choice([0, rnd.randint(0, 80)]), rnd.randint(0, 4))
+                             for _ in range(rnd.randint(1, maximo))]
+
+def simulador_con(procesos, **opciones):
+    simulador = Simulador(**opciones)
+    for k, (cpu, llegada, prioridad) in enumerate(procesos):
+        simulador.agregar_proceso(f"P{k}", cpu, llegada, prioridad)
+    return simulador
+
+def comprobar(simulador, esperado):
+    finalizacion, ticks = esperado
+    assert list(simulador.tabla.finalizacion) == finalizacion
+    assert referencia.expandir(simulador.historial_ejecucion_visual) == ticks
+    # El historial está en orden de finalización y las métricas salen de la misma tabla
+    fines = [simulador.tabla.finalizacion[i] for i in simulador.historial_ejecucion]
+    assert fines == sorted(fines) and len(fines) == len(finalizacion)
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS + ("MLFQ", "HRRN"))
+def test_motores_igual_que_referencia(algoritmo):
+    for semilla, rnd, procesos in cargas(150):
+        quantum = rnd.randint(1, 5)
+        simulador = simulador_con(procesos)
+        simulador.ejecutar(algoritmo, quantum)
+        esperado = {
+            "FCFS": lambda: referencia.fcfs(procesos),
+            "SJF": lambda: referencia.sjf(procesos),
+            "SRTF": lambda: referencia.srtf(procesos),
+            "Round Robin": lambda: referencia.round_robin(procesos, quantum),
+            "MLFQ": lambda: referencia.mlfq(procesos, quantum),
+            "HRRN": lambda: referencia.hrrn(procesos),
+        }[algoritmo]()
+        comprobar(simulador, esperado)
+
+@pytest.mark.parametrize("envejecimiento", [1, 3, 7, 10])
+def test_prioridad_con_envejecimiento_igual_que_referencia(envejecimiento):
+    for semilla, rnd, procesos in cargas(150):
+        # Prioridades también negativas (nice) y a veces muy separadas, para que el envejecimiento decida
+        procesos = [(cpu, llegada, rnd.choice([prioridad - 2, prioridad * 5])) for cpu, llegada, prioridad in procesos]
+        simulador = simulador_con(procesos)
+        PrioridadEnvejecimiento(envejecimiento).ejecutar(simulador, None)
+        comprobar(simulador, referencia.prioridad(procesos, envejecimiento))
+
+def test_prioridad_uniforme_sin_envejecer_equivale_a_fcfs():
+    for semilla, rnd, procesos in cargas(100):
+        procesos = [(cpu, llegada, 3) for cpu, llegada, _ in procesos]
+        # Ninguna espera llega a un intervalo completo, así que nadie cambia de nivel
+        envejecimiento = sum(cpu for cpu, _, _ in procesos) + 1
+        simulador = simulador_con(procesos)
+        PrioridadEnvejecimiento(envejecimiento).ejecutar(simulador, None)
+        comprobar(simulador, referencia.fcfs(procesos))
+
+def test_prioridad_el_proceso_en_cpu_no_envejece():
+    # El largo de prioridad 10 no acumula niveles en CPU: el de prioridad 0 lo expropia al llegar
+    simulador = simulador_con([(1000, 0, 10), (5, 500, 0)])
+    simulador.ejecutar("Prioridad")
+    assert list(simulador.historial_ejecucion_visual) == [(0, 500, 1), (500, 505, 2), (505, 1005, 1)]
+
+def test_metricas_promedio():
+    for _, rnd, procesos in cargas(30):
+        simulador = simulador_con(procesos)
+        simulador.ejecutar("SRTF")
+        finalizacion, _ = referencia.srtf(procesos)
+        retornos = [fin - llegada for fin, (_, llegada, _) in zip(finalizacion, procesos)]
+        esperas = [retorno - cpu for retorno, (cpu, _, _) in zip(retornos, procesos)]
+        retorno, espera, _ = simulador.calcular_metricas()
+        assert retorno == pytest.approx(sum(retornos) / len(procesos))
+        assert espera == pytest.approx(sum(esperas) / len(procesos))
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+def test_multinucleo_con_un_nucleo_equivale_al_motor_de_un_nucleo(algoritmo):
+    for semilla, rnd, procesos in cargas(60):
+        quantum = rnd.randint(1, 5)
+        uno, varios = simulador_con(procesos), simulador_con(procesos)
+        uno.ejecutar(algoritmo, quantum)
+        for colas in MODOS_COLAS:
+            varios.ejecutar_multinucleo(algoritmo, quantum, 1, colas)
+            assert list(varios.historial_ejecucion_visual) == list(uno.historial_ejecucion_visual)
+            assert list(varios.tabla.finalizacion) == list(uno.tabla.finalizacion)
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+def test_multinucleo_invariantes(algoritmo):
+    for semilla, rnd, procesos in cargas(40):
+        simulador = simulador_con(procesos)
+        for nucleos in (2, 3):
+            for colas in MODOS_COLAS:
+                costos = (rnd.randint(0, 2), rnd.randint(0, 1), rnd.randint(0, 2))
+                simulador.ejecutar(algoritmo, rnd.randint(1, 5), nucleos, colas, costos)
+                tabla = simulador.tabla
+                ejecutado, tramos = [0] * len(tabla), []
+                for linea in simulador.lineas_nucleos:
+                    anterior = 0
+                    for inicio, fin, pid in linea:
+                        assert inicio == anterior and fin > inicio # Tramos contiguos
+                        anterior = fin
+                        if pid > INACTIVO:
+                            assert tabla.llegadas[pid - 1] <= inicio and fin <= tabla.finalizacion[pid - 1]
+                            ejecutado[pid - 1] += fin - inicio
+                            tramos.append((pid, inicio, fin))
+                assert ejecutado == list(tabla.cpu)
+                # Un proceso no se ejecuta en dos núcleos a la vez
+                tramos.sort()
+                for (pid, _, fin), (otro, inicio, _) in zip(tramos, tramos[1:]):
+                    assert pid != otro or fin <= inicio
+                assert 0 < simulador.metricas_sistema().utilizacion <= 1
+
+def test_costos_de_cambio_calculados_a_mano():
+    # Round Robin con quantum 2 en dos núcleos: cambio 1, despacho 1, migración 3
+    simulador = simulador_con([(3, 0, 0), (2, 0, 0), (2, 1, 0)])
+    simulador.ejecutar("Round Robin", 2, 2, "global", (1, 1, 3))
+    # En t=3 P1 agota su rodaja en el núcleo 0 y P2 termina: P3 entra en el 0 (despacho + cambio) y P1 migra al
+    # 1 (despacho + cambio + migración), donde no avanza hasta t=8
+    assert [list(linea) for linea in simulador.lineas_nucleos] == [
+        [(0, 1, CAMBIO), (1, 3, 1), (3, 5, CAMBIO), (5, 7, 3)],
+        [(0, 1, CAMBIO), (1, 3, 2), (3, 8, CAMBIO), (8, 9, 1)],
+    ]
+    assert list(simulador.tabla.finalizacion) == [9, 3, 7]
+    metricas = simulador.metricas_sistema()
+    assert (metricas.cambios, metricas.tiempo_cambios, metricas.migraciones) == (4, 9, 1)
+    assert metricas.utilizacion == pytest.approx(7 / 18)
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+def test_pasos_reproduce_la_ejecucion_por_lotes(algoritmo):
+    import eventos
+    for semilla, rnd, procesos in cargas(60):
+        quantum = rnd.randint(1, 5)
+        simulador = simulador_con(procesos)
+        simulador.ejecutar(algoritmo, quantum)
+        finalizaciones = {evento.pid: evento.tiempo for evento in simulador.pasos(algoritmo, quantum)
+                          if evento.tipo == eventos.FINALIZACION}
+        assert finalizaciones == {i + 1: fin for i, fin in enumerate(simulador.tabla.finalizacion)}
+
+def test_todas_las_politicas_registradas_terminan_todos_los_procesos():
+    for _, rnd, procesos in cargas(20):
+        simulador = simulador_con(procesos)
+        for algoritmo in nombres_politicas():
+            simulador.ejecutar(algoritmo, 3)
+            assert sorted(simulador.historial_ejecucion) == list(range(len(procesos)))
+            assert sum(fin - inicio for inicio, fin, pid in simulador.historial_ejecucion_visual
+                       if pid > INACTIVO) == sum(cpu for cpu, _, _ in procesos)
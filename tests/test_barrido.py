@@ -0,0 +1,47 @@
+import csv
+import io
+
+import pytest
+
+import barrido
+from simulador import ALGORITMOS
+from politicas import nombres_politicas, obtener_politica
+
+@pytest.fixture
+def cargas(tmp_path):
+    rutas = []
+    for k, filas in enumerate(("A,5,0,2\nB,3,1,0\nC,8,2,1\n", "A,2,0,0\nB,9,0,3\nC,4,6,1\nD,1,7,2\n")):
+        ruta = tmp_path / f"carga{k}.csv"
+        ruta.write_text("nombre,cpu,llegada,prioridad\n" + filas, encoding="utf-8")
+        rutas.append(str(ruta))
+    return rutas
+
+def ejecutar(capsys, *argumentos):
+    assert barrido.main(list(argumentos)) == 0
+    return list(csv.DictReader(io.StringIO(capsys.readouterr().out)))
+
+def test_generar_trabajos_sin_quantums_repetidos():
+    assert barrido.generar_trabajos(2, ["FCFS", "Round Robin"], [4, 2, 4], nucleos=(1, 2, 1)) == [
+        (carga, algoritmo, quantum, nucleos, "global", None)
+        for carga in range(2) for nucleos in (1, 2)
+        for algoritmo, quantum in (("FCFS", None), ("Round Robin", 4), ("Round Robin", 2))
+    ]
+
+def test_pool_y_un_trabajador_dan_la_misma_tabla(cargas, capsys):
+    un_trabajador = ejecutar(capsys, *cargas, "-q", "2", "4", "2", "-j", "1")
+    pool = ejecutar(capsys, *cargas, "-q", "2", "4", "2", "-j", "2")
+    assert pool == un_trabajador
+    # Las políticas con quantum, una vez por quantum distinto; el resto, una vez por carga
+    por_carga = sum(2 if obtener_politica(algoritmo).usa_quantum else 1 for algoritmo in nombres_politicas())
+    assert len(pool) == len(cargas) * por_carga
+    assert [fila["carga"] for fila in pool] == [ruta for ruta in cargas for _ in range(por_carga)]
+
+def test_rechaza_politicas_de_un_nucleo_con_costos(cargas, capsys):
+    with pytest.raises(SystemExit):
+        barrido.main([cargas[0], "-a", "HRRN", "--costo-cambio", "1"])
+    salida = capsys.readouterr()
+    assert salida.out == "" and "solo se simula con un núcleo" in salida.err
+    # Con 'todos' se barren solo las que admiten costos, que aparecen en la tabla
+    filas = ejecutar(capsys, cargas[0], "--costo-cambio", "1", "-j", "1")
+    assert [fila["algoritmo"] for fila in filas] == list(ALGORITMOS)
+    assert all(int(fila["tiempo_cambios"]) > 0 for fila in filas)
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from cache import CacheSimulaciones, clave_simulacion
+from simulador import Simulador
+from politicas import nombres_politicas, obtener_politica
+
+def carga(semilla=0, n=60):
+    rnd = random.Random(semilla)
+    return [(f"P{i}", rnd.randint(1, 9), rnd.randint(0, 100), rnd.randint(0, 3)) for i in range(n)]
+
+def resultado(simulador):
+    return (list(simulador.historial_ejecucion), [list(linea) for linea in simulador.lineas_nucleos],
+            list(simulador.tabla.finalizacion), list(simulador.tabla.inicio), simulador.migraciones,
+            simulador.calcular_metricas())
+
+def test_restaurar_de_cache_equivale_a_simular(tmp_path):
+    procesos = carga()
+    cache = CacheSimulaciones(directorio=str(tmp_path))
+    con_cache, sin_cache = Simulador(cache=cache), Simulador()
+    con_cache.agregar_procesos(procesos)
+    sin_cache.agregar_procesos(procesos)
+    combinaciones = [(algoritmo, 3, 1, "global", None) for algoritmo in nombres_politicas()]
+    combinaciones += [("SRTF", None, 2, "por_nucleo", (1, 0, 2)), ("Round Robin", 2, 3, "global", (1, 1, 0))]
+    for _ in range(2):
+        for algoritmo, quantum, nucleos, colas, costos in combinaciones:
+            con_cache.ejecutar(algoritmo, quantum, nucleos, colas, costos)
+            sin_cache.ejecutar(algoritmo, quantum, nucleos, colas, costos)
+            assert resultado(con_cache) == resultado(sin_cache), algoritmo
+    assert cache.aciertos == len(combinaciones)
+
+    # Un simulador nuevo lee las mismas simulaciones del disco
+    otra = CacheSimulaciones(directorio=str(tmp_path))
+    desde_disco = Simulador(cache=otra)
+    desde_disco.agregar_procesos(procesos)
+    desde_disco.ejecutar("SRTF", None, 2, "por_nucleo", (1, 0, 2))
+    sin_cache.ejecutar("SRTF", None, 2, "por_nucleo", (1, 0, 2))
+    assert otra.aciertos == 1 and resultado(desde_disco) == resultado(sin_cache)
+
+def test_clave_depende_de_la_carga_y_de_los_parametros():
+    a, b = Simulador(), Simulador()
+    a.agregar_procesos(carga(0))
+    b.agregar_procesos(carga(1))
+    assert clave_simulacion(a.tabla, "FCFS") != clave_simulacion(b.tabla, "FCFS")
+    assert clave_simulacion(a.tabla, "FCFS", 4) == clave_simulacion(a.tabla, "FCFS", 8)
+    assert clave_simulacion(a.tabla, "Round Robin", 4) != clave_simulacion(a.tabla, "Round Robin", 8)
+    assert clave_simulacion(a.tabla, "SJF", nucleos=2) != clave_simulacion(a.tabla, "SJF", nucleos=2, colas="por_nucleo")
+
+@pytest.mark.parametrize("algoritmo, parametro, valor", [("MLFQ", "niveles", 1), ("Prioridad", "envejecimiento", 1)])
+def test_clave_depende_de_los_parametros_de_la_politica(algoritmo, parametro, valor, monkeypatch):
+    simulador = Simulador(cache=CacheSimulaciones())
+    simulador.agregar_procesos(carga(2))
+    antes = clave_simulacion(simulador.tabla, algoritmo, 2)
+    simulador.ejecutar(algoritmo, 2)
+    monkeypatch.setattr(obtener_politica(algoritmo), parametro, valor)
+    assert clave_simulacion(simulador.tabla, algoritmo, 2) != antes
+    simulador.ejecutar(algoritmo, 2)
+    sin_cache = Simulador()
+    sin_cache.agregar_procesos(carga(2))
+    sin_cache.ejecutar(algoritmo, 2)
+    assert simulador.cache.aciertos == 0 and resultado(simulador) == resultado(sin_cache)
+
+def test_lru_descarta_la_entrada_menos_usada():
+    cache = CacheSimulaciones(capacidad=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    cache.obtener("a")
+    cache.guardar("c", 3)
+    assert "a" in cache and "b" not in cache and "c" in cache
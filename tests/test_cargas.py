@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from cargas import leer_carga, leer_columnas, generar_carga, DISTRIBUCIONES
+
+def test_csv_simple_y_general_dan_las_mismas_columnas(tmp_path):
+    simple = tmp_path / "simple.csv"
+    simple.write_text("nombre,cpu,llegada,prioridad\nA,5,0,2\nB,3,1,0\nC,8,2,1\n", encoding="utf-8")
+    # Las comillas obligan a la lectura registro a registro
+    general = tmp_path / "general.csv"
+    general.write_text('llegada,nombre,cpu,prioridad\n0,"A",5,2\n1,B,3,0\n2,C,8,1\n', encoding="utf-8")
+    esperado = (["A", "B", "C"], [5, 3, 8], [0, 1, 2], [2, 0, 1])
+    for ruta in (simple, general):
+        assert tuple(list(columna) for columna in leer_columnas(str(ruta))) == esperado
+    assert list(leer_carga(str(simple))) == [("A", 5, 0), ("B", 3, 1), ("C", 8, 2)]
+
+def test_jsonl_con_alias_y_prioridad_opcional(tmp_path):
+    ruta = tmp_path / "carga.jsonl"
+    ruta.write_text("\n".join(json.dumps(registro) for registro in (
+        {"name": "A", "burst": 4, "arrival": 0}, {"nombre": "B", "cpu": 2, "llegada": 3, "priority": 5})),
+        encoding="utf-8")
+    assert tuple(list(columna) for columna in leer_columnas(str(ruta))) == (["A", "B"], [4, 2], [0, 3], [0, 5])
+
+def test_errores_indican_la_linea(tmp_path):
+    ruta = tmp_path / "mala.csv"
+    ruta.write_text("nombre,cpu,llegada\nA,5,0\nB,x,1\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="Línea 3"):
+        leer_columnas(str(ruta))
+
+@pytest.mark.parametrize("distribucion", DISTRIBUCIONES)
+def test_generador_reproducible(distribucion):
+    assert list(generar_carga(50, distribucion, 7)) == list(generar_carga(50, distribucion, 7))
+
+@pytest.mark.parametrize("distribucion", ["poisson", "rafagas"])
+def test_generador_respeta_la_utilizacion(distribucion):
+    carga = list(generar_carga(50000, distribucion, 0, utilizacion=0.9))
+    # Carga ofrecida: trabajo total entre el instante de la última llegada
+    assert sum(cpu for _, cpu, _ in carga) / carga[-1][2] == pytest.approx(0.9, abs=0.05)
@@ -0,0 +1,84 @@
+import csv
+import io
+
+import pytest
+
+import cli
+import eventos
+from simulador import Simulador, ALGORITMOS
+from politicas import nombres_politicas
+
+@pytest.fixture
+def carga(tmp_path):
+    ruta = tmp_path / "carga.csv"
+    ruta.write_text("nombre,cpu,llegada,prioridad\nA,5,0,2\nB,3,1,0\nC,8,2,1\n", encoding="utf-8")
+    return str(ruta)
+
+def ejecutar(capsys, *argumentos):
+    assert cli.main(list(argumentos)) == 0
+    return list(csv.reader(io.StringIO(capsys.readouterr().out)))
+
+def error(capsys, *argumentos):
+    with pytest.raises(SystemExit):
+        cli.main(list(argumentos))
+    salida = capsys.readouterr()
+    assert salida.out == "" # Nada de resultados a medias antes del error
+    return salida.err
+
+def test_resolver_algoritmos():
+    assert cli.resolver_algoritmos("todos") == list(nombres_politicas())
+    assert cli.resolver_algoritmos("todos", multinucleo=True) == list(ALGORITMOS)
+    assert cli.resolver_algoritmos("rr") == ["Round Robin"]
+    assert cli.resolver_algoritmos("prio") == ["Prioridad"]
+    with pytest.raises(ValueError, match="Algoritmo desconocido"):
+        cli.resolver_algoritmos("LIFO")
+
+def test_metricas_por_proceso_y_promedios(carga, capsys):
+    filas = ejecutar(capsys, carga, "-a", "FCFS")
+    separador = filas.index([])
+    assert filas[0] == list(cli.COLUMNAS_PROCESO) and filas[separador + 1] == list(cli.COLUMNAS_PROMEDIOS)
+    finalizacion = cli.COLUMNAS_PROCESO.index("finalizacion")
+    assert [(fila[2], fila[finalizacion]) for fila in filas[1:separador]] == [("A", "5"), ("B", "8"), ("C", "16")]
+    assert [fila[:2] for fila in filas[separador + 2:]] == [["FCFS", "3"]]
+
+def test_varios_nucleos_o_costos_solo_con_politicas_multinucleo(carga, capsys):
+    for opciones in (("-n", "2"), ("--costo-cambio", "1")):
+        assert "solo se simula con un núcleo" in error(capsys, carga, "-a", "MLFQ", *opciones)
+        # Con 'todos' se limita a las políticas que lo admiten
+        filas = ejecutar(capsys, carga, "--solo-promedios", *opciones)
+        assert [fila[0] for fila in filas[1:]] == list(ALGORITMOS)
+
+def test_solo_promedios_sin_historial(carga, capsys, monkeypatch):
+    creados = []
+    class SimuladorRegistrado(Simulador):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            creados.append(self)
+    monkeypatch.setattr(cli, "Simulador", SimuladorRegistrado)
+
+    filas = ejecutar(capsys, carga, "-a", "SRTF", "--solo-promedios")
+    assert filas[0] == list(cli.COLUMNAS_PROMEDIOS) and len(filas) == 2
+    assert not creados[-1].registrar_historial
+    # La traza binaria necesita el historial
+    ruta_traza = str(carga).replace(".csv", ".simt")
+    ejecutar(capsys, carga, "-a", "SRTF", "--solo-promedios", "--guardar-traza", ruta_traza)
+    assert creados[-1].registrar_historial
+    ejecutar(capsys, carga, "-a", "SRTF")
+    assert creados[-1].registrar_historial
+
+def test_eventos(carga, capsys):
+    for opciones in (("-a", "todos"), ("-a", "RR", "-n", "2"), ("-a", "RR", "--latencia-despacho", "1")):
+        assert "--eventos requiere" in error(capsys, carga, "--eventos", *opciones)
+    for algoritmo in ("MLFQ", "HRRN", "PRIO"):
+        assert "--eventos solo admite" in error(capsys, carga, "--eventos", "-a", algoritmo)
+
+    filas = ejecutar(capsys, carga, "-a", "RR", "-q", "2", "--eventos")
+    assert filas[0] == list(cli.COLUMNAS_EVENTO)
+    simulador = Simulador()
+    simulador.cargar_carga(carga)
+    simulador.ejecutar("Round Robin", 2)
+    assert {int(pid): int(tiempo) for tipo, tiempo, pid, _ in filas[1:] if tipo == eventos.FINALIZACION} \
+        == {i + 1: fin for i, fin in enumerate(simulador.tabla.finalizacion)}
+    # --hasta corta la salida en ese instante
+    assert all(int(fila[1]) <= 6 for fila in ejecutar(capsys, carga, "-a", "RR", "-q", "2", "--eventos",
+                                                      "--hasta", "6")[1:])
@@ -0,0 +1,38 @@
+import random
+
+from colas import ColaFIFO, ColaPrioridad, ColaRazonRespuesta
+
+def test_cola_prioridad_desempata_por_orden_de_insercion():
+    cola = ColaPrioridad(clave=lambda proceso: proceso % 3)
+    for proceso in (5, 3, 8, 6, 2, 0):
+        cola.agregar(proceso)
+    assert cola.en_orden_insercion() == [5, 3, 8, 6, 2, 0]
+    assert [cola.extraer() for _ in range(len(cola))] == [3, 6, 0, 5, 8, 2]
+
+def test_cola_fifo():
+    cola = ColaFIFO([1, 2])
+    cola.agregar(3)
+    assert cola.extraer() == 1 and cola.en_orden_insercion() == [2, 3]
+
+def test_cola_razon_respuesta_igual_que_busqueda_exhaustiva():
+    for semilla in range(400):
+        rnd = random.Random(semilla)
+        n = rnd.randint(1, 120)
+        llegadas = sorted(rnd.randint(0, 100) for _ in range(n))
+        cpu = [rnd.randint(1, rnd.choice([2, 5, 20, 1000])) for _ in range(n)]
+        cola = ColaRazonRespuesta(llegadas, cpu)
+        en_cola, siguiente, tiempo = [], 0, 0
+        while siguiente < n or en_cola:
+            tiempo += rnd.choice([0, 1, 3, 10])
+            while siguiente < n and llegadas[siguiente] <= tiempo and rnd.random() < 0.8:
+                cola.agregar(siguiente, tiempo)
+                en_cola.append(siguiente)
+                siguiente += 1
+            assert len(cola) == len(en_cola) and sorted(cola) == sorted(en_cola)
+            if en_cola and rnd.random() < 0.5:
+                mejor = en_cola[0]
+                for i in en_cola[1:]:
+                    if (tiempo - llegadas[i]) * cpu[mejor] > (tiempo - llegadas[mejor]) * cpu[i]:
+                        mejor = i
+                assert cola.extraer(tiempo) == mejor, semilla
+                en_cola.remove(mejor)
@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from instrumentacion import Instrumentacion
+from linea_tiempo import LineaTiempo, INACTIVO, CAMBIO
+from simulador import Simulador
+from politicas import nombres_politicas
+
+@pytest.mark.parametrize("algoritmo", nombres_politicas())
+def test_contadores_de_cola_en_todas_las_politicas(algoritmo):
+    rnd = random.Random(4)
+    instrumentacion = Instrumentacion()
+    simulador = Simulador(instrumentacion=instrumentacion)
+    simulador.agregar_procesos((f"P{i}", rnd.randint(1, 9), rnd.randint(0, 300), rnd.randint(0, 3)) for i in range(200))
+    simulador.ejecutar(algoritmo, 3)
+    contadores = instrumentacion.ejecuciones[-1]
+    # Cada proceso entra al menos una vez en la cola y cada despacho es una extracción
+    assert contadores["encolados"] >= 200 and contadores["decisiones"] >= 200
+    assert contadores["encolados"] == contadores["decisiones"]
+
+def linea(*tramos):
+    resultado = LineaTiempo()
+    for inicio, fin, pid in tramos:
+        resultado.agregar(inicio, fin, pid)
+    return resultado
+
+def test_cambios_de_contexto_tambien_tras_inactividad():
+    instrumentacion = Instrumentacion()
+    instrumentacion.contar_lineas([
+        linea((0, 2, 1), (2, 4, INACTIVO), (4, 5, 2), (5, 6, CAMBIO), (6, 7, 3), (7, 9, INACTIVO), (9, 10, 3)),
+        linea((0, 3, INACTIVO), (3, 4, 4)),
+    ])
+    assert instrumentacion.contadores["cambios_contexto"] == 2 # 1 -> 2 y 2 -> 3; 3 tras inactividad no cambia
+    assert instrumentacion.contadores["intervalos_inactivos"] == 3
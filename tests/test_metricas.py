@@ -0,0 +1,43 @@
+import random
+import statistics
+
+import pytest
+
+from metricas import EstadisticaEnLinea, AcumuladorMetricas
+
+def test_media_y_desviacion_exactas():
+    rnd = random.Random(1)
+    valores = [rnd.randint(0, 1000) for _ in range(500)]
+    estadistica = EstadisticaEnLinea()
+    for valor in valores:
+        estadistica.agregar(valor)
+    assert estadistica.promedio() == sum(valores) / len(valores)
+    assert estadistica.desviacion() == pytest.approx(statistics.pstdev(valores))
+    assert (estadistica.minimo, estadistica.maximo) == (min(valores), max(valores))
+
+def test_copia_independiente():
+    acumulador = AcumuladorMetricas()
+    acumulador.registrar(10, 4, 0)
+    copia = acumulador.copia()
+    acumulador.registrar(20, 5, 3)
+    assert len(copia) == 1 and len(acumulador) == 2
+    assert copia.promedios() == (10, 6, 0.4)
+
+def test_percentiles_exactos_con_pocos_valores():
+    estadistica = EstadisticaEnLinea()
+    for valor in (0, 4, 6, 13):
+        estadistica.agregar(valor)
+    assert [estadistica.percentil(q) for q in (25, 50, 95, 99, 100)] == [0, 4, 13, 13, 13]
+
+def test_percentiles_del_histograma_son_valores_posibles():
+    rnd = random.Random(2)
+    valores = sorted(rnd.randint(0, 5000) for _ in range(20000))
+    estadistica = EstadisticaEnLinea()
+    for valor in valores:
+        estadistica.agregar(valor)
+    for q in (1, 50, 95, 99, 100):
+        exacto = valores[max(1, -(-q * len(valores) // 100)) - 1]
+        aproximado = estadistica.percentil(q)
+        assert isinstance(aproximado, int)
+        assert abs(aproximado - exacto) <= max(1, exacto * 0.01)
+    assert estadistica.percentil(100) == max(valores)
@@ -0,0 +1,58 @@
+"""Reanudar desde un punto de control da exactamente lo mismo que simular desde cero."""
+import random
+
+import pytest
+
+import simulador as modulo_simulador
+from simulador import Simulador, ALGORITMOS
+
+def estado(simulador):
+    tabla = simulador.tabla
+    return (list(simulador.historial_ejecucion), list(simulador.historial_ejecucion_visual), list(tabla.restante),
+            list(tabla.inicio), list(tabla.finalizacion), simulador.acumulador.resumen(),
+            simulador.calcular_metricas(), simulador.metricas_sistema())
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+def test_reanudar_equivale_a_simular_desde_cero(algoritmo, monkeypatch):
+    monkeypatch.setattr(modulo_simulador, "INTERVALO_MINIMO_PUNTOS", 8)
+    reanudadas = 0
+    for semilla in range(8):
+        rnd = random.Random(semilla)
+        procesos, tiempo = [], 0
+        for i in range(400):
+            tiempo += rnd.choice([0, 0, 1, 2, 5, 10])
+            procesos.append((f"P{i}", rnd.randint(1, 12), tiempo))
+        quantum = rnd.randint(1, 6) if algoritmo == "Round Robin" else None
+        simulador = Simulador(puntos_control=True, registrar_historial=rnd.random() < 0.8)
+        simulador.agregar_procesos(procesos)
+        simulador.ejecutar(algoritmo, quantum)
+        for edicion in range(3):
+            fin = max(llegada for _, _, llegada in procesos)
+            nuevos = [(f"N{edicion}_{k}", rnd.randint(1, 12), rnd.randint(int(fin * rnd.random()), fin + 5))
+                      for k in range(rnd.choice([1, 3]))]
+            simulador.agregar_procesos(nuevos)
+            procesos += nuevos
+            reanudadas += simulador._punto_reanudacion(algoritmo, quantum) is not None
+            simulador.ejecutar(algoritmo, quantum)
+            desde_cero = Simulador(registrar_historial=simulador.registrar_historial)
+            desde_cero.agregar_procesos(procesos)
+            desde_cero.ejecutar(algoritmo, quantum)
+            assert estado(simulador) == estado(desde_cero), (semilla, edicion)
+    assert reanudadas > 0
+
+@pytest.mark.parametrize("algoritmo", ALGORITMOS)
+def test_sistema_cargado_reanuda_cerca_de_la_edicion(algoritmo):
+    # Con carga > 1 la cola de listos crece hasta miles de procesos: los puntos no se pueden omitir por ello
+    rnd = random.Random(5)
+    n = 20000
+    simulador = Simulador(puntos_control=True)
+    simulador.agregar_procesos((f"P{i}", rnd.randint(1, 20), rnd.randint(0, n * 8)) for i in range(n))
+    quantum = 4 if algoritmo == "Round Robin" else None
+    simulador.ejecutar(algoritmo, quantum)
+    assert len(simulador._puntos) < 64 # Aclarados exponencialmente
+    edicion = max(simulador.tabla.llegadas)
+    simulador.agregar_proceso("N", 3, edicion)
+    punto = simulador._punto_reanudacion(algoritmo, quantum)
+    assert punto is not None and edicion * 0.9 <= punto.tiempo < edicion
+    if algoritmo != "FCFS": # FCFS no copia la cola: sale del orden de llegada
+        assert len(punto.cola) > modulo_simulador.INTERVALO_MINIMO_PUNTOS
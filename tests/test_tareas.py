@@ -0,0 +1,63 @@
+import random
+
+from simulador import Simulador, SimulacionCancelada, ITERACIONES_PROGRESO
+from tareas import SimulacionEnSegundoPlano
+from politicas import nombres_politicas
+
+def simulador_grande(n=30000, semilla=0):
+    rnd = random.Random(semilla)
+    simulador = Simulador()
+    simulador.agregar_columnas([f"P{i}" for i in range(n)], [rnd.randint(1, 20) for _ in range(n)],
+                               [rnd.randint(0, n * 5) for _ in range(n)])
+    return simulador
+
+def test_progreso_en_el_bucle_de_cada_motor():
+    simulador = simulador_grande()
+    for algoritmo in nombres_politicas():
+        llamadas = []
+        simulador.progreso = lambda terminados, total: llamadas.append(terminados)
+        simulador.ejecutar(algoritmo, 4)
+        # Una al empezar y otra cada ITERACIONES_PROGRESO iteraciones (al menos una por proceso terminado)
+        assert llamadas[0] == 0 and len(llamadas) >= len(simulador.tabla) // ITERACIONES_PROGRESO
+        assert llamadas == sorted(llamadas)
+
+def test_cancelar_sin_que_termine_ningun_proceso():
+    simulador = Simulador()
+    simulador.agregar_proceso("A", 10**12, 0)
+    simulador.agregar_proceso("B", 10**12, 0)
+    llamadas = []
+
+    def progreso(terminados, total):
+        llamadas.append(terminados)
+        if len(llamadas) == 3:
+            raise SimulacionCancelada()
+    simulador.progreso = progreso
+    try:
+        simulador.ejecutar("Round Robin", 1)
+    except SimulacionCancelada:
+        pass
+    assert llamadas == [0, 0, 0]
+    assert len(simulador.historial_ejecucion_visual) < 2 * ITERACIONES_PROGRESO
+
+def test_tarea_copia_los_tramos_y_descarta_al_cancelar():
+    simulador = simulador_grande()
+    tarea = SimulacionEnSegundoPlano(simulador, "Round Robin", 3).iniciar()
+    tarea.esperar()
+    assert not tarea.cancelada and tarea.error is None and tarea.terminados == len(simulador.tabla)
+    # Los bloques copiados, fusionando el tramo repetido, son un prefijo de la línea final
+    tramos = []
+    for nucleo, inicios, fines, pids in tarea.tramos_nuevos():
+        assert nucleo == 0
+        bloque = list(zip(inicios, fines, pids))
+        if tramos and bloque[0][0] == tramos[-1][0]:
+            tramos.pop()
+        tramos.extend(bloque)
+    linea = list(simulador.historial_ejecucion_visual)
+    assert len(tramos) > 1 and tramos[:-1] == linea[:len(tramos) - 1]
+
+    tarea = SimulacionEnSegundoPlano(simulador, "SRTF")
+    tarea.cancelar()
+    tarea.iniciar().esperar()
+    assert tarea.cancelada
+    tarea.descartar()
+    assert len(simulador.historial_ejecucion) == 0 and len(simulador.historial_ejecucion_visual) == 0
@@ -0,0 +1,33 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from simulador import Simulador
+from trazas import guardar_traza, Traza
+
+def test_traza_binaria_ida_y_vuelta(tmp_path):
+    rnd = random.Random(3)
+    simulador = Simulador()
+    simulador.agregar_procesos([(f"Proceso ñ{i}", rnd.randint(1, 9), rnd.randint(0, 200)) for i in range(80)])
+    simulador.ejecutar("Round Robin", 3, 2, "por_nucleo", (1, 0, 1))
+    ruta = str(tmp_path / "rr.simt")
+    guardar_traza(simulador, ruta, "Round Robin", 3)
+
+    traza = Traza(ruta)
+    assert (traza.algoritmo, traza.quantum, len(traza)) == ("Round Robin", 3, 80)
+    assert [list(zip(linea.inicios.tolist(), linea.fines.tolist(), linea.pids.tolist())) for linea in traza.lineas] \
+        == [list(linea) for linea in simulador.lineas_nucleos]
+    assert traza.metricas() == pytest.approx(simulador.calcular_metricas())
+    assert [traza.nombre(pid) for pid in range(1, 81)] == list(simulador.tabla.nombres)
+    assert traza.migraciones == simulador.migraciones
+
+    # Una ventana es el recorte de las líneas completas
+    desde, hasta = 40, 90
+    for ventana, linea in zip(traza.ventana(desde, hasta), simulador.lineas_nucleos):
+        for t in range(desde, min(hasta, linea.fin)):
+            assert ventana.get(t) == linea.get(t)
+
+    ocupacion = traza.ocupacion(10)
+    assert ocupacion.shape == (2, 10) and ((0 <= ocupacion) & (ocupacion <= 1 + 1e-9)).all()
@@ -0,0 +1,102 @@
+"""Importador de trazas de perf/ftrace frente a las ráfagas de un planificador simulado que escribe la traza."""
+import random
+
+import pytest
+
+from trazas_linux import leer_traza_sched, leer_columnas_sched
+from simulador import Simulador
+
+INICIO = 1_000_000_000 # Microsegundos
+
+def nombre(pid):
+    return f"task {pid % 7}" if pid % 3 == 0 else f"kworker/{pid % 4}:{pid}"
+
+def prio(pid):
+    return 110 + pid % 20
+
+def marca(t):
+    return f"{t // 1_000_000}.{t % 1_000_000:06d}"
+
+def generar(semilla, formato, num_eventos=1500, num_cpus=4):
+    """Líneas de la traza y ráfagas esperadas (nombre, cpu, llegada, prioridad) en microsegundos desde el primer evento."""
+    rnd = random.Random(semilla)
+    t = INICIO
+    dormidas, listas, en_cpu = set(range(1000, 1100)), [], [0] * num_cpus
+    rafagas, cerradas, lineas = {}, [], []
+    for _ in range(num_eventos):
+        t += rnd.randint(0, 50)
+        r = rnd.random()
+        if r < 0.3 and dormidas:
+            pid = dormidas.pop()
+            listas.append(pid)
+            rafagas[pid] = [t, 0, None]
+            lineas.append(f"  bash-7 [000] d..3 {marca(t)}: sched_wakeup: comm={nombre(pid)} pid={pid} prio={prio(pid)} target_cpu=000\n"
+                          if formato == "ftrace" else
+                          f"  bash 7 [000] {marca(t)}: sched:sched_wakeup: {nombre(pid)}:{pid} [{prio(pid)}] CPU:000\n")
+        elif r < 0.4:
+            lineas.append(f"  bash-7 [000] d..3 {marca(t)}: sched_stat_runtime: comm=bash pid=7 runtime=5 [ns]\n")
+        else:
+            cpu = rnd.randrange(num_cpus)
+            prev = en_cpu[cpu]
+            estado = "R"
+            if prev:
+                rafagas[prev][1] += t - rafagas[prev][2]
+                if rnd.random() < 0.5:
+                    estado = "S"
+                    dormidas.add(prev)
+                    llegada, usado, _ = rafagas.pop(prev)
+                    cerradas.append((f"{nombre(prev)}-{prev}", max(1, usado), llegada, prio(prev) - 120))
+                else:
+                    estado = "R+"
+                    listas.append(prev)
+            siguiente = listas.pop(rnd.randrange(len(listas))) if listas else 0
+            if siguiente:
+                rafagas[siguiente][2] = t
+            en_cpu[cpu] = siguiente
+            comm_prev = nombre(prev) if prev else "swapper/0"
+            comm_sig = nombre(siguiente) if siguiente else "swapper/0"
+            lineas.append(
+                f"  {comm_prev}-{prev} [{cpu:03d}] d..2 {marca(t)}: sched_switch: prev_comm={comm_prev} prev_pid={prev} "
+                f"prev_prio=120 prev_state={estado} ==> next_comm={comm_sig} next_pid={siguiente} next_prio={prio(siguiente)}\n"
+                if formato == "ftrace" else
+                f"  {comm_prev} {prev} [{cpu:03d}] {marca(t)}: sched:sched_switch: {comm_prev}:{prev} [120] {estado} "
+                f"==> {comm_sig}:{siguiente} [{prio(siguiente)}]\n")
+    while "sched_stat_runtime" in lineas[-1]:
+        lineas.pop()
+    final = int(lineas[-1].split(": sched")[0].split()[-1].replace(".", ""))
+    abiertas = []
+    for pid, (llegada, usado, entrada) in rafagas.items():
+        if entrada is None:
+            continue # Despertó pero nunca llegó a la CPU
+        if pid in en_cpu:
+            usado += final - entrada
+        abiertas.append((f"{nombre(pid)}-{pid}", max(1, usado), llegada, prio(pid) - 120))
+    origen = int(next(linea for linea in lineas if "stat_runtime" not in linea).split(": sched")[0].split()[-1].replace(".", ""))
+    relativo = lambda rafaga: (rafaga[0], rafaga[1], rafaga[2] - origen, rafaga[3])
+    return lineas, [relativo(r) for r in cerradas], [relativo(r) for r in abiertas]
+
+@pytest.mark.parametrize("formato", ["ftrace", "perf"])
+def test_rafagas_igual_que_el_planificador_que_escribio_la_traza(formato, tmp_path):
+    ruta = tmp_path / "sched.txt"
+    for semilla in range(25):
+        lineas, cerradas, abiertas = generar(semilla, formato)
+        ruta.write_text("".join(lineas), encoding="utf-8")
+        leidas = list(leer_traza_sched(str(ruta)))
+        assert leidas[:len(cerradas)] == cerradas
+        assert sorted(leidas[len(cerradas):]) == sorted(abiertas)
+
+def test_resolucion_y_carga_en_el_simulador(tmp_path):
+    ruta = tmp_path / "sched.txt"
+    ruta.write_text(
+        "   swapper     0 [000]   100.000000: sched:sched_switch: swapper/0:0 [120] R ==> Web Content:42 [120]\n"
+        "      bash     7 [001]   100.000010: sched:sched_wakeup: kworker/1:0:99 [100] CPU:001\n"
+        "      bash     7 [001]   100.000020: sched:sched_waking: comm=foo pid=5 prio=120 target_cpu=001\n"
+        "  Web Content 42 [000]   100.000500: sched:sched_switch: Web Content:42 [120] R+ ==> kworker/1:0:99 [100]\n"
+        " kworker/1:0  99 [000]   100.000700: sched:sched_switch: kworker/1:0:99 [100] D ==> Web Content:42 [120]\n"
+        "  Web Content 42 [000]   100.001000: sched:sched_switch: Web Content:42 [120] S ==> swapper/0:0 [120]\n",
+        encoding="utf-8")
+    assert list(leer_traza_sched(str(ruta))) == [("kworker/1:0-99", 200, 10, -20), ("Web Content-42", 800, 0, 0)]
+    assert list(leer_traza_sched(str(ruta), resolucion=10_000)) == [("kworker/1:0-99", 2, 0, -20), ("Web Content-42", 8, 0, 0)]
+    simulador = Simulador()
+    assert len(simulador.cargar_carga(str(ruta), "sched")) == 2
+    assert list(simulador.tabla.prioridades) == list(leer_columnas_sched(str(ruta))[3])
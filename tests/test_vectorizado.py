@@ -0,0 +1,31 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from simulador import Simulador
+from vectorizado import fcfs_vectorizado, sjf_vectorizado
+
+@pytest.mark.parametrize("algoritmo, funcion", [("FCFS", fcfs_vectorizado), ("SJF", sjf_vectorizado)])
+def test_igual_que_el_simulador(algoritmo, funcion):
+    for semilla in range(100):
+        rnd = random.Random(semilla)
+        n = rnd.randint(1, 200)
+        llegadas = [rnd.randint(0, rnd.choice([5, 100, 2000])) for _ in range(n)]
+        cpu = [rnd.randint(1, rnd.choice([3, 30])) for _ in range(n)]
+        simulador = Simulador()
+        simulador.agregar_columnas([f"P{i}" for i in range(n)], cpu, llegadas)
+        simulador.ejecutar(algoritmo)
+        resultado = funcion(llegadas, cpu)
+        assert resultado.orden.tolist() == list(simulador.historial_ejecucion)
+        assert resultado.finalizacion.tolist() == list(simulador.tabla.finalizacion)
+        assert resultado.inicio.tolist() == list(simulador.tabla.inicio)
+
+def test_lotes_2d():
+    llegadas = np.array([[0, 1, 2], [0, 0, 0]])
+    cpu = np.array([[5, 1, 1], [3, 2, 1]])
+    for funcion in (fcfs_vectorizado, sjf_vectorizado):
+        resultado = funcion(llegadas, cpu)
+        for fila in range(2):
+            assert resultado.finalizacion[fila].tolist() == funcion(llegadas[fila], cpu[fila]).finalizacion.tolist()
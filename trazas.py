@@ -0,0 +1,290 @@
+# trazas.py
+"""Trazas binarias por columnas de una simulación, reabiertas con np.memmap sin cargarlas en memoria.
+
+Formato (.simt): la cabecera MAGIA, la versión (uint32) y la longitud (uint64) de unos metadatos JSON,
+seguidos de columnas int64 little-endian a partir del siguiente múltiplo de 8 bytes (los metadatos guardan
+el desplazamiento de cada columna desde ese punto). Las columnas son: tramos de las líneas de
+tiempo de todos los núcleos concatenadas, historial de finalización, columnas de la tabla de procesos y
+los nombres como un bloque UTF-8 con sus desplazamientos.
+
+Ejemplo:
+    python cli.py carga.csv --algoritmo SRTF --guardar-traza srtf.simt --solo-promedios
+    python trazas.py srtf.simt
+    python trazas.py srtf.simt --desde 1000000 --hasta 1002000 --gantt ventana.png
+    python trazas.py srtf.simt --ocupacion 200 --salida ocupacion.csv
+"""
+import argparse
+import csv
+import json
+import struct
+import sys
+from array import array
+
+import numpy as np
+
+from linea_tiempo import LineaTiempo, INACTIVO, CAMBIO
+
+MAGIA = b"SIMT"
+VERSION_TRAZA = 1
+_FORMATO_CABECERA = "<4sIQ"
+COLUMNAS = ("inicios", "fines", "pids", "historial", "llegadas", "cpu", "inicio", "finalizacion", "desplazamientos_nombres")
+# Tramos procesados por bloque al reagregar: la memoria no depende de la longitud de la traza
+TRAMOS_POR_BLOQUE = 1 << 20
+# Una ventana con más tramos que estos no se convierte en LineaTiempo (usar una ventana menor u `ocupacion`)
+MAXIMO_TRAMOS_VENTANA = 2_000_000
+
+def _alinear(desplazamiento):
+    return (desplazamiento + 7) & ~7
+
+def _columna(valores):
+    columna = array('q', valores)
+    if sys.byteorder != "little":
+        columna.byteswap()
+    return columna
+
+def guardar_traza(simulador, ruta, algoritmo=None, quantum=None):
+    """Escribe la última simulación de `simulador` en `ruta` (líneas de tiempo, historial y tabla de procesos)."""
+    tabla = simulador.tabla
+    nombres = [nombre.encode("utf-8") for nombre in tabla.nombres]
+    desplazamientos = array('q', [0])
+    for nombre in nombres:
+        desplazamientos.append(desplazamientos[-1] + len(nombre))
+    lineas = simulador.lineas_nucleos
+    columnas = {
+        "inicios": [linea.inicios for linea in lineas],
+        "fines": [linea.fines for linea in lineas],
+        "pids": [linea.pids for linea in lineas],
+        "historial": [simulador.historial_ejecucion],
+        "llegadas": [tabla.llegadas],
+        "cpu": [tabla.cpu],
+        "inicio": [tabla.inicio],
+        "finalizacion": [tabla.finalizacion],
+        "desplazamientos_nombres": [desplazamientos],
+    }
+    metadatos = {
+        "algoritmo": algoritmo,
+        "quantum": quantum,
+        "procesos": len(tabla),
+        "tramos_nucleo": [len(linea) for linea in lineas],
+        "migraciones": simulador.migraciones,
+        "columnas": {},
+    }
+    desplazamiento = 0
+    for nombre in COLUMNAS:
+        longitud = sum(len(parte) for parte in columnas[nombre])
+        metadatos["columnas"][nombre] = [desplazamiento, longitud]
+        desplazamiento += 8 * longitud
+    metadatos["columnas"]["nombres"] = [desplazamiento, desplazamientos[-1]]
+    texto = json.dumps(metadatos).encode("utf-8")
+
+    with open(ruta, "wb") as archivo:
+        archivo.write(struct.pack(_FORMATO_CABECERA, MAGIA, VERSION_TRAZA, len(texto)))
+        archivo.write(texto)
+        archivo.write(bytes(_alinear(archivo.tell()) - archivo.tell()))
+        for nombre in COLUMNAS:
+            for parte in columnas[nombre]:
+                _columna(parte).tofile(archivo)
+        for nombre in nombres:
+            archivo.write(nombre)
+
+class LineaMapeada:
+    """Línea de tiempo de un núcleo sobre columnas mapeadas en memoria (solo lectura)."""
+
+    __slots__ = ("inicios", "fines", "pids")
+
+    def __init__(self, inicios, fines, pids):
+        self.inicios, self.fines, self.pids = inicios, fines, pids
+
+    def __len__(self):
+        return len(self.pids)
+
+    @property
+    def inicio(self):
+        return int(self.inicios[0]) if len(self) else 0
+
+    @property
+    def fin(self):
+        return int(self.fines[-1]) if len(self) else 0
+
+    def get(self, tiempo, default=None):
+        i = int(np.searchsorted(self.inicios, tiempo, side="right")) - 1
+        if i >= 0 and tiempo < self.fines[i]:
+            return int(self.pids[i])
+        return default
+
+    def ventana(self, desde, hasta):
+        """LineaTiempo con los tramos que se solapan con [desde, hasta), recortados a la ventana."""
+        primero = int(np.searchsorted(self.fines, desde, side="right"))
+        ultimo = int(np.searchsorted(self.inicios, hasta, side="left"))
+        if ultimo - primero > MAXIMO_TRAMOS_VENTANA:
+            raise ValueError(f"La ventana tiene {ultimo - primero} tramos; elija un intervalo menor.")
+        linea = LineaTiempo()
+        if ultimo <= primero:
+            return linea
+        inicios = np.maximum(self.inicios[primero:ultimo], desde)
+        fines = np.minimum(self.fines[primero:ultimo], hasta)
+        for destino, valores in ((linea.inicios, inicios), (linea.fines, fines), (linea.pids, self.pids[primero:ultimo])):
+            destino.frombytes(np.ascontiguousarray(valores, dtype=np.int64).tobytes())
+        return linea
+
+class Traza:
+    """Traza abierta con np.memmap: abrirla solo lee la cabecera; las columnas se paginan bajo demanda."""
+
+    def __init__(self, ruta):
+        with open(ruta, "rb") as archivo:
+            magia, version, longitud = struct.unpack(_FORMATO_CABECERA, archivo.read(struct.calcsize(_FORMATO_CABECERA)))
+            if magia != MAGIA:
+                raise ValueError(f"{ruta} no es una traza de simulación.")
+            if version != VERSION_TRAZA:
+                raise ValueError(f"Versión de traza no soportada: {version}.")
+            self.metadatos = json.loads(archivo.read(longitud))
+            self._inicio_datos = _alinear(archivo.tell())
+        self.ruta = ruta
+        self.algoritmo = self.metadatos["algoritmo"]
+        self.quantum = self.metadatos["quantum"]
+        self.migraciones = self.metadatos["migraciones"]
+        for nombre in COLUMNAS:
+            setattr(self, nombre, self._mapear(nombre, "<i8"))
+        self._nombres = self._mapear("nombres", np.uint8)
+
+        self.lineas = []
+        desde = 0
+        for num_tramos in self.metadatos["tramos_nucleo"]:
+            hasta = desde + num_tramos
+            self.lineas.append(LineaMapeada(self.inicios[desde:hasta], self.fines[desde:hasta], self.pids[desde:hasta]))
+            desde = hasta
+
+    def _mapear(self, nombre, tipo):
+        desplazamiento, longitud = self.metadatos["columnas"][nombre]
+        if longitud == 0:
+            return np.zeros(0, dtype=tipo)
+        return np.memmap(self.ruta, dtype=tipo, mode="r", offset=self._inicio_datos + desplazamiento, shape=(longitud,))
+
+    def __len__(self):
+        return self.metadatos["procesos"]
+
+    def nombre(self, pid):
+        i = pid - 1
+        return bytes(self._nombres[self.desplazamientos_nombres[i]:self.desplazamientos_nombres[i + 1]]).decode("utf-8")
+
+    def instante_final(self):
+        return max((linea.fin for linea in self.lineas), default=0)
+
+    def ventana(self, desde, hasta):
+        """Una LineaTiempo por núcleo con los tramos de [desde, hasta), para los diagramas de Gantt."""
+        return [linea.ventana(desde, hasta) for linea in self.lineas]
+
+    def nombres_por_pid(self, lineas):
+        """Nombres de los procesos que aparecen en las líneas dadas (p. ej. las de una ventana)."""
+        pids = set()
+        for linea in lineas:
+            pids.update(linea.pids_presentes() if isinstance(linea, LineaTiempo) else np.unique(linea.pids).tolist())
+        return {pid: self.nombre(pid) for pid in pids if pid > INACTIVO}
+
+    def metricas(self):
+        """(retorno, espera, índice de servicio) promedio de los procesos terminados, calculados por bloques."""
+        terminados = len(self.historial)
+        if not terminados:
+            return 0, 0, 0.0
+        sumas = np.zeros(3)
+        for desde in range(0, terminados, TRAMOS_POR_BLOQUE):
+            indices = np.asarray(self.historial[desde:desde + TRAMOS_POR_BLOQUE])
+            cpu = self.cpu[indices]
+            retorno = self.finalizacion[indices] - self.llegadas[indices]
+            sumas += (retorno.sum(), np.maximum(retorno - cpu, 0).sum(),
+                      np.divide(cpu, retorno, out=np.zeros(len(cpu)), where=retorno > 0).sum())
+        return tuple(float(suma) for suma in sumas / terminados)
+
+    def tiempos_por_estado(self):
+        """Tiempo de ejecución, inactividad y cambio de contexto sumado en todos los núcleos."""
+        tiempos = {"ejecucion": 0, "inactivo": 0, "cambio": 0}
+        for linea in self.lineas:
+            for desde in range(0, len(linea), TRAMOS_POR_BLOQUE):
+                pids = np.asarray(linea.pids[desde:desde + TRAMOS_POR_BLOQUE])
+                duraciones = linea.fines[desde:desde + TRAMOS_POR_BLOQUE] - linea.inicios[desde:desde + TRAMOS_POR_BLOQUE]
+                tiempos["ejecucion"] += int(duraciones[pids > INACTIVO].sum())
+                tiempos["inactivo"] += int(duraciones[pids == INACTIVO].sum())
+                tiempos["cambio"] += int(duraciones[pids == CAMBIO].sum())
+        return tiempos
+
+    def ocupacion(self, cubetas=100):
+        """Fracción de tiempo ejecutando procesos en `cubetas` intervalos iguales: arreglo (núcleos, cubetas).
+
+        Se recorre cada línea por bloques con la suma acumulada del tiempo ocupado, así que la memoria solo
+        depende de `cubetas` y del tamaño del bloque.
+        """
+        fin = self.instante_final()
+        bordes = np.linspace(0, fin, cubetas + 1)
+        resultado = np.zeros((len(self.lineas), cubetas))
+        if fin == 0:
+            return resultado
+        for n, linea in enumerate(self.lineas):
+            ocupado_hasta = np.zeros(len(bordes)) # Tiempo ocupado acumulado hasta cada borde
+            base = 0.0
+            for desde in range(0, len(linea), TRAMOS_POR_BLOQUE):
+                inicios = np.asarray(linea.inicios[desde:desde + TRAMOS_POR_BLOQUE], dtype=np.float64)
+                fines = np.asarray(linea.fines[desde:desde + TRAMOS_POR_BLOQUE], dtype=np.float64)
+                ocupados = np.asarray(linea.pids[desde:desde + TRAMOS_POR_BLOQUE]) > INACTIVO
+                acumulado = base + np.concatenate(([0.0], np.cumsum(np.where(ocupados, fines - inicios, 0.0))))
+                dentro = (bordes >= inicios[0]) & (bordes <= fines[-1])
+                k = np.maximum(np.searchsorted(inicios, bordes[dentro], side="right") - 1, 0)
+                parcial = np.where(ocupados[k], np.minimum(bordes[dentro], fines[k]) - inicios[k], 0.0)
+                ocupado_hasta[dentro] = acumulado[k] + parcial
+                base = acumulado[-1]
+            ocupado_hasta[bordes > linea.fin] = base
+            resultado[n] = np.diff(ocupado_hasta) / np.diff(bordes)
+        return resultado
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Consulta una traza binaria de simulación sin cargarla en memoria.")
+    parser.add_argument("traza", help="Archivo .simt escrito con cli.py --guardar-traza.")
+    parser.add_argument("--desde", type=int, default=0, help="Inicio de la ventana para --gantt.")
+    parser.add_argument("--hasta", type=int, help="Fin de la ventana para --gantt (por defecto: fin de la traza).")
+    parser.add_argument("--gantt", help="Dibuja la ventana en esta imagen (.png o .svg).")
+    parser.add_argument("--ocupacion", type=int, metavar="CUBETAS",
+                        help="Escribe la utilización de cada núcleo en CUBETAS intervalos iguales (CSV).")
+    parser.add_argument("-o", "--salida", help="Archivo CSV para --ocupacion (por defecto: salida estándar).")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    try:
+        traza = Traza(args.traza)
+    except (OSError, ValueError, struct.error) as e:
+        parser.error(str(e))
+
+    hasta = traza.instante_final() if args.hasta is None else args.hasta
+    if args.gantt:
+        from graficos import guardar_gantt_lineas
+        try:
+            lineas = traza.ventana(args.desde, hasta)
+            guardar_gantt_lineas(lineas, traza.nombres_por_pid(lineas), args.gantt,
+                                 f"Diagrama de Gantt - {traza.algoritmo} [{args.desde}, {hasta})")
+        except ValueError as e:
+            parser.error(str(e))
+    if args.ocupacion:
+        salida = open(args.salida, "w", newline="", encoding="utf-8") if args.salida else sys.stdout
+        try:
+            escritor = csv.writer(salida)
+            ocupacion = traza.ocupacion(args.ocupacion)
+            fin = traza.instante_final()
+            escritor.writerow(("desde", "hasta", *(f"cpu{n}" for n in range(len(traza.lineas)))))
+            for i in range(args.ocupacion):
+                escritor.writerow((round(fin * i / args.ocupacion, 3), round(fin * (i + 1) / args.ocupacion, 3),
+                                   *(f"{ocupacion[n, i]:.4f}" for n in range(len(traza.lineas)))))
+        finally:
+            if salida is not sys.stdout:
+                salida.close()
+    if not args.gantt and not args.ocupacion:
+        retorno, espera, indice_servicio = traza.metricas()
+        tiempos = traza.tiempos_por_estado()
+        print(f"Algoritmo: {traza.algoritmo} - Quantum: {traza.quantum} - Núcleos: {len(traza.lineas)}")
+        print(f"Procesos: {len(traza)} - Terminados: {len(traza.historial)} - Fin: {traza.instante_final()}")
+        print(f"Retorno promedio: {retorno:.4f} - Espera promedio: {espera:.4f} - Índice de servicio: {indice_servicio:.4f}")
+        print(f"Ejecución: {tiempos['ejecucion']} - Inactivo: {tiempos['inactivo']} - Cambios de contexto: {tiempos['cambio']}"
+              f" - Migraciones: {traza.migraciones}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
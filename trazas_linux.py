@@ -0,0 +1,177 @@
+# trazas_linux.py
+"""Importación de trazas reales del planificador de Linux (salida de texto de `perf sched`/`perf script`,
+ftrace o `trace-cmd report`) como cargas de trabajo.
+
+Solo se usan los eventos sched_wakeup, sched_wakeup_new y sched_switch, con los campos clave=valor de ftrace o
+el formato compacto de perf (`comm:pid [prio] estado ==> comm:pid [prio]`). Cada ráfaga de una tarea da un
+proceso: llega al despertar (o al primer despacho si el despertar no está en la traza), acumula la CPU de
+todos sus despachos mientras sigue ejecutable (estado R o R+) y termina cuando la tarea sale de la CPU
+bloqueada o al final de la traza. La prioridad es el nice (prio - 120; las de tiempo real quedan por debajo).
+
+La lectura es una sola pasada en streaming por bloques: la memoria depende del número de tareas vivas, no del
+tamaño del archivo, y las líneas que no son de estos eventos no llegan a analizarse en Python.
+
+Ejemplo:
+    perf sched record -- sleep 10 && perf script > sched.txt
+    python trazas_linux.py sched.txt --resolucion 1000 -o carga.csv
+    python cli.py sched.txt --formato sched --algoritmo todos --quantum 4000 --solo-promedios
+"""
+import argparse
+import csv
+import re
+import sys
+from array import array
+
+# Unidades de tiempo de simulación por segundo de la traza (por defecto, microsegundos)
+RESOLUCION = 1_000_000
+# Prioridad del kernel de una tarea normal con nice 0
+PRIO_NICE_CERO = 120
+# Bytes leídos de una vez: el patrón de eventos recorre cada bloque en C y solo las coincidencias llegan a Python
+TAMANO_BLOQUE = 1 << 22
+
+# Un evento por coincidencia, con los campos clave=valor de ftrace o el formato compacto de perf. Los comm
+# pueden tener espacios y ':' (p. ej. "kworker/1:0"), así que se delimitan por el campo que los sigue.
+_PATRON_EVENTO = re.compile(
+    rb"(\d+\.\d+): (?:sched:)?sched_(?:"
+    rb"switch: (?:prev_comm=.*? prev_pid=(\d+) prev_prio=-?\d+ prev_state=(\S+) ==> "
+    rb"next_comm=(.*?) next_pid=(\d+) next_prio=(-?\d+)"
+    rb"|.*:(\d+) \[-?\d+\] (\S+) ==> (.*):(\d+) \[(-?\d+)\])"
+    rb"|wakeup(?:_new)?: (?:comm=(.*?) pid=(\d+) prio=(-?\d+)|(.*):(\d+) \[(-?\d+)\]))")
+# Último grupo de cada alternativa: indica qué forma del evento coincidió
+_SWITCH_FTRACE, _SWITCH_PERF, _WAKEUP_FTRACE = 6, 11, 14
+
+def _eventos(archivo):
+    """Coincidencias de _PATRON_EVENTO en orden, buscadas sobre bloques de líneas completas."""
+    resto = b""
+    while True:
+        bloque = archivo.read(TAMANO_BLOQUE)
+        if not bloque:
+            break
+        bloque = resto + bloque
+        corte = bloque.rfind(b"\n") + 1
+        resto = bloque[corte:]
+        yield from _PATRON_EVENTO.finditer(bloque, 0, corte)
+    if resto:
+        yield from _PATRON_EVENTO.finditer(resto)
+
+def leer_traza_sched(ruta, resolucion=RESOLUCION):
+    """Lee una traza de texto del planificador en streaming y produce tuplas (nombre, tiempo_cpu,
+    instante_llegada, prioridad), en unidades de 1 / `resolucion` segundos desde el primer evento.
+
+    Los procesos salen a medida que terminan sus ráfagas, no por orden de llegada (la tabla del simulador los
+    ordena al simular). El nombre es "comm-pid", como en ftrace; las ráfagas de menos de una unidad cuentan como
+    una y la tarea ociosa (pid 0) no genera procesos. Las líneas que no son eventos reconocibles se ignoran.
+    Con ruta "-" se lee la entrada estándar.
+    """
+    if resolucion <= 0:
+        raise ValueError("La resolución debe ser positiva.")
+    if ruta == "-":
+        yield from _leer_traza(sys.stdin.buffer, resolucion)
+        return
+    with open(ruta, "rb") as archivo:
+        yield from _leer_traza(archivo, resolucion)
+
+def _leer_traza(archivo, resolucion):
+    # Ráfaga abierta de cada tarea: [llegada, cpu acumulada, entrada en CPU (-1 fuera de ella), prioridad,
+    # despachada]; se borra al cerrarse la ráfaga, así que solo guarda las tareas ejecutables
+    rafagas = {}
+    nombres = {} # pid -> (comm, nombre); se conserva entre ráfagas para no decodificar cada vez
+    origen = None
+    instante = 0
+
+    def nombre(comm, pid):
+        guardado = nombres.get(pid)
+        if guardado is None or guardado[0] != comm:
+            nombres[pid] = (comm, f"{comm.decode('utf-8', 'replace')}-{pid}")
+
+    def cerrar(pid, rafaga):
+        return nombres[pid][1], max(1, rafaga[1]), rafaga[0], rafaga[3] - PRIO_NICE_CERO
+
+    for evento in _eventos(archivo):
+        ahora = round(float(evento[1]) * resolucion)
+        if origen is None:
+            origen = ahora
+        # Los búferes por CPU pueden desordenar ligeramente la salida: el tiempo nunca retrocede
+        instante = max(instante, ahora - origen)
+        forma = evento.lastindex
+        if forma > _SWITCH_PERF:
+            comm, pid, prio = evento.group(12, 13, 14) if forma == _WAKEUP_FTRACE else evento.group(15, 16, 17)
+            pid = int(pid)
+            if pid and pid not in rafagas:
+                nombre(comm, pid)
+                rafagas[pid] = [instante, 0, -1, int(prio), False]
+            continue
+        if forma == _SWITCH_FTRACE:
+            prev_pid, prev_state, next_comm, next_pid, next_prio = evento.group(2, 3, 4, 5, 6)
+        else:
+            prev_pid, prev_state, next_comm, next_pid, next_prio = evento.group(7, 8, 9, 10, 11)
+
+        rafaga = rafagas.get(int(prev_pid))
+        if rafaga is not None:
+            if rafaga[2] >= 0:
+                rafaga[1] += instante - rafaga[2]
+                rafaga[2] = -1
+            if prev_state[0] != 82: # No sigue ejecutable (R o R+): se bloquea o termina y la ráfaga se cierra
+                del rafagas[int(prev_pid)]
+                if rafaga[4]:
+                    yield cerrar(int(prev_pid), rafaga)
+        # Una tarea que ya estaba en CPU al empezar la traza no tiene ráfaga: solo cuenta desde su próximo despacho
+        next_pid = int(next_pid)
+        if next_pid:
+            rafaga = rafagas.get(next_pid)
+            if rafaga is None:
+                nombre(next_comm, next_pid)
+                rafaga = rafagas[next_pid] = [instante, 0, -1, int(next_prio), False]
+            rafaga[2] = instante
+            rafaga[4] = True
+
+    # Ráfagas abiertas al final de la traza, en orden de llegada
+    for pid, rafaga in sorted(rafagas.items(), key=lambda elemento: elemento[1][0]):
+        if rafaga[2] >= 0:
+            rafaga[1] += instante - rafaga[2]
+        if rafaga[4]:
+            yield cerrar(pid, rafaga)
+
+def leer_columnas_sched(ruta, resolucion=RESOLUCION):
+    """Lee una traza del planificador como columnas (nombres, tiempos_cpu, instantes_llegada, prioridades),
+    listas para Simulador.agregar_columnas (ver cargas.leer_columnas)."""
+    nombres, tiempos_cpu, instantes_llegada, prioridades = [], array('q'), array('q'), array('q')
+    for nombre, tiempo_cpu, instante_llegada, prioridad in leer_traza_sched(ruta, resolucion):
+        nombres.append(nombre)
+        tiempos_cpu.append(tiempo_cpu)
+        instantes_llegada.append(instante_llegada)
+        prioridades.append(prioridad)
+    return nombres, tiempos_cpu, instantes_llegada, prioridades
+
+def crear_parser():
+    parser = argparse.ArgumentParser(description="Convierte una traza de texto del planificador de Linux "
+                                                 "(perf sched/perf script, ftrace) en una carga CSV.")
+    parser.add_argument("traza", help="Salida de texto de perf script, ftrace o trace-cmd report ('-' para la entrada estándar).")
+    parser.add_argument("-r", "--resolucion", type=int, default=RESOLUCION,
+                        help="Unidades de tiempo de la carga por segundo (por defecto: 1000000, microsegundos).")
+    parser.add_argument("-o", "--salida", help="Archivo CSV de la carga (por defecto: salida estándar).")
+    return parser
+
+def main(argv=None):
+    parser = crear_parser()
+    args = parser.parse_args(argv)
+    if args.resolucion <= 0:
+        parser.error("La resolución debe ser positiva.")
+
+    salida = open(args.salida, "w", newline="", encoding="utf-8") if args.salida else sys.stdout
+    try:
+        escritor = csv.writer(salida)
+        escritor.writerow(("nombre", "cpu", "llegada", "prioridad"))
+        # Se escribe a medida que se cierran las ráfagas: ni la traza ni la carga se guardan enteras
+        escritor.writerows(leer_traza_sched(args.traza, args.resolucion))
+    except (OSError, ValueError) as e:
+        if isinstance(e, BrokenPipeError):
+            return 0
+        parser.error(str(e))
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# vectorizado.py
+"""Evaluación de FCFS y SJF (no expropiativos) sobre arreglos de llegadas y tiempos de CPU.
+
+FCFS está vectorizado por completo. En SJF el orden de despacho depende de cada decisión anterior y se calcula
+con un montículo en Python (unas 30 veces más lento que FCFS); solo los lotes que se vacían antes de la
+siguiente llegada se ordenan con NumPy, y las métricas se calculan en bloque como en FCFS.
+"""
+import heapq
+from bisect import bisect_right
+from collections import namedtuple
+
+import numpy as np
+
+# Todos los arreglos están indexados por proceso en el orden de entrada, salvo `orden`,
+# que contiene los índices de los procesos en el orden en que reciben la CPU.
+ResultadoVectorizado = namedtuple(
+    "ResultadoVectorizado",
+    ["orden", "inicio", "finalizacion", "retorno", "espera", "indice_servicio"],
+)
+
+def _como_arreglos(llegadas, cpu):
+    llegadas = np.asarray(llegadas, dtype=np.int64)
+    cpu = np.asarray(cpu, dtype=np.int64)
+    if llegadas.shape != cpu.shape:
+        raise ValueError("Los arreglos de llegadas y de CPU deben tener la misma forma.")
+    return llegadas, cpu
+
+def arreglos_de_tabla(tabla):
+    """Vistas NumPy (sin copia) de las columnas de llegada y CPU de una TablaProcesos."""
+    return np.frombuffer(tabla.llegadas, dtype=np.int64), np.frombuffer(tabla.cpu, dtype=np.int64)
+
+def finalizaciones_en_orden(llegadas, cpu):
+    """Instantes de finalización de procesos servidos uno tras otro en el orden dado (eje -1).
+
+    F_i = max(F_{i-1}, T_l_i) + T_CPU_i. Con S_i = suma acumulada de CPU, F_i - S_i es el máximo
+    acumulado de (T_l_j - S_{j-1}), así que la recurrencia se resuelve con cumsum y maximum.accumulate.
+    """
+    acumulado = np.cumsum(cpu, axis=-1)
+    holgura = np.maximum.accumulate(llegadas - (acumulado - cpu), axis=-1)
+    return acumulado + np.maximum(holgura, 0)
+
+def _resultado(orden, llegadas, cpu):
+    llegadas_orden = np.take_along_axis(llegadas, orden, axis=-1)
+    cpu_orden = np.take_along_axis(cpu, orden, axis=-1)
+    finalizacion_orden = finalizaciones_en_orden(llegadas_orden, cpu_orden)
+
+    finalizacion = np.empty_like(finalizacion_orden)
+    np.put_along_axis(finalizacion, orden, finalizacion_orden, axis=-1)
+
+    retorno = finalizacion - llegadas
+    espera = np.maximum(retorno - cpu, 0)
+    indice_servicio = np.divide(cpu, retorno, out=np.zeros(retorno.shape, dtype=np.float64), where=retorno > 0)
+    return ResultadoVectorizado(orden, finalizacion - cpu, finalizacion, retorno, espera, indice_servicio)
+
+def fcfs_vectorizado(llegadas, cpu):
+    """FCFS sobre arreglos; admite lotes de cargas del mismo tamaño como arreglos 2D (una carga por fila)."""
+    llegadas, cpu = _como_arreglos(llegadas, cpu)
+    orden = np.argsort(llegadas, axis=-1, kind="stable")
+    return _resultado(orden, llegadas, cpu)
+
+def orden_sjf(llegadas, cpu):
+    """Orden de despacho de SJF con desempate por (T_CPU, T_l, orden de llegada), como Simulador.ejecutar_sjf.
+
+    No está vectorizado: es un bucle en Python con un montículo, O(n log n). Cuando todos los procesos listos
+    terminan antes de la siguiente llegada, el lote completo se despacha ordenado de una vez (con np.lexsort si
+    ninguno esperaba ya en el montículo).
+    """
+    orden_llegada = np.argsort(llegadas, kind="stable")
+    a_np = llegadas[orden_llegada]
+    c_np = cpu[orden_llegada]
+    a = a_np.tolist()
+    c = c_np.tolist()
+    prefijo_cpu = [0] + np.cumsum(c_np).tolist()
+    total = len(a)
+
+    servicio = []
+    listos = []
+    cpu_listos = 0
+    siguiente = 0
+    tiempo_actual = 0
+    while siguiente < total or listos:
+        if not listos and a[siguiente] > tiempo_actual:
+            tiempo_actual = a[siguiente]
+        limite = bisect_right(a, tiempo_actual, siguiente)
+        fin_lote = tiempo_actual + cpu_listos + prefijo_cpu[limite] - prefijo_cpu[siguiente]
+
+        if limite == total or fin_lote <= a[limite]:
+            # Nadie llega antes de que se vacíe la cola: todo el lote sale ordenado
+            if not listos:
+                if limite - siguiente == 1:
+                    servicio.append(siguiente)
+                else:
+                    lote = np.lexsort((a_np[siguiente:limite], c_np[siguiente:limite])) + siguiente
+                    servicio.extend(lote.tolist())
+            else:
+                listos.extend((c[k], a[k], k) for k in range(siguiente, limite))
+                listos.sort()
+                servicio.extend(k for _, _, k in listos)
+                listos.clear()
+            tiempo_actual = fin_lote
+            cpu_listos = 0
+            siguiente = limite
+            continue
+
+        if limite - siguiente > len(listos):
+            listos.extend((c[k], a[k], k) for k in range(siguiente, limite))
+            heapq.heapify(listos)
+        else:
+            for k in range(siguiente, limite):
+                heapq.heappush(listos, (c[k], a[k], k))
+        cpu_listos += prefijo_cpu[limite] - prefijo_cpu[siguiente]
+        siguiente = limite
+
+        tiempo_cpu, _, k = heapq.heappop(listos)
+        servicio.append(k)
+        tiempo_actual += tiempo_cpu
+        cpu_listos -= tiempo_cpu
+
+    return orden_llegada[np.asarray(servicio, dtype=np.int64)]
+
+def sjf_vectorizado(llegadas, cpu):
+    """SJF sobre arreglos: el orden de despacho sale de orden_sjf (secuencial) y las métricas se calculan en bloque."""
+    llegadas, cpu = _como_arreglos(llegadas, cpu)
+    if llegadas.ndim != 1:
+        return _apilar([sjf_vectorizado(fila_llegadas, fila_cpu) for fila_llegadas, fila_cpu in zip(llegadas, cpu)])
+    return _resultado(orden_sjf(llegadas, cpu), llegadas, cpu)
+
+def _apilar(resultados):
+    return ResultadoVectorizado(*(np.stack(columna) for columna in zip(*resultados)))
+
+def promedios(resultado):
+    """Promedios de retorno, espera e índice de servicio, como Simulador.calcular_metricas (eje -1)."""
+    return (resultado.retorno.mean(axis=-1), resultado.espera.mean(axis=-1), resultado.indice_servicio.mean(axis=-1))
@@ -0,0 +1,208 @@
+# vistas.py
+"""Listas y tablas virtualizadas para Tk: solo se materializan las filas visibles.
+
+Los datos no se copian en el widget; cada vista pide a su fuente el número de filas (`total()`) y el
+contenido de la fila i (`fila(i)`) únicamente para la ventana que se está mostrando. Agregar un elemento
+al final solo inserta esa fila si cae dentro de la ventana.
+"""
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+from array import array
+
+class VistaVirtual:
+    """Base común: ventana visible, barra de desplazamiento, paginación y búsqueda por subcadena.
+
+    Las subclases crean `self.widget` e implementan `_mostrar(filas)`, `_anadir(fila)` y `_altura_fila()`.
+    """
+
+    def __init__(self, master, total, fila, filas_visibles=10, texto=None):
+        self.total = total
+        self.fila = fila
+        self.texto = texto or (lambda i: str(self.fila(i))) # Texto en el que se busca
+        self.filas_visibles = filas_visibles
+        self.primera = 0
+        self.filtro = None # Índices que coinciden con la búsqueda, o None sin búsqueda
+        self.busqueda = ""
+        self.mostradas = 0
+
+        self.frame = ttk.Frame(master)
+        self.frame.grid_columnconfigure(1, weight=1)
+        self.frame.grid_rowconfigure(1, weight=1)
+
+        ttk.Label(self.frame, text="Buscar:").grid(row=0, column=0, sticky="w")
+        self.busqueda_var = tk.StringVar(self.frame)
+        entrada = ttk.Entry(self.frame, textvariable=self.busqueda_var)
+        entrada.grid(row=0, column=1, columnspan=2, sticky="ew", pady=(0, 2))
+        entrada.bind("<Return>", lambda evento: self.buscar(self.busqueda_var.get()))
+
+        self.barra = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.desplazar)
+        self.barra.grid(row=1, column=2, sticky="ns")
+        self.etiqueta = ttk.Label(self.frame, text="0 filas")
+        self.etiqueta.grid(row=2, column=0, columnspan=3, sticky="w")
+
+    def _conectar(self):
+        """Coloca el widget de la subclase y conecta la rueda del ratón, las teclas de página y el tamaño."""
+        self.widget.grid(row=1, column=0, columnspan=2, sticky="nsew")
+        self.widget.bind("<MouseWheel>", lambda evento: self._rueda(-1 if evento.delta > 0 else 1))
+        self.widget.bind("<Button-4>", lambda evento: self._rueda(-1))
+        self.widget.bind("<Button-5>", lambda evento: self._rueda(1))
+        self.widget.bind("<Prior>", lambda evento: self._rueda(-self.filas_visibles))
+        self.widget.bind("<Next>", lambda evento: self._rueda(self.filas_visibles))
+        self.widget.bind("<Configure>", self._redimensionar)
+
+    def grid(self, **opciones):
+        self.frame.grid(**opciones)
+
+    def pack(self, **opciones):
+        self.frame.pack(**opciones)
+
+    # ------------------ DATOS ------------------
+
+    def __len__(self):
+        return len(self.filtro) if self.filtro is not None else self.total()
+
+    def indice(self, posicion):
+        """Índice en la fuente de la fila que ocupa `posicion` en la vista (con búsqueda, entre las coincidencias)."""
+        return self.filtro[posicion] if self.filtro is not None else posicion
+
+    def actualizar(self, reiniciar=False):
+        """Vuelve a pedir la ventana visible tras un cambio general de los datos (p. ej. una nueva simulación)."""
+        if reiniciar:
+            self.primera = 0
+        if self.busqueda:
+            self._filtrar()
+        self._renderizar()
+
+    def agregar(self):
+        """Notifica que se agregó un elemento al final de la fuente: solo se inserta su fila si es visible."""
+        indice = self.total() - 1
+        if self.filtro is not None:
+            if self.busqueda not in self.texto(indice).lower():
+                self._actualizar_barra()
+                return
+            self.filtro.append(indice)
+        posicion = len(self) - 1
+        if self.primera <= posicion < self.primera + self.filas_visibles and self.mostradas == posicion - self.primera:
+            self._anadir(self.fila(indice))
+            self.mostradas += 1
+        self._actualizar_barra()
+
+    def buscar(self, texto):
+        """Filtra las filas cuyo texto contiene `texto` (sin distinguir mayúsculas); vacío quita el filtro."""
+        self.busqueda = texto.strip().lower()
+        self.filtro = None
+        if self.busqueda:
+            self._filtrar()
+        self.primera = 0
+        self._renderizar()
+
+    def _filtrar(self):
+        busqueda, texto = self.busqueda, self.texto
+        self.filtro = array('q', (i for i in range(self.total()) if busqueda in texto(i).lower()))
+
+    # ------------------ DESPLAZAMIENTO ------------------
+
+    def ir_a(self, primera):
+        primera = max(0, min(primera, len(self) - self.filas_visibles))
+        if primera != self.primera:
+            self.primera = primera
+            self._renderizar()
+
+    def desplazar(self, accion, cantidad, unidad=None):
+        """Comando de la barra de desplazamiento ('moveto', fracción) o ('scroll', n, 'units'/'pages')."""
+        if accion == "moveto":
+            self.ir_a(int(float(cantidad) * len(self)))
+        elif accion == "scroll":
+            paso = self.filas_visibles if unidad == "pages" else 1
+            self.ir_a(self.primera + int(cantidad) * paso)
+
+    def _rueda(self, filas):
+        self.ir_a(self.primera + filas)
+        return "break"
+
+    def _redimensionar(self, evento=None):
+        filas = max(1, self.widget.winfo_height() // max(1, self._altura_fila()))
+        if filas != self.filas_visibles:
+            self.filas_visibles = filas
+            self._renderizar()
+
+    # ------------------ DIBUJO ------------------
+
+    def _renderizar(self):
+        self.primera = max(0, min(self.primera, len(self) - self.filas_visibles))
+        fin = min(len(self), self.primera + self.filas_visibles)
+        filas = [self.fila(self.indice(posicion)) for posicion in range(self.primera, fin)]
+        self._mostrar(filas)
+        self.mostradas = len(filas)
+        self._actualizar_barra()
+
+    def _actualizar_barra(self):
+        total = len(self)
+        if total:
+            self.barra.set(self.primera / total, min(1.0, (self.primera + self.filas_visibles) / total))
+            self.etiqueta.config(text=f"Filas {self.primera + 1}-{self.primera + self.mostradas} de {total}")
+        else:
+            self.barra.set(0.0, 1.0)
+            self.etiqueta.config(text="0 filas")
+
+class ListaVirtual(VistaVirtual):
+    """Listbox virtualizado; `fila(i)` devuelve el texto de la fila i."""
+
+    def __init__(self, master, total, fila, filas_visibles=10, width=50):
+        super().__init__(master, total, fila, filas_visibles)
+        self.widget = tk.Listbox(self.frame, height=filas_visibles, width=width)
+        self._conectar()
+
+    def _mostrar(self, filas):
+        self.widget.delete(0, tk.END)
+        if filas:
+            self.widget.insert(tk.END, *filas)
+
+    def _anadir(self, fila):
+        self.widget.insert(tk.END, fila)
+
+    def _altura_fila(self):
+        return tkfont.Font(font=self.widget.cget("font")).metrics("linespace") + 1
+
+class TablaVirtual(VistaVirtual):
+    """Treeview virtualizado; `fila(i)` devuelve la tupla de valores de la fila i.
+
+    Las filas visibles reutilizan los mismos elementos del Treeview al desplazarse.
+    """
+
+    def __init__(self, master, columnas, total, fila, filas_visibles=6):
+        super().__init__(master, total, fila, filas_visibles,
+                         texto=lambda i: " ".join(str(valor) for valor in self.fila(i)))
+        self.widget = ttk.Treeview(self.frame, columns=columnas, show='headings', height=filas_visibles)
+        self._elementos = []
+        self._conectar()
+
+    def heading(self, *args, **opciones):
+        return self.widget.heading(*args, **opciones)
+
+    def column(self, *args, **opciones):
+        return self.widget.column(*args, **opciones)
+
+    def _mostrar(self, filas):
+        sobrantes = self._elementos[len(filas):]
+        if sobrantes:
+            self.widget.delete(*sobrantes)
+            del self._elementos[len(filas):]
+        for elemento, valores in zip(self._elementos, filas):
+            self.widget.item(elemento, values=valores)
+        for valores in filas[len(self._elementos):]:
+            self._anadir(valores)
+
+    def _anadir(self, fila):
+        self._elementos.append(self.widget.insert('', tk.END, values=fila))
+
+    def _altura_fila(self):
+        return int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+
+    def _redimensionar(self, evento=None):
+        # Se descuenta una fila para la cabecera
+        filas = max(1, self.widget.winfo_height() // max(1, self._altura_fila()) - 1)
+        if filas != self.filas_visibles:
+            self.filas_visibles = filas
+            self._renderizar()